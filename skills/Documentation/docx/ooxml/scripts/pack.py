@@ -3,29 +3,75 @@
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--jobs N]
+                   [--manifest <manifest.json>]
+
+With --manifest, repacking is incremental: the manifest records the hash of
+every source file and the archive they were packed into, and the next run
+copies the compressed bytes of unchanged members straight from that archive,
+so only edited parts are condensed and deflated again.
 """
 
 import argparse
-import shutil
-import subprocess
+import hashlib
+import json
+import os
+import re
+import struct
 import sys
 import tempfile
+import xml.dom.minidom
+import xml.parsers.expat
 import defusedxml.minidom
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Media formats that are already compressed; deflating them again costs time
+# for no size gain, so they are stored as is
+STORED_EXTENSIONS = {
+    ".gif",
+    ".jpeg",
+    ".jpg",
+    ".m4a",
+    ".m4v",
+    ".mov",
+    ".mp3",
+    ".mp4",
+    ".png",
+    ".wdp",
+}
+
+# Bump when condensing or the manifest layout changes, so old manifests are ignored
+PACK_MANIFEST_FORMAT = 1
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes condensing XML parts (default: 1)",
+    )
+    parser.add_argument(
+        "--manifest",
+        help="Repack incrementally, reusing unchanged members of the archive "
+        "recorded in this manifest (created if missing)",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            jobs=max(1, args.jobs),
+            manifest_path=args.manifest,
         )
 
         # Show warning if validation was skipped
@@ -42,53 +88,263 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, jobs=1, manifest_path=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    Files are streamed from input_dir straight into the archive, which is
+    left untouched: XML parts are condensed in memory, in a process pool when
+    jobs > 1, and already-compressed media is stored without deflating it
+    again. [Content_Types].xml is written first.
+
+    With a manifest, members whose source file is unchanged since the packing
+    recorded in it are copied compressed from the previous output_file. The
+    result is byte-for-byte what a full pack would produce.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        jobs: Number of worker processes condensing XML parts (default: 1)
+        manifest_path: Optional path to the incremental pack manifest; a
+            missing, unreadable or outdated manifest makes this a full pack
 
     Returns:
         bool: True if successful, False if validation failed
     """
     input_dir = Path(input_dir)
     output_file = Path(output_file)
+    manifest_path = Path(manifest_path) if manifest_path else None
 
     if not input_dir.is_dir():
         raise ValueError(f"{input_dir} is not a directory")
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    # [Content_Types].xml first, then every other file in walk order
+    files = sorted(
+        (f for f in input_dir.rglob("*") if f.is_file()),
+        key=lambda f: f.relative_to(input_dir).as_posix() != "[Content_Types].xml",
+    )
+
+    # Source files and the members of the previous archive they are unchanged from
+    # Format: part name -> {"signature": [mtime_ns, size], "sha256": hex digest}
+    sources = {}
+    previous_zip = None
+    reused = set()
+    if manifest_path is not None:
+        previous_parts = _read_pack_manifest(manifest_path, output_file)
+        if previous_parts:
+            try:
+                previous_zip = zipfile.ZipFile(output_file)
+            except (OSError, zipfile.BadZipFile):
+                previous_parts = {}
+        for f in files:
+            name = f.relative_to(input_dir).as_posix()
+            sources[name] = _source_entry(f, previous_parts.get(name))
+            if (
+                previous_parts.get(name, {}).get("sha256") == sources[name]["sha256"]
+                and name in previous_zip.NameToInfo
+            ):
+                reused.add(name)
+
+    xml_files = [
+        f
+        for f in files
+        if f.name.endswith((".xml", ".rels"))
+        and f.relative_to(input_dir).as_posix() not in reused
+    ]
+
+    # Create final Office file as zip archive, next to the output so the
+    # previous archive stays readable until the new one replaces it
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_name(f"{output_file.name}.tmp")
+    try:
+        with zipfile.ZipFile(tmp_file, "w", zipfile.ZIP_DEFLATED) as zf:
+            condensed = _condense_parts(xml_files, jobs)
+            for f in files:
+                arcname = f.relative_to(input_dir)
+                if arcname.as_posix() in reused:
+                    _copy_compressed_member(
+                        previous_zip,
+                        previous_zip.getinfo(arcname.as_posix()),
+                        zf,
+                        zipfile.ZipInfo.from_file(f, arcname),
+                    )
+                elif f.name.endswith((".xml", ".rels")):
+                    # Remove pretty-printing whitespace
+                    zinfo = zipfile.ZipInfo.from_file(f, arcname)
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    zf.writestr(zinfo, next(condensed))
+                elif f.suffix.lower() in STORED_EXTENSIONS:
+                    zf.write(f, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zf.write(f, arcname)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)  # Don't leave a partial file behind
+        raise
+    finally:
+        if previous_zip is not None:
+            previous_zip.close()
+    os.replace(tmp_file, output_file)
+
+    if manifest_path is not None:
+        _write_pack_manifest(manifest_path, output_file, sources)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
+def _source_entry(source_file, previous):
+    """Return the manifest entry of a source file.
+
+    The hash is only recomputed when the file's modification time or size
+    differs from its previous entry.
+    """
+    stat = source_file.stat()
+    signature = [stat.st_mtime_ns, stat.st_size]
+    if previous and previous.get("signature") == signature:
+        return {"signature": signature, "sha256": previous.get("sha256")}
+
+    digest = hashlib.sha256()
+    with open(source_file, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return {"signature": signature, "sha256": digest.hexdigest()}
+
+
+def _output_signature(output_file):
+    stat = output_file.stat()
+    return [str(output_file.resolve()), stat.st_mtime_ns, stat.st_size]
+
+
+def _read_pack_manifest(manifest_path, output_file):
+    """Return the source entries of the manifest, or {} if it can't be used.
+
+    A manifest only applies to the exact archive it was written for.
+    """
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        output_signature = _output_signature(output_file)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("format") != PACK_MANIFEST_FORMAT
+        or manifest.get("output") != output_signature
+    ):
+        return {}
+    return manifest.get("parts", {})
+
+
+def _write_pack_manifest(manifest_path, output_file, sources):
+    """Record the source entries and the archive they were packed into.
+
+    Format: {"format", "output": [resolved path, mtime_ns, size],
+    "parts": {part name: {"signature": [mtime_ns, size], "sha256": hex}}}
+    """
+    manifest = {
+        "format": PACK_MANIFEST_FORMAT,
+        "output": _output_signature(output_file),
+        "parts": sources,
+    }
+
+    # Write atomically so an interrupted save never leaves a torn manifest
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(manifest), encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+
+
+def _can_copy_raw(source_zip, target_zip):
+    """Return True if the zipfile internals used by the raw copy are present.
+
+    The raw copy writes ZipFile's private state (fp, start_dir, NameToInfo,
+    _didModify) as CPython's zipfile lays it out; otherwise members are
+    re-deflated.
+    """
+    return (
+        hasattr(zipfile, "structFileHeader")
+        and hasattr(zipfile, "sizeFileHeader")
+        and hasattr(source_zip, "fp")
+        and all(
+            hasattr(target_zip, name)
+            for name in ("fp", "start_dir", "filelist", "NameToInfo", "_didModify")
+        )
+        and not getattr(target_zip, "_writing", False)
+    )
+
+
+def _copy_compressed_member(source_zip, info, target_zip, zinfo):
+    """Append a member of source_zip to target_zip without decompressing it.
+
+    zinfo gives the name, timestamp and mode of the new member; compression,
+    CRC and sizes come from the source member info. zipfile has no public
+    API for this, so the local header and the raw data are written the way
+    ZipFile.writestr does. Where those zipfile internals are missing the
+    member is decompressed and written again with writestr instead.
+    """
+    if not _can_copy_raw(source_zip, target_zip):
+        zinfo.compress_type = info.compress_type
+        target_zip.writestr(zinfo, source_zip.read(info))
+        return
+
+    zinfo.compress_type = info.compress_type
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+
+    # Skip the source's local header: fixed fields, then name and extra field
+    source_zip.fp.seek(info.header_offset)
+    header = struct.unpack(
+        zipfile.structFileHeader, source_zip.fp.read(zipfile.sizeFileHeader)
+    )
+    source_zip.fp.seek(header[-2] + header[-1], os.SEEK_CUR)
+
+    target_zip.fp.seek(target_zip.start_dir)
+    zinfo.header_offset = target_zip.fp.tell()
+    target_zip.fp.write(zinfo.FileHeader())
+    remaining = info.compress_size
+    while remaining:
+        chunk = source_zip.fp.read(min(remaining, 1024 * 1024))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated member {info.filename}")
+        target_zip.fp.write(chunk)
+        remaining -= len(chunk)
+
+    target_zip.start_dir = target_zip.fp.tell()
+    target_zip.filelist.append(zinfo)
+    target_zip.NameToInfo[zinfo.filename] = zinfo
+    target_zip._didModify = True
+
+
+def _condense_parts(xml_files, jobs):
+    """Yield the condensed content of each XML file, in order.
+
+    With jobs > 1 the files are condensed by a process pool while the
+    caller writes earlier results.
+    """
+    if jobs > 1 and len(xml_files) > 1:
+        workers = min(jobs, len(xml_files))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(xml_files) // (workers * 8))
+            yield from executor.map(_condensed_xml, xml_files, chunksize=chunksize)
+    else:
+        yield from map(_condensed_xml, xml_files)
+
+
 def validate_document(doc_path):
     """Validate document by converting to HTML with soffice."""
+    # Imported here, so packing without validation and unpack.py don't load it
+    # (run as a script, or imported as ooxml.scripts.pack)
+    if __package__:
+        from .soffice import OfficeError, OfficeTimeout, convert_document
+    else:
+        from soffice import OfficeError, OfficeTimeout, convert_document
+
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -100,31 +356,18 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to",
-                    filter_name,
-                    "--outdir",
-                    temp_dir,
-                    str(doc_path),
-                ],
-                capture_output=True,
-                timeout=10,
-                text=True,
-            )
-            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
-                error_msg = result.stderr.strip() or "Document validation failed"
-                print(f"Validation error: {error_msg}", file=sys.stderr)
-                return False
+            convert_document(doc_path, temp_dir, filter_name, timeout=10)
             return True
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
-        except subprocess.TimeoutExpired:
+        except OfficeTimeout:
             print("Validation error: Timeout during conversion", file=sys.stderr)
             return False
+        except OfficeError as e:
+            error_msg = str(e) or "Document validation failed"
+            print(f"Validation error: {error_msg}", file=sys.stderr)
+            return False
         except Exception as e:
             print(f"Validation error: {e}", file=sys.stderr)
             return False
@@ -132,8 +375,57 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
+    condensed = _condensed_xml(xml_file)
+    with open(xml_file, "wb") as f:
+        f.write(condensed)
+
+
+def _condensed_xml(xml_file):
+    """Return the content of an XML file with whitespace and comments removed."""
     with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+        return condense_xml_string(f.read())
+
+
+def condense_xml_string(content):
+    """Strip whitespace-only text and comments from an XML document.
+
+    Text and comments inside elements named *:t (w:t, a:t, ...) are kept.
+    The result is byte-for-byte what the minidom implementation produces.
+
+    Args:
+        content: The XML document as a string
+
+    Returns:
+        bytes: The condensed document, UTF-8 encoded
+    """
+    try:
+        return _XMLSerializer(condense=True).serialize(content, "UTF-8")
+    except _MinidomFallback:
+        return _condense_xml_minidom(content)
+
+
+def pretty_xml_string(content):
+    """Pretty-print an XML document with two-space indentation, ASCII encoded.
+
+    The result is byte-for-byte what minidom's toprettyxml produces.
+
+    Args:
+        content: The XML document as a string
+
+    Returns:
+        bytes: The pretty-printed document, with non-ASCII characters as
+            character references
+    """
+    try:
+        return _XMLSerializer(indent="  ", newl="\n").serialize(content, "ascii")
+    except _MinidomFallback:
+        dom = defusedxml.minidom.parseString(content)
+        return dom.toprettyxml(indent="  ", encoding="ascii")
+
+
+def _condense_xml_minidom(content):
+    """Condense a document through a minidom tree (for CDATA and DOCTYPE)."""
+    dom = defusedxml.minidom.parseString(content)
 
     # Process each element to remove whitespace and comments
     for element in dom.getElementsByTagName("*"):
@@ -150,9 +442,196 @@ def condense_xml(xml_file):
             ) or child.nodeType == child.COMMENT_NODE:
                 element.removeChild(child)
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    return dom.toxml(encoding="UTF-8")
+
+
+def _probe_minidom_escapes():
+    """Return the (character, replacement) pairs minidom applies to text and
+    to attribute values, "&" first.
+
+    Probed rather than hard-coded, as the escaping differs between Python
+    versions.
+    """
+    doc = xml.dom.minidom.Document()
+    text_escapes, attribute_escapes = [], []
+    for char in "&<>\"'\r\n\t":
+        element = doc.createElement("e")
+        element.setAttribute("a", char)
+        element.appendChild(doc.createTextNode(char))
+        match = re.fullmatch(r'<e a="(.*)">(.*)</e>', element.toxml(), re.DOTALL)
+        attribute_value, text = match.groups()
+        if text != char:
+            text_escapes.append((char, text))
+        if attribute_value != char:
+            attribute_escapes.append((char, attribute_value))
+    return text_escapes, attribute_escapes
+
+
+_TEXT_ESCAPES, _ATTRIBUTE_ESCAPES = _probe_minidom_escapes()
+
+
+def _escape(data, escapes):
+    for char, replacement in escapes:
+        if char in data:
+            data = data.replace(char, replacement)
+    return data
+
+
+class _MinidomFallback(Exception):
+    """Raised for constructs only the minidom implementation reproduces."""
+
+
+class _XMLSerializer:
+    """Re-serialize an XML document in one pass over expat events, writing
+    exactly what minidom's writexml would for the parsed DOM.
+
+    Parses like defusedxml.minidom (same expat options, adjacent character
+    data merged into one text node unless a comment or PI separates it) but
+    never builds the tree. Documents with a DOCTYPE or CDATA sections raise
+    _MinidomFallback, so DTD handling stays with defusedxml.
+    """
+
+    def __init__(self, indent="", newl="", condense=False):
+        self.indent = indent
+        self.newl = newl
+        self.condense = condense
+
+        self.out = []
+        # Character data not yet written, merged into one text node
+        self.text = []
+        # Namespace declarations of the next element
+        # Format: [(prefix, uri), ...]
+        self.namespaces = []
+        # Qualified names of expat's "uri local prefix" names
+        # Format: expat name -> qualified name
+        self.names = {}
+        # Open elements, outermost first
+        # Format: [qualified name, indent, state, held text]
+        # state: 0 no children yet, 1 a single text child (held back),
+        # 2 other children written
+        self.stack = []
+
+    def serialize(self, content, encoding):
+        """Parse content and return it re-serialized in the given encoding.
+
+        Raises:
+            xml.parsers.expat.ExpatError: If the document is not well-formed
+            _MinidomFallback: If the document has a DOCTYPE or CDATA sections
+        """
+        parser = xml.parsers.expat.ParserCreate(namespace_separator=" ")
+        parser.namespace_prefixes = True
+        parser.buffer_text = True
+        parser.ordered_attributes = True
+        parser.specified_attributes = True
+        parser.StartElementHandler = self._start_element
+        parser.EndElementHandler = self._end_element
+        parser.CharacterDataHandler = self.text.append
+        parser.CommentHandler = self._comment
+        parser.ProcessingInstructionHandler = self._processing_instruction
+        parser.StartNamespaceDeclHandler = self._start_namespace
+        parser.StartDoctypeDeclHandler = self._fallback
+        parser.StartCdataSectionHandler = self._fallback
+
+        self.out.append(f'<?xml version="1.0" encoding="{encoding}"?>{self.newl}')
+        parser.Parse(content, True)
+        return "".join(self.out).encode(encoding, "xmlcharrefreplace")
+
+    def _fallback(self, *args):
+        raise _MinidomFallback()
+
+    def _qualified_name(self, name):
+        try:
+            return self.names[name]
+        except KeyError:
+            parts = name.split(" ")
+            if len(parts) == 3:
+                qualified = f"{parts[2]}:{parts[1]}"
+            elif len(parts) == 2:
+                qualified = parts[1]
+            else:
+                qualified = name
+            self.names[name] = qualified
+            return qualified
+
+    def _open_child(self):
+        """Prepare the current element for a child that is not held back.
+
+        Returns the indentation of the child.
+        """
+        if not self.stack:
+            return ""
+        parent = self.stack[-1]
+        if parent[2] != 2:
+            self.out.append(">" + self.newl)
+            if parent[2] == 1:
+                # The held text turned out not to be the only child
+                self._write_text(parent[1] + self.indent, parent[3])
+            parent[2] = 2
+        return parent[1] + self.indent
+
+    def _write_text(self, indent, data):
+        self.out.append(_escape(indent + data + self.newl, _TEXT_ESCAPES))
+
+    def _flush_text(self):
+        """Turn pending character data into a text node of the open element."""
+        data = "".join(self.text)
+        self.text.clear()
+        parent = self.stack[-1]
+        if self.condense and not data.strip() and not parent[0].endswith(":t"):
+            return
+        if parent[2] == 0:
+            # Held back: a single text child is written inline
+            parent[2] = 1
+            parent[3] = data
+        else:
+            self._write_text(self._open_child(), data)
+
+    def _start_namespace(self, prefix, uri):
+        self.namespaces.append((prefix, uri))
+
+    def _start_element(self, name, attributes):
+        if self.text:
+            self._flush_text()
+        indent = self._open_child()
+        qualified = self._qualified_name(name)
+
+        out = [indent, "<", qualified]
+        for prefix, uri in self.namespaces:
+            out.append(f' xmlns:{prefix}="' if prefix else ' xmlns="')
+            out.append(_escape(uri or "", _ATTRIBUTE_ESCAPES))
+            out.append('"')
+        self.namespaces.clear()
+        for i in range(0, len(attributes), 2):
+            out.append(f' {self._qualified_name(attributes[i])}="')
+            out.append(_escape(attributes[i + 1], _ATTRIBUTE_ESCAPES))
+            out.append('"')
+        self.out.append("".join(out))
+        self.stack.append([qualified, indent, 0, None])
+
+    def _end_element(self, name):
+        if self.text:
+            self._flush_text()
+        qualified, indent, state, held = self.stack.pop()
+        if state == 0:
+            self.out.append("/>" + self.newl)
+        elif state == 1:
+            # A single text child is written inline, without indentation
+            self.out.append(">" + _escape(held, _TEXT_ESCAPES))
+            self.out.append(f"</{qualified}>{self.newl}")
+        else:
+            self.out.append(f"{indent}</{qualified}>{self.newl}")
+
+    def _comment(self, data):
+        if self.text:
+            self._flush_text()
+        if self.condense and self.stack and not self.stack[-1][0].endswith(":t"):
+            return
+        self.out.append(f"{self._open_child()}<!--{data}-->{self.newl}")
+
+    def _processing_instruction(self, target, data):
+        if self.text:
+            self._flush_text()
+        self.out.append(f"{self._open_child()}<?{target} {data}?>{self.newl}")
 
 
 if __name__ == "__main__":
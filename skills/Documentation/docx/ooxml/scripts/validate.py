@@ -3,64 +3,300 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N] [--streaming]
+                       [--format {text,json}] [--no-cache]
+    python validate.py --batch <manifest.jsonl> [--jobs N] [--streaming] [--no-cache]
+
+<dir> is the unpacked document directory, or a .docx/.pptx/.xlsx file that is
+then validated straight from the archive without unpacking it.
+
+In batch mode each manifest line is a JSON object with "unpacked_dir" and
+"original" paths (relative paths are resolved against the manifest's folder).
+Documents are validated by a pool of --jobs long-lived worker processes that
+keep compiled schemas and original-file baselines warm across documents. One
+JSON result line is written per document, in manifest order, followed by a
+summary line with aggregate throughput.
+
+XSD results are cached by part content under $XDG_CACHE_HOME/ooxml-validation
+(default ~/.cache), so parts shared by many documents are schema-validated once.
+--no-cache disables the cache.
 """
 
 import argparse
+import contextlib
+import io
+import json
 import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+    XsdResultCache,
+)
+
+
+def get_validators(original_file):
+    """Return the validator classes for an original file, or None if unsupported."""
+    match original_file.suffix.lower():
+        case ".docx":
+            return [DOCXSchemaValidator, RedliningValidator]
+        case ".pptx":
+            return [PPTXSchemaValidator]
+        case _:
+            return None
+
+
+def run_validators(
+    validators, unpacked_dir, original_file, verbose, jobs, streaming, use_cache
+):
+    """Run each validator on a document.
+
+    Returns:
+        tuple: (success, [ValidationReport, ...])
+    """
+    success = True
+    reports = []
+    for V in validators:
+        validator = V(
+            unpacked_dir,
+            original_file,
+            verbose=verbose,
+            jobs=jobs,
+            streaming=streaming,
+            xsd_cache=XsdResultCache() if use_cache else None,
+        )
+        if not validator.validate():
+            success = False
+        reports.append(validator.report)
+    return success, reports
+
+
+def validate_batch_entry(entry, verbose, streaming, use_cache):
+    """Validate one batch manifest entry and return its JSON result.
+
+    The human-readable output is captured into the result's "output" field.
+    Problems with the entry itself are reported in an "error" field.
+    """
+    unpacked_dir, original_file = entry
+    result = {"unpacked_dir": str(unpacked_dir), "original": str(original_file)}
+    start = time.perf_counter()
+    output = io.StringIO()
+    try:
+        validators = get_validators(original_file)
+        if validators is None:
+            raise ValueError(
+                f"Validation not supported for file type {original_file.suffix}"
+            )
+        if not (unpacked_dir.is_dir() or zipfile.is_zipfile(unpacked_dir)):
+            raise ValueError(f"{unpacked_dir} is not a directory or an Office document")
+        if not original_file.is_file():
+            raise ValueError(f"{original_file} is not a file")
+
+        with contextlib.redirect_stdout(output):
+            # Documents are already spread over the batch workers, so each
+            # document's per-part checks run in its worker process
+            success, reports = run_validators(
+                validators,
+                unpacked_dir,
+                original_file,
+                verbose,
+                1,
+                streaming,
+                use_cache,
+            )
+        result["passed"] = success
+        result["validators"] = [r.to_dict() for r in reports]
+    except Exception as e:
+        result["passed"] = False
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    result["output"] = output.getvalue()
+    return result
+
+
+def _validate_batch_entry_worker(args):
+    """Pool entry point for validate_batch_entry."""
+    return validate_batch_entry(*args)
+
+
+def read_batch_manifest(manifest_path):
+    """Read (unpacked_dir, original) path pairs from a JSONL batch manifest.
+
+    Blank lines are skipped. Relative paths are resolved against the
+    manifest's folder.
+    """
+    manifest_path = Path(manifest_path)
+    base_dir = manifest_path.parent
+    entries = []
+    with open(manifest_path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                entries.append(
+                    (base_dir / record["unpacked_dir"], base_dir / record["original"])
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                raise SystemExit(
+                    f"Error: {manifest_path}:{line_number}: invalid manifest entry ({e})"
+                )
+    return entries
+
+
+def run_batch(manifest_path, verbose, jobs, streaming, use_cache):
+    """Validate every document of a batch manifest, writing JSON lines to stdout.
+
+    Returns:
+        bool: True if every document passed
+    """
+    entries = read_batch_manifest(manifest_path)
+    tasks = [(entry, verbose, streaming, use_cache) for entry in entries]
+
+    start = time.perf_counter()
+    summary = {"documents": 0, "passed": 0, "failed": 0, "errors": 0, "bytes_parsed": 0}
+    with contextlib.ExitStack() as stack:
+        if jobs > 1 and len(tasks) > 1:
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=min(jobs, len(tasks)))
+            )
+            results = executor.map(_validate_batch_entry_worker, tasks)
+        else:
+            results = map(_validate_batch_entry_worker, tasks)
+
+        for result in results:
+            summary["documents"] += 1
+            summary["passed" if result["passed"] else "failed"] += 1
+            summary["errors"] += "error" in result
+            summary["bytes_parsed"] += sum(
+                v["bytes_parsed"] for v in result.get("validators", [])
+            )
+            print(json.dumps(result), flush=True)
+
+    elapsed = time.perf_counter() - start
+    summary["duration_s"] = round(elapsed, 3)
+    summary["documents_per_s"] = (
+        round(summary["documents"] / elapsed, 3) if elapsed else None
+    )
+    summary["mb_parsed_per_s"] = (
+        round(summary["bytes_parsed"] / elapsed / 1e6, 3) if elapsed else None
+    )
+    print(json.dumps({"summary": summary}), flush=True)
+    return summary["failed"] == 0
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        nargs="?",
+        help="Path to unpacked Office document directory, or to the document file",
     )
     parser.add_argument(
         "--original",
-        required=True,
         help="Path to original file (.docx/.pptx/.xlsx)",
     )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Validate every document listed in a JSONL manifest and write one "
+        "JSON result line per document",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for per-part checks, or for documents "
+        "in batch mode (default: 1)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream large parts instead of keeping parsed trees in memory",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format; json writes a report with per-check timings to "
+        "stdout and the human-readable output to stderr (default: text)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the persistent XSD result cache",
+    )
     args = parser.parse_args()
 
+    if args.batch:
+        if args.unpacked_dir or args.original:
+            parser.error("--batch cannot be combined with <dir> or --original")
+        success = run_batch(
+            args.batch,
+            args.verbose,
+            max(1, args.jobs),
+            args.streaming,
+            not args.no_cache,
+        )
+        sys.exit(0 if success else 1)
+    if not args.unpacked_dir or not args.original:
+        parser.error("<dir> and --original are required unless --batch is given")
+
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
     file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert unpacked_dir.is_dir() or zipfile.is_zipfile(unpacked_dir), (
+        f"Error: {unpacked_dir} is not a directory or an Office document"
+    )
     assert original_file.is_file(), f"Error: {original_file} is not a file"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
 
     # Run validations
-    match file_extension:
-        case ".docx":
-            validators = [DOCXSchemaValidator, RedliningValidator]
-        case ".pptx":
-            validators = [PPTXSchemaValidator]
-        case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
+    validators = get_validators(original_file)
+    if validators is None:
+        print(f"Error: Validation not supported for file type {file_extension}")
+        sys.exit(1)
 
-    # Run validators
-    success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+    # Run validators, keeping stdout for the JSON report in json mode
+    human_output = sys.stderr if args.format == "json" else sys.stdout
+    with contextlib.redirect_stdout(human_output):
+        success, reports = run_validators(
+            validators,
+            unpacked_dir,
+            original_file,
+            args.verbose,
+            args.jobs,
+            args.streaming,
+            not args.no_cache,
+        )
+
+        if success:
+            print("All validations PASSED!")
 
-    if success:
-        print("All validations PASSED!")
+    if args.format == "json":
+        report = {
+            "unpacked_dir": str(unpacked_dir),
+            "original": str(original_file),
+            "passed": success,
+            "validators": [r.to_dict() for r in reports],
+        }
+        json.dump(report, sys.stdout, indent=2)
+        print()
 
     sys.exit(0 if success else 1)
 
@@ -3,13 +3,22 @@ Validation modules for Word document processing.
 """
 
 from .base import BaseSchemaValidator
+from .cache import XsdResultCache
 from .docx import DOCXSchemaValidator
+from .package import PackageGraph, Relationship
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .report import CheckResult, Issue, ValidationReport
 
 __all__ = [
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
+    "PackageGraph",
+    "Relationship",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "CheckResult",
+    "Issue",
+    "ValidationReport",
+    "XsdResultCache",
 ]
@@ -2,27 +2,168 @@
 Validator for Word document XML files against XSD schemas.
 """
 
+import io
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
-from .base import BaseSchemaValidator
+from .base import BaseSchemaValidator, StructureRule
+from .report import Issue, record_issues, timed_check
+
+# Word-specific namespace
+WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# Text that starts or ends with whitespace
+_LEADING_WHITESPACE = re.compile(r"^\s.*")
+_TRAILING_WHITESPACE = re.compile(r".*\s$")
+
+
+def _text_preview(text):
+    """Return a repr of text truncated to 50 characters for error messages."""
+    return repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+
+
+class _DocumentRule(StructureRule):
+    """Structure rule that only runs on document.xml files."""
+
+    @classmethod
+    def applies_to(cls, xml_file):
+        return xml_file.name == "document.xml"
+
+
+class WhitespacePreservationRule(_DocumentRule):
+    """w:t elements with leading or trailing whitespace need xml:space='preserve'."""
+
+    NAME = "whitespace"
+    TAGS = (f"{{{WORD_2006_NAMESPACE}}}t",)
+
+    def end(self, elem):
+        text = elem.text
+        if not text:
+            return
+        # Check if text starts or ends with whitespace
+        if _LEADING_WHITESPACE.match(text) or _TRAILING_WHITESPACE.match(text):
+            # Check if xml:space="preserve" attribute exists
+            xml_space_attr = f"{{{self.validator.XML_NAMESPACE}}}space"
+            if elem.attrib.get(xml_space_attr) != "preserve":
+                self.errors.append(
+                    Issue(
+                        code="whitespace_not_preserved",
+                        message=f"w:t element with whitespace missing xml:space='preserve': {_text_preview(text)}",
+                        part=str(self.relative_path),
+                        line=elem.sourceline,
+                    )
+                )
+
+
+class TrackedChangeNestingRule(_DocumentRule):
+    """Report w:t within w:del, and w:delText within w:ins unless inside a w:del.
+
+    Result: (deletion_errors, insertion_errors)
+    """
+
+    NAME = "tracked_changes"
+    DEL_TAG = f"{{{WORD_2006_NAMESPACE}}}del"
+    INS_TAG = f"{{{WORD_2006_NAMESPACE}}}ins"
+    T_TAG = f"{{{WORD_2006_NAMESPACE}}}t"
+    DEL_TEXT_TAG = f"{{{WORD_2006_NAMESPACE}}}delText"
+    TAGS = (DEL_TAG, INS_TAG, T_TAG, DEL_TEXT_TAG)
+
+    def __init__(self, validator, xml_file):
+        super().__init__(validator, xml_file)
+        self.insertion_errors = []
+        self.del_depth = 0
+        self.ins_depth = 0
+
+    def start(self, elem):
+        if elem.tag == self.DEL_TAG:
+            self.del_depth += 1
+        elif elem.tag == self.INS_TAG:
+            self.ins_depth += 1
+
+    def end(self, elem):
+        tag = elem.tag
+        if tag == self.DEL_TAG:
+            self.del_depth -= 1
+        elif tag == self.INS_TAG:
+            self.ins_depth -= 1
+        elif tag == self.T_TAG:
+            # XSD validation does not catch text inside deletions
+            if self.del_depth and elem.text:
+                self.errors.append(
+                    Issue(
+                        code="text_in_deletion",
+                        message=f"<w:t> found within <w:del>: {_text_preview(elem.text)}",
+                        part=str(self.relative_path),
+                        line=elem.sourceline,
+                    )
+                )
+        elif tag == self.DEL_TEXT_TAG and self.ins_depth and not self.del_depth:
+            # w:delText is only allowed in w:ins if nested within a w:del
+            self.insertion_errors.append(
+                Issue(
+                    code="deleted_text_in_insertion",
+                    message=f"<w:delText> within <w:ins>: {_text_preview(elem.text or '')}",
+                    part=str(self.relative_path),
+                    line=elem.sourceline,
+                )
+            )
+
+    def fail(self, error):
+        super().fail(error)
+        self.insertion_errors.append(self.errors[-1])
+
+    def result(self):
+        return self.errors, self.insertion_errors
+
+
+class ParagraphCountRule(_DocumentRule):
+    """Count w:p elements.
+
+    Result: (count, error) where error is None or the message of the exception
+    raised while parsing
+    """
+
+    NAME = "paragraphs"
+    TAGS = (f"{{{WORD_2006_NAMESPACE}}}p",)
+
+    def __init__(self, validator, xml_file):
+        super().__init__(validator, xml_file)
+        self.count = 0
+        self.error = None
+
+    def start(self, elem):
+        self.count += 1
+
+    def fail(self, error):
+        self.count = 0
+        self.error = str(error)
+
+    def result(self):
+        return self.count, self.error
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
     """Validator for Word document XML files against XSD schemas."""
 
     # Word-specific namespace
-    WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    WORD_2006_NAMESPACE = WORD_2006_NAMESPACE
 
     # Word-specific element to relationship type mappings
     # Start with empty mapping - add specific cases as we discover them
     ELEMENT_RELATIONSHIP_TYPES = {}
 
+    # Word-specific rules, run in the same traversal as the base rules
+    STRUCTURE_RULES = BaseSchemaValidator.STRUCTURE_RULES + (
+        WhitespacePreservationRule,
+        TrackedChangeNestingRule,
+        ParagraphCountRule,
+    )
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
+        self.run_part_checks()
+
         # Test 0: XML well-formedness
         if not self.validate_xml():
             return False
@@ -69,6 +210,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         return all_valid
 
+    @timed_check
     def validate_whitespace_preservation(self):
         """
         Validate that w:t elements with whitespace have xml:space='preserve'.
@@ -76,51 +218,19 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         errors = []
 
         for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            structure = self._part_result("_check_part_structure", xml_file)
+            errors.extend(structure.get(WhitespacePreservationRule.NAME, []))
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             return False
         else:
             if self.verbose:
                 print("PASSED - All whitespace is properly preserved")
             return True
 
+    @timed_check
     def validate_deletions(self):
         """
         Validate that w:t elements are not within w:del elements.
@@ -129,41 +239,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         errors = []
 
         for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            structure = self._part_result("_check_part_structure", xml_file)
+            if TrackedChangeNestingRule.NAME in structure:
+                errors.extend(structure[TrackedChangeNestingRule.NAME][0])
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             return False
         else:
             if self.verbose:
@@ -179,13 +261,12 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-            except Exception as e:
-                print(f"Error counting paragraphs in unpacked document: {e}")
+            structure = self._part_result("_check_part_structure", xml_file)
+            file_count, error = structure[ParagraphCountRule.NAME]
+            if error is not None:
+                print(f"Error counting paragraphs in unpacked document: {error}")
+            else:
+                count = file_count
 
         return count
 
@@ -194,18 +275,24 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
+            # Read document.xml straight from the original package
+            content = self._read_original_part("word/document.xml")
+            if content is None:
+                raise FileNotFoundError("word/document.xml not found in original")
+            self._bytes_parsed += len(content)
+            paragraph_tag = f"{{{self.WORD_2006_NAMESPACE}}}p"
+            if self.streaming:
+                # Count w:p elements, clearing each one once it is counted
+                for _, elem in lxml.etree.iterparse(
+                    io.BytesIO(content), tag=paragraph_tag
+                ):
+                    count += 1
+                    elem.clear(keep_tail=True)
+            else:
+                root = lxml.etree.fromstring(content)
 
                 # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+                paragraphs = root.findall(f".//{paragraph_tag}")
                 count = len(paragraphs)
 
         except Exception as e:
@@ -213,6 +300,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         return count
 
+    @timed_check
     def validate_insertions(self):
         """
         Validate that w:delText elements are not within w:ins elements.
@@ -221,45 +309,20 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         errors = []
 
         for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
-
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            structure = self._part_result("_check_part_structure", xml_file)
+            if TrackedChangeNestingRule.NAME in structure:
+                errors.extend(structure[TrackedChangeNestingRule.NAME][1])
 
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             return False
         else:
             if self.verbose:
                 print("PASSED - No w:delText elements within w:ins elements")
             return True
 
+    @timed_check
     def compare_paragraph_counts(self):
         """Compare paragraph counts between original and new document."""
         original_count = self.count_paragraphs_in_original()
@@ -2,16 +2,121 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
+import difflib
+import re
 import zipfile
 from pathlib import Path
 
+import lxml.etree
+
+from .report import Issue, ValidationReport, record_issues, timed_check
+from .source import open_part_source
+
+# Character diffs of paragraph pairs larger than this (len(a) * len(b)) fall
+# back to word tokens, which bounds the cost of diffing very long paragraphs
+_MAX_CHAR_DIFF_CELLS = 4_000_000
+
+# Word tokens for the word-level fallback: words, whitespace runs, punctuation
+_WORD_TOKEN_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
+
+# Stands in for a removed paragraph break inside a [-...-] marker
+_REMOVED_BREAK = "\u00b6"
+
+
+def _mark(text, opening, closing):
+    """Wrap changed text in diff markers, marking each line separately like git."""
+    return "\n".join(
+        f"{opening}{line}{closing}" if line else "" for line in text.split("\n")
+    )
+
+
+def _mark_removed(text):
+    """Wrap removed text in one marker, showing removed line breaks as a pilcrow.
+
+    Splitting removals per line like _mark would silently drop a removed
+    paragraph break, so merged paragraphs would read as unchanged.
+    """
+    return "[-" + text.replace("\n", _REMOVED_BREAK) + "-]"
+
+
+def _format_token_diff(a_tokens, b_tokens):
+    """Render the diff of two token sequences in git's --word-diff=plain style."""
+    parts = []
+    matcher = difflib.SequenceMatcher(None, a_tokens, b_tokens, autojunk=False)
+    for op, a_start, a_end, b_start, b_end in matcher.get_opcodes():
+        removed = "".join(a_tokens[a_start:a_end])
+        added = "".join(b_tokens[b_start:b_end])
+        if op == "equal":
+            parts.append(removed)
+            continue
+        if removed:
+            parts.append(_mark_removed(removed))
+        if added:
+            parts.append(_mark(added, "{+", "+}"))
+    return "".join(parts)
+
+
+def _diff_changed_text(original, modified):
+    """Diff two changed paragraphs (or blocks of them) character by character.
+
+    Falls back to word tokens when the character diff would be too costly.
+    """
+    if len(original) * len(modified) <= _MAX_CHAR_DIFF_CELLS:
+        return _format_token_diff(list(original), list(modified))
+    return _format_token_diff(
+        _WORD_TOKEN_PATTERN.findall(original), _WORD_TOKEN_PATTERN.findall(modified)
+    )
+
+
+def _paragraph_word_diff(original_text, modified_text):
+    """Diff two texts paragraph by paragraph, like git diff -U0 --word-diff.
+
+    Paragraphs (lines) are aligned first, by hash, so only changed paragraphs
+    are diffed at the character level. Returns one line per changed paragraph,
+    with removals as [-text-] and additions as {+text+}.
+    """
+    original_paragraphs = original_text.split("\n")
+    modified_paragraphs = modified_text.split("\n")
+
+    lines = []
+    matcher = difflib.SequenceMatcher(
+        None, original_paragraphs, modified_paragraphs, autojunk=False
+    )
+    for op, a_start, a_end, b_start, b_end in matcher.get_opcodes():
+        removed = original_paragraphs[a_start:a_end]
+        added = modified_paragraphs[b_start:b_end]
+        if op == "equal":
+            continue
+        if op == "delete":
+            lines.extend(f"[-{paragraph}-]" for paragraph in removed if paragraph)
+        elif op == "insert":
+            lines.extend(f"{{+{paragraph}+}}" for paragraph in added if paragraph)
+        elif len(removed) == len(added):
+            # Paragraphs changed in place: diff each pair on its own
+            lines.extend(map(_diff_changed_text, removed, added))
+        else:
+            # Paragraphs were split or merged: diff the block as a whole
+            lines.extend(
+                _diff_changed_text("\n".join(removed), "\n".join(added)).split("\n")
+            )
+
+    return "\n".join(line for line in lines if line.strip())
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_docx,
+        verbose=False,
+        jobs=1,
+        streaming=False,
+        xsd_cache=None,
+    ):
+        # jobs, streaming and xsd_cache are accepted for parity with the schema
+        # validators; redlining validation only looks at word/document.xml
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
@@ -19,100 +124,115 @@ class RedliningValidator:
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
 
+        # Structured results of the checks run so far
+        self.report = ValidationReport(type(self).__name__)
+        self._current_check = None
+        self._bytes_parsed = 0
+
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
-        # Verify unpacked directory exists and has correct structure
-        modified_file = self.unpacked_dir / "word" / "document.xml"
-        if not modified_file.exists():
-            print(f"FAILED - Modified document.xml not found at {modified_file}")
-            return False
-
-        # First, check if there are any tracked changes by Claude to validate
+        return self.validate_tracked_changes()
+
+    def _fail(self, code, message):
+        """Print a failure message and record it in the report."""
+        print(f"FAILED - {message}")
+        record_issues(
+            self,
+            [Issue(code=code, message=message, part="word/document.xml")],
+            echo=False,
+        )
+        return False
+
+    @timed_check
+    def validate_tracked_changes(self):
+        """Check that removing Claude's tracked changes restores the original text."""
+        # Verify unpacked directory (or archive) exists and has correct structure
+        source = open_part_source(self.unpacked_dir)
+        if "word/document.xml" not in source:
+            modified_file = self.unpacked_dir / "word" / "document.xml"
+            return self._fail(
+                "missing_part", f"Modified document.xml not found at {modified_file}"
+            )
+
+        # Parse the modified document once; the same tree is checked for
+        # Claude's changes and then has them removed
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
-
+            modified_root = source.parse("word/document.xml").getroot()
+            self._bytes_parsed += source.size("word/document.xml")
+        except lxml.etree.XMLSyntaxError as e:
+            modified_root = None
+            parse_error = e
+
+        # Redlining validation is only needed if tracked changes by Claude have been used.
+        if modified_root is not None and not self._has_claude_tracked_changes(
+            modified_root
+        ):
             if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
+                print("PASSED - No tracked changes by Claude found.")
             return True
 
+        # Read the original document.xml straight from the original package
+        try:
+            with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
+                original_content = zip_ref.read("word/document.xml")
+        except KeyError:
+            return self._fail(
+                "missing_part",
+                f"Original document.xml not found in {self.original_docx}",
+            )
+        except Exception as e:
+            return self._fail(
+                "original_unreadable", f"Error unpacking original docx: {e}"
+            )
+
+        if modified_root is None:
+            return self._fail("parse_error", f"Error parsing XML files: {parse_error}")
+        try:
+            original_root = lxml.etree.fromstring(original_content)
+            self._bytes_parsed += len(original_content)
+        except lxml.etree.XMLSyntaxError as e:
+            return self._fail("parse_error", f"Error parsing XML files: {e}")
+
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
+
+        # Extract and compare text content
+        modified_text = self._extract_text_content(modified_root)
+        original_text = self._extract_text_content(original_root)
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            print(error_message)
+            record_issues(
+                self,
+                [
+                    Issue(
+                        code="untracked_change",
+                        message="Document text doesn't match after removing Claude's tracked changes",
+                        part="word/document.xml",
+                    )
+                ],
+                echo=False,
+            )
+            return False
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
+
+    def _has_claude_tracked_changes(self, root):
+        """Return True if root contains a w:ins or w:del authored by Claude."""
+        ins_tag = f"{{{self.namespaces['w']}}}ins"
+        del_tag = f"{{{self.namespaces['w']}}}del"
+        author_attr = f"{{{self.namespaces['w']}}}author"
+        return any(
+            elem.get(author_attr) == "Claude" for elem in root.iter(ins_tag, del_tag)
+        )
+
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        """Generate detailed character-level differences between the two texts."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,129 +247,57 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
+        # Show word diff
+        word_diff = _paragraph_word_diff(original_text, modified_text)
+        if word_diff:
+            error_parts.extend(["Differences:", "============", word_diff])
         else:
-            error_parts.append("Unable to generate word diff (git not available)")
+            error_parts.append("Unable to generate word diff")
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
-
     def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
+        """Remove tracked changes authored by Claude from the XML root.
+
+        Claude's insertions are dropped and Claude's deletions are unwrapped,
+        with their w:delText turned back into w:t. Each change is handled once,
+        in place, so the cost is linear in the size of the tree.
+        """
         ins_tag = f"{{{self.namespaces['w']}}}ins"
         del_tag = f"{{{self.namespaces['w']}}}del"
         author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
         deltext_tag = f"{{{self.namespaces['w']}}}delText"
         t_tag = f"{{{self.namespaces['w']}}}t"
 
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
+        # Snapshot the changes first, as the tree is modified while processing
+        changes = [
+            elem
+            for elem in root.iter(ins_tag, del_tag)
+            if elem.get(author_attr) == "Claude"
+        ]
+
+        # Remove w:ins elements (with anything nested inside them)
+        for elem in changes:
+            if elem.tag == ins_tag and elem.getparent() is not None:
+                elem.getparent().remove(elem)
+
+        # Unwrap content in w:del elements, in document order. An outer
+        # deletion moves nested deletions up, so look the parent up each time.
+        for del_elem in changes:
+            if del_elem.tag != del_tag:
+                continue
+            parent = del_elem.getparent()
+            if parent is None:
+                continue
+
+            # Convert w:delText to w:t before moving
+            for elem in del_elem.iter(deltext_tag):
+                elem.tag = t_tag
+
+            # Move all children of w:del in front of it before removing w:del
+            for child in list(del_elem):
+                del_elem.addprevious(child)
+            parent.remove(del_elem)
 
     def _extract_text_content(self, root):
         """Extract text content from Word XML, preserving paragraph structure.
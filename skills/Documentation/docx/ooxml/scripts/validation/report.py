@@ -0,0 +1,133 @@
+"""
+Structured validation results: issues, per-check timings and bytes parsed.
+"""
+
+import functools
+import time
+from dataclasses import asdict, dataclass, field
+
+
+@dataclass
+class Issue:
+    """A single validation problem.
+
+    str() gives the line printed in the human-readable output. By default it is
+    built from part, line and message; text overrides it for messages that do
+    not follow the "<part>: Line <n>: <message>" layout.
+    """
+
+    code: str
+    message: str
+    part: str | None = None
+    line: int | None = None
+    text: str | None = None
+
+    def __str__(self):
+        if self.text is not None:
+            return self.text
+        location = f"{self.part}: " if self.part is not None else ""
+        if self.line is not None:
+            location += f"Line {self.line}: "
+        return f"  {location}{self.message}"
+
+    def to_dict(self):
+        """Return the issue as a JSON-serializable dict, without the display text."""
+        data = asdict(self)
+        del data["text"]
+        return data
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one check.
+
+    passed is None for phases that do not pass or fail on their own, such as
+    running the per-part checks up front.
+    """
+
+    check: str
+    passed: bool | None
+    duration_ms: float = 0.0
+    bytes_parsed: int = 0
+    issues: list = field(default_factory=list)
+
+    def to_dict(self):
+        return {
+            "check": self.check,
+            "passed": self.passed,
+            "duration_ms": round(self.duration_ms, 3),
+            "bytes_parsed": self.bytes_parsed,
+            "issues": [issue.to_dict() for issue in self.issues],
+        }
+
+
+@dataclass
+class ValidationReport:
+    """All check results of one validator run."""
+
+    validator: str
+    checks: list = field(default_factory=list)
+
+    @property
+    def passed(self):
+        return all(check.passed is not False for check in self.checks)
+
+    def to_dict(self):
+        return {
+            "validator": self.validator,
+            "passed": self.passed,
+            "duration_ms": round(sum(c.duration_ms for c in self.checks), 3),
+            "bytes_parsed": sum(c.bytes_parsed for c in self.checks),
+            "checks": [check.to_dict() for check in self.checks],
+        }
+
+
+def timed_check(method):
+    """Record a check method's outcome, duration and bytes parsed in self.report.
+
+    The check name is the method name without its "validate_" prefix. Issues
+    reported through record_issues while the method runs are attached to it.
+    Calls made from inside another timed check are not recorded separately.
+    The instance must provide report, _bytes_parsed and _current_check.
+    """
+    name = method.__name__.removeprefix("validate_")
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._current_check is not None:
+            return method(self, *args, **kwargs)
+
+        result = CheckResult(check=name, passed=None)
+        self._current_check = result
+        bytes_before = self._bytes_parsed
+        start = time.perf_counter()
+        try:
+            outcome = method(self, *args, **kwargs)
+        finally:
+            result.duration_ms = (time.perf_counter() - start) * 1000
+            result.bytes_parsed = self._bytes_parsed - bytes_before
+            self._current_check = None
+            self.report.checks.append(result)
+        if isinstance(outcome, bool):
+            result.passed = outcome
+        return outcome
+
+    return wrapper
+
+
+def record_issues(validator, issues, echo=True):
+    """Attach issues to the check currently running on validator.
+
+    Args:
+        validator: Validator with a _current_check attribute
+        issues: Issue objects, or plain strings recorded with code "error"
+        echo: If True, also print each issue's human-readable line
+    """
+    for issue in issues:
+        if echo:
+            print(issue)
+        if validator._current_check is None:
+            continue
+        if not isinstance(issue, Issue):
+            issue = Issue(code="error", message=str(issue).strip(), text=str(issue))
+        validator._current_check.issues.append(issue)
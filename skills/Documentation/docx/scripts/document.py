@@ -8,6 +8,7 @@ Usage:
     # Initialize
     doc = Document('workspace/unpacked')
     doc = Document('workspace/unpacked', author="John Doe", initials="JD")
+    doc = Document('workspace/unpacked', backend="lxml")  # For large documents
 
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
@@ -26,6 +27,7 @@ Usage:
     doc.save()
 """
 
+import hashlib
 import html
 import random
 import shutil
@@ -38,7 +40,7 @@ from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import LxmlXMLEditor, XMLEditor
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
@@ -56,6 +58,12 @@ class DocxXMLEditor(XMLEditor):
         dom (defusedxml.minidom.Document): The DOM document for direct manipulation
     """
 
+    _ID_KINDS = {
+        **XMLEditor._ID_KINDS,
+        "change": (("w:ins", "w:del"), "w:id", "", 0),
+        "comment": (("w:comment",), "w:id", "", 0),
+    }
+
     def __init__(
         self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
     ):
@@ -73,45 +81,26 @@ class DocxXMLEditor(XMLEditor):
         self.initials = initials
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Take the next change ID, above those of all w:ins and w:del elements."""
+        return int(self._id_allocator("change").allocate())
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._declare_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._declare_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._declare_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -133,131 +122,118 @@ class DocxXMLEditor(XMLEditor):
 
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
-            parent = elem.parentNode
-            while parent:
-                if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
+            parent = self._parent(elem)
+            while parent is not None:
+                if self._tag(parent) == "w:del":
                     return True
-                parent = parent.parentNode
+                parent = self._parent(parent)
             return False
 
         def add_rsid_to_p(elem):
-            if not elem.hasAttribute("w:rsidR"):
-                elem.setAttribute("w:rsidR", self.rsid)
-            if not elem.hasAttribute("w:rsidRDefault"):
-                elem.setAttribute("w:rsidRDefault", self.rsid)
-            if not elem.hasAttribute("w:rsidP"):
-                elem.setAttribute("w:rsidP", self.rsid)
+            if not self._has_attr(elem, "w:rsidR"):
+                self._set_attr(elem, "w:rsidR", self.rsid)
+            if not self._has_attr(elem, "w:rsidRDefault"):
+                self._set_attr(elem, "w:rsidRDefault", self.rsid)
+            if not self._has_attr(elem, "w:rsidP"):
+                self._set_attr(elem, "w:rsidP", self.rsid)
             # Add w14:paraId and w14:textId if not present
-            if not elem.hasAttribute("w14:paraId"):
+            if not self._has_attr(elem, "w14:paraId"):
                 self._ensure_w14_namespace()
-                elem.setAttribute("w14:paraId", _generate_hex_id())
-            if not elem.hasAttribute("w14:textId"):
+                self._set_attr(elem, "w14:paraId", _generate_hex_id())
+            if not self._has_attr(elem, "w14:textId"):
                 self._ensure_w14_namespace()
-                elem.setAttribute("w14:textId", _generate_hex_id())
+                self._set_attr(elem, "w14:textId", _generate_hex_id())
 
         def add_rsid_to_r(elem):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
             if is_inside_deletion(elem):
-                if not elem.hasAttribute("w:rsidDel"):
-                    elem.setAttribute("w:rsidDel", self.rsid)
+                if not self._has_attr(elem, "w:rsidDel"):
+                    self._set_attr(elem, "w:rsidDel", self.rsid)
             else:
-                if not elem.hasAttribute("w:rsidR"):
-                    elem.setAttribute("w:rsidR", self.rsid)
+                if not self._has_attr(elem, "w:rsidR"):
+                    self._set_attr(elem, "w:rsidR", self.rsid)
 
         def add_tracked_change_attrs(elem):
             # Auto-assign w:id if not present
-            if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
-            if not elem.hasAttribute("w:author"):
-                elem.setAttribute("w:author", self.author)
-            if not elem.hasAttribute("w:date"):
-                elem.setAttribute("w:date", timestamp)
+            if not self._has_attr(elem, "w:id"):
+                self._set_attr(elem, "w:id", str(self._get_next_change_id()))
+            if not self._has_attr(elem, "w:author"):
+                self._set_attr(elem, "w:author", self.author)
+            if not self._has_attr(elem, "w:date"):
+                self._set_attr(elem, "w:date", timestamp)
             # Add w16du:dateUtc for tracked changes (same as w:date since we generate UTC timestamps)
-            if elem.tagName in ("w:ins", "w:del") and not elem.hasAttribute(
-                "w16du:dateUtc"
+            if self._tag(elem) in ("w:ins", "w:del") and not self._has_attr(
+                elem, "w16du:dateUtc"
             ):
                 self._ensure_w16du_namespace()
-                elem.setAttribute("w16du:dateUtc", timestamp)
+                self._set_attr(elem, "w16du:dateUtc", timestamp)
 
         def add_comment_attrs(elem):
-            if not elem.hasAttribute("w:author"):
-                elem.setAttribute("w:author", self.author)
-            if not elem.hasAttribute("w:date"):
-                elem.setAttribute("w:date", timestamp)
-            if not elem.hasAttribute("w:initials"):
-                elem.setAttribute("w:initials", self.initials)
+            if not self._has_attr(elem, "w:author"):
+                self._set_attr(elem, "w:author", self.author)
+            if not self._has_attr(elem, "w:date"):
+                self._set_attr(elem, "w:date", timestamp)
+            if not self._has_attr(elem, "w:initials"):
+                self._set_attr(elem, "w:initials", self.initials)
 
         def add_comment_extensible_date(elem):
             # Add w16cex:dateUtc for comment extensible elements
-            if not elem.hasAttribute("w16cex:dateUtc"):
+            if not self._has_attr(elem, "w16cex:dateUtc"):
                 self._ensure_w16cex_namespace()
-                elem.setAttribute("w16cex:dateUtc", timestamp)
+                self._set_attr(elem, "w16cex:dateUtc", timestamp)
 
         def add_xml_space_to_t(elem):
             # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
-            if (
-                elem.firstChild
-                and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE
-            ):
-                text = elem.firstChild.data
-                if text and (text[0].isspace() or text[-1].isspace()):
-                    if not elem.hasAttribute("xml:space"):
-                        elem.setAttribute("xml:space", "preserve")
+            text = self._leading_text(elem)
+            if text and (text[0].isspace() or text[-1].isspace()):
+                if not self._has_attr(elem, "xml:space"):
+                    self._set_attr(elem, "xml:space", "preserve")
 
         for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
+            if not self._is_element(node):
                 continue
 
             # Handle the node itself
-            if node.tagName == "w:p":
+            tag = self._tag(node)
+            if tag == "w:p":
                 add_rsid_to_p(node)
-            elif node.tagName == "w:r":
+            elif tag == "w:r":
                 add_rsid_to_r(node)
-            elif node.tagName == "w:t":
+            elif tag == "w:t":
                 add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
+            elif tag in ("w:ins", "w:del"):
                 add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
+            elif tag == "w:comment":
                 add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
+            elif tag == "w16cex:commentExtensible":
                 add_comment_extensible_date(node)
 
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
+            # Process descendants (_find_all doesn't return the element itself)
+            for elem in self._find_all(node, "w:p"):
                 add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
+            for elem in self._find_all(node, "w:r"):
                 add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
+            for elem in self._find_all(node, "w:t"):
                 add_xml_space_to_t(elem)
             for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
+                for elem in self._find_all(node, tag):
                     add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
+            for elem in self._find_all(node, "w:comment"):
                 add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
+            for elem in self._find_all(node, "w16cex:commentExtensible"):
                 add_comment_extensible_date(elem)
 
-    def replace_node(self, elem, new_content):
-        """Replace node with automatic attribute injection."""
-        nodes = super().replace_node(elem, new_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+            # Index the nodes again with their new IDs
+            self._index_changed(node)
 
-    def insert_after(self, elem, xml_content):
-        """Insert after with automatic attribute injection."""
-        nodes = super().insert_after(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+    def _place(self, method, elem, fragment):
+        """Insert with automatic attribute injection.
 
-    def insert_before(self, elem, xml_content):
-        """Insert before with automatic attribute injection."""
-        nodes = super().insert_before(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
-
-    def append_to(self, elem, xml_content):
-        """Append to with automatic attribute injection."""
-        nodes = super().append_to(elem, xml_content)
+        replace_node, insert_after, insert_before, append_to and insert_many
+        all insert through this.
+        """
+        # The IDs in the fragment are taken before new ones are given out
+        nodes = super()._place(method, elem, fragment)
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
@@ -287,52 +263,45 @@ class DocxXMLEditor(XMLEditor):
         """
         # Collect insertions
         ins_elements = []
-        if elem.tagName == "w:ins":
+        if self._tag(elem) == "w:ins":
             ins_elements.append(elem)
         else:
-            ins_elements.extend(elem.getElementsByTagName("w:ins"))
+            ins_elements.extend(self._find_all(elem, "w:ins"))
 
         # Validate that there are insertions to reject
         if not ins_elements:
             raise ValueError(
                 f"revert_insertion requires w:ins elements. "
-                f"The provided element <{elem.tagName}> contains no insertions. "
+                f"The provided element <{self._tag(elem)}> contains no insertions. "
             )
 
         # Process all insertions - wrap all children in w:del
         for ins_elem in ins_elements:
-            runs = list(ins_elem.getElementsByTagName("w:r"))
+            runs = list(self._find_all(ins_elem, "w:r"))
             if not runs:
                 continue
 
             # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._create_element("w:del")
 
             # Process each run
             for run in runs:
                 # Convert w:t → w:delText and w:rsidR → w:rsidDel
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
-
-                for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild)
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
+                if self._has_attr(run, "w:rsidR"):
+                    self._set_attr(run, "w:rsidDel", self._get_attr(run, "w:rsidR"))
+                    self._remove_attr(run, "w:rsidR")
+                elif not self._has_attr(run, "w:rsidDel"):
+                    self._set_attr(run, "w:rsidDel", self.rsid)
+
+                for t_elem in list(self._find_all(run, "w:t")):
+                    self._rename(t_elem, "w:delText")
 
             # Move all children from ins to del wrapper
-            while ins_elem.firstChild:
-                del_wrapper.appendChild(ins_elem.firstChild)
+            self._move_children(ins_elem, del_wrapper)
 
             # Add del wrapper back to ins
-            ins_elem.appendChild(del_wrapper)
+            self._append_child(ins_elem, del_wrapper)
+            self._index_changed(ins_elem)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -366,18 +335,18 @@ class DocxXMLEditor(XMLEditor):
         """
         # Collect deletions FIRST - before we modify the DOM
         del_elements = []
-        is_single_del = elem.tagName == "w:del"
+        is_single_del = self._tag(elem) == "w:del"
 
         if is_single_del:
             del_elements.append(elem)
         else:
-            del_elements.extend(elem.getElementsByTagName("w:del"))
+            del_elements.extend(self._find_all(elem, "w:del"))
 
         # Validate that there are deletions to reject
         if not del_elements:
             raise ValueError(
                 f"revert_deletion requires w:del elements. "
-                f"The provided element <{elem.tagName}> contains no deletions. "
+                f"The provided element <{self._tag(elem)}> contains no deletions. "
             )
 
         # Track created insertion (only relevant if elem is a single w:del)
@@ -386,46 +355,41 @@ class DocxXMLEditor(XMLEditor):
         # Process all deletions - create insertions that copy the deleted content
         for del_elem in del_elements:
             # Clone the deleted runs and convert them to insertions
-            runs = list(del_elem.getElementsByTagName("w:r"))
+            runs = list(self._find_all(del_elem, "w:r"))
             if not runs:
                 continue
 
             # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
+            ins_elem = self._create_element("w:ins")
 
             for run in runs:
                 # Clone the run
-                new_run = run.cloneNode(True)
+                new_run = self._clone(run)
 
                 # Convert w:delText → w:t
-                for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild)
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
+                for del_text in list(self._find_all(new_run, "w:delText")):
+                    self._rename(del_text, "w:t")
 
                 # Update run attributes: w:rsidDel → w:rsidR
-                if new_run.hasAttribute("w:rsidDel"):
-                    new_run.setAttribute("w:rsidR", new_run.getAttribute("w:rsidDel"))
-                    new_run.removeAttribute("w:rsidDel")
-                elif not new_run.hasAttribute("w:rsidR"):
-                    new_run.setAttribute("w:rsidR", self.rsid)
+                if self._has_attr(new_run, "w:rsidDel"):
+                    self._set_attr(
+                        new_run, "w:rsidR", self._get_attr(new_run, "w:rsidDel")
+                    )
+                    self._remove_attr(new_run, "w:rsidDel")
+                elif not self._has_attr(new_run, "w:rsidR"):
+                    self._set_attr(new_run, "w:rsidR", self.rsid)
 
-                ins_elem.appendChild(new_run)
+                self._append_child(ins_elem, new_run)
 
             # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            nodes = self.insert_after(del_elem, self._to_xml(ins_elem))
 
             # If processing a single w:del, track the created insertion
             if is_single_del and nodes:
                 created_insertion = nodes[0]
 
         # Return based on input type
-        if is_single_del and created_insertion:
+        if is_single_del and created_insertion is not None:
             return [elem, created_insertion]
         else:
             return [elem]
@@ -495,94 +459,74 @@ class DocxXMLEditor(XMLEditor):
         Raises:
             ValueError: If element has existing tracked changes or invalid structure
         """
-        if elem.nodeName == "w:r":
+        tag = self._tag(elem)
+        if tag == "w:r":
             # Check for existing w:delText
-            if elem.getElementsByTagName("w:delText"):
+            if self._find_all(elem, "w:delText"):
                 raise ValueError("w:r element already contains w:delText")
 
             # Convert w:t → w:delText
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+            for t_elem in list(self._find_all(elem, "w:t")):
+                self._rename(t_elem, "w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
-            if elem.hasAttribute("w:rsidR"):
-                elem.setAttribute("w:rsidDel", elem.getAttribute("w:rsidR"))
-                elem.removeAttribute("w:rsidR")
-            elif not elem.hasAttribute("w:rsidDel"):
-                elem.setAttribute("w:rsidDel", self.rsid)
+            if self._has_attr(elem, "w:rsidR"):
+                self._set_attr(elem, "w:rsidDel", self._get_attr(elem, "w:rsidR"))
+                self._remove_attr(elem, "w:rsidR")
+            elif not self._has_attr(elem, "w:rsidDel"):
+                self._set_attr(elem, "w:rsidDel", self.rsid)
 
             # Wrap in w:del
-            del_wrapper = self.dom.createElement("w:del")
-            parent = elem.parentNode
-            parent.insertBefore(del_wrapper, elem)
-            parent.removeChild(elem)
-            del_wrapper.appendChild(elem)
+            del_wrapper = self._create_element("w:del")
+            self._wrap(elem, del_wrapper)
+            self._index_changed(del_wrapper)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
             return del_wrapper
 
-        elif elem.nodeName == "w:p":
+        elif tag == "w:p":
             # Check for existing tracked changes
-            if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
+            if self._find_all(elem, "w:ins") or self._find_all(elem, "w:del"):
                 raise ValueError("w:p element already contains tracked changes")
 
             # Check if it's a numbered list item
-            pPr_list = elem.getElementsByTagName("w:pPr")
-            is_numbered = pPr_list and pPr_list[0].getElementsByTagName("w:numPr")
+            pPr_list = self._find_all(elem, "w:pPr")
+            is_numbered = pPr_list and self._find_all(pPr_list[0], "w:numPr")
 
             if is_numbered:
                 # Add <w:del/> to w:rPr in w:pPr
                 pPr = pPr_list[0]
-                rPr_list = pPr.getElementsByTagName("w:rPr")
+                rPr_list = self._find_all(pPr, "w:rPr")
 
                 if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
-                    pPr.appendChild(rPr)
+                    rPr = self._create_element("w:rPr")
+                    self._append_child(pPr, rPr)
                 else:
                     rPr = rPr_list[0]
 
                 # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
-                rPr.insertBefore(
-                    del_marker, rPr.firstChild
-                ) if rPr.firstChild else rPr.appendChild(del_marker)
+                del_marker = self._create_element("w:del")
+                self._prepend_child(rPr, del_marker)
 
             # Convert w:t → w:delText in all runs
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+            for t_elem in list(self._find_all(elem, "w:t")):
+                self._rename(t_elem, "w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
-            for run in elem.getElementsByTagName("w:r"):
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
+            for run in self._find_all(elem, "w:r"):
+                if self._has_attr(run, "w:rsidR"):
+                    self._set_attr(run, "w:rsidDel", self._get_attr(run, "w:rsidR"))
+                    self._remove_attr(run, "w:rsidR")
+                elif not self._has_attr(run, "w:rsidDel"):
+                    self._set_attr(run, "w:rsidDel", self.rsid)
 
             # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
-            for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
-                elem.removeChild(child)
-                del_wrapper.appendChild(child)
-            elem.appendChild(del_wrapper)
+            del_wrapper = self._create_element("w:del")
+            self._move_children(elem, del_wrapper, skip_tag="w:pPr")
+            self._append_child(elem, del_wrapper)
+            self._index_changed(elem)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -590,7 +534,15 @@ class DocxXMLEditor(XMLEditor):
             return elem
 
         else:
-            raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
+            raise ValueError(f"Element must be w:r or w:p, got {tag}")
+
+
+class LxmlDocxXMLEditor(DocxXMLEditor, LxmlXMLEditor):
+    """DocxXMLEditor on an lxml tree; see LxmlXMLEditor.
+
+    Attributes:
+        tree (lxml.etree._ElementTree): The tree for direct manipulation
+    """
 
 
 def _generate_hex_id() -> str:
@@ -619,6 +571,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        backend="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,7 +583,14 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            backend: "minidom" (default) or "lxml". With "lxml", word/document.xml
+                is edited with LxmlDocxXMLEditor, which is much faster and leaner
+                on large documents; its nodes are lxml elements.
         """
+        if backend not in ("minidom", "lxml"):
+            raise ValueError(f"Unknown backend: {backend} (use 'minidom' or 'lxml')")
+        self.backend = backend
+
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
@@ -645,6 +605,12 @@ class Document:
         self.original_docx = Path(self.temp_dir) / "original.docx"
         pack_document(self.original_path, self.original_docx, validate=False)
 
+        # Per-part validation results reused across saves (outside unpacked dir)
+        self.validation_manifest = Path(self.temp_dir) / "validation_manifest.json"
+
+        # Hash of the last word/document.xml that passed redlining validation
+        self._redlining_passed_hash = None
+
         self.word_path = self.unpacked_path / "word"
 
         # Generate RSID if not provided
@@ -666,7 +632,9 @@ class Document:
 
         # Load existing comments and determine next ID (before setup modifies files)
         self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
+        # ID of the first comment while there is no comments.xml (see
+        # next_comment_id)
+        self._first_comment_id = 0
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
@@ -704,8 +672,12 @@ class Document:
             file_path = self.unpacked_path / xml_path
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
-            # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
+            # Use DocxXMLEditor with RSID, author, and initials for all editors.
+            # The other parts are small, and the comment code edits their DOMs.
+            editor_class = DocxXMLEditor
+            if self.backend == "lxml" and xml_path == "word/document.xml":
+                editor_class = LxmlDocxXMLEditor
+            self._editors[xml_path] = editor_class(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
         return self._editors[xml_path]
@@ -727,20 +699,23 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
+        comment_id = self._get_next_comment_id()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
-
         # If end node is a paragraph, append comment markup inside it
         # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
+        end_method = (
+            "append_to" if self._document._tag(end) == "w:p" else "insert_after"
+        )
+        self._document.insert_many(
+            [
+                ("insert_before", start, self._comment_range_start_xml(comment_id)),
+                (end_method, end, self._comment_range_end_xml(comment_id)),
+            ]
+        )
 
         # Add to comments.xml immediately
         self._add_to_comments_xml(
@@ -759,7 +734,6 @@ class Document:
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
     def reply_to_comment(
@@ -784,7 +758,7 @@ class Document:
             raise ValueError(f"Parent comment with id={parent_comment_id} not found")
 
         parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
+        comment_id = self._get_next_comment_id()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -797,15 +771,21 @@ class Document:
             tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
         )
 
-        self._document.insert_after(
-            parent_start_elem, self._comment_range_start_xml(comment_id)
-        )
-        parent_ref_run = parent_ref_elem.parentNode
-        self._document.insert_after(
-            parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
-        )
-        self._document.insert_after(
-            parent_ref_run, self._comment_ref_run_xml(comment_id)
+        parent_ref_run = self._document._parent(parent_ref_elem)
+        self._document.insert_many(
+            [
+                (
+                    "insert_after",
+                    parent_start_elem,
+                    self._comment_range_start_xml(comment_id),
+                ),
+                (
+                    "insert_after",
+                    parent_ref_run,
+                    f'<w:commentRangeEnd w:id="{comment_id}"/>',
+                ),
+                ("insert_after", parent_ref_run, self._comment_ref_run_xml(comment_id)),
+            ]
         )
 
         # Add to comments.xml immediately
@@ -827,7 +807,6 @@ class Document:
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
     def __del__(self):
@@ -839,12 +818,18 @@ class Document:
         """
         Validate the document against XSD schema and redlining rules.
 
+        Only parts that changed since the previous call are re-checked; results
+        for unchanged parts come from the validation manifest in the temp dir.
+
         Raises:
             ValueError: If validation fails.
         """
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.original_docx,
+            verbose=False,
+            manifest_path=self.validation_manifest,
         )
         redlining_validator = RedliningValidator(
             self.unpacked_path, self.original_docx, verbose=False
@@ -853,8 +838,15 @@ class Document:
         # Run validations
         if not schema_validator.validate():
             raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+
+        # Redlining only depends on word/document.xml, so skip it when unchanged
+        document_hash = hashlib.sha256(
+            (self.word_path / "document.xml").read_bytes()
+        ).hexdigest()
+        if document_hash != self._redlining_passed_hash:
+            if not redlining_validator.validate():
+                raise ValueError("Redlining validation failed")
+            self._redlining_passed_hash = document_hash
 
     def save(self, destination=None, validate=True) -> None:
         """
@@ -885,21 +877,34 @@ class Document:
 
     # ==================== Private: Initialization ====================
 
+    @property
+    def next_comment_id(self):
+        """The ID the next comment will get.
+
+        Assigning it sets the ID of the next comment; the ones after that
+        count up from there.
+        """
+        return self._get_next_comment_id()
+
+    @next_comment_id.setter
+    def next_comment_id(self, value):
+        if not self.comments_path.exists():
+            self._first_comment_id = value
+            return
+        editor = self["word/comments.xml"]
+        editor._id_allocator("comment").next_id = value
+
     def _get_next_comment_id(self):
-        """Get the next available comment ID."""
+        """Get the next available comment ID.
+
+        comments.xml is scanned once; the comments added after that are seen
+        as they are inserted.
+        """
         if not self.comments_path.exists():
-            return 0
+            return self._first_comment_id
 
         editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
+        return int(editor._id_allocator("comment").peek())
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
@@ -0,0 +1,654 @@
+"""
+Tests that the lxml editor backend behaves like the minidom one.
+
+Run from the docx skill root:
+    python -m unittest scripts.document_test
+
+Benchmark both backends on a generated document (one process each, so peak
+memory is per backend):
+    python -m scripts.document_test benchmark [paragraphs]
+"""
+
+import json
+import random
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import lxml.etree
+
+from scripts.document import Document, DocxXMLEditor, LxmlDocxXMLEditor
+from scripts.utilities import LxmlXMLEditor, XMLEditor, _fragment_shape
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="ascii"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml" mc:Ignorable="w14">
+  <w:body>
+    <w:p w14:paraId="00000001" w:rsidR="00112233">
+      <w:r w:rsidR="00112233">
+        <w:t>The &#8220;Agreement&#8221; means this contract.</w:t>
+      </w:r>
+      <w:bookmarkStart w:id="0" w:name="first"/>
+      <w:bookmarkEnd w:id="0"/>
+    </w:p>
+    <w:p w14:paraId="00000002">
+      <w:pPr>
+        <w:numPr>
+          <w:ilvl w:val="0"/>
+          <w:numId w:val="1"/>
+        </w:numPr>
+      </w:pPr>
+      <w:r>
+        <w:t xml:space="preserve">Numbered item </w:t>
+      </w:r>
+      <w:r>
+        <w:t>with two runs &amp; an entity.</w:t>
+      </w:r>
+    </w:p>
+    <w:p w14:paraId="00000003">
+      <w:ins w:id="1" w:author="Other" w:date="2024-01-01T00:00:00Z">
+        <w:r>
+          <w:t>Inserted by someone else.</w:t>
+        </w:r>
+      </w:ins>
+      <w:del w:id="2" w:author="Other" w:date="2024-01-01T00:00:00Z">
+        <w:r w:rsidDel="00445566">
+          <w:delText>Deleted by someone else.</w:delText>
+        </w:r>
+      </w:del>
+    </w:p>
+    <w:p w14:paraId="00000004">
+      <w:r>
+        <w:t>Repeated text.</w:t>
+      </w:r>
+    </w:p>
+    <w:p w14:paraId="00000005">
+      <w:r>
+        <w:t>Repeated text.</w:t>
+      </w:r>
+      <!-- a comment -->
+    </w:p>
+    <w:sectPr/>
+  </w:body>
+</w:document>
+"""
+
+# Parts a Document needs besides word/document.xml
+CONTENT_TYPES_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>
+"""
+
+SETTINGS_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:settings xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:defaultTabStop w:val="720"/>
+</w:settings>
+"""
+
+DOCUMENT_RELS_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+</Relationships>
+"""
+
+QUERIES = [
+    {"tag": "w:p", "line_number": 4},
+    {"tag": "w:r", "line_number": range(1, 30)},
+    {"tag": "w:p", "line_number": range(10, 30)},
+    {"tag": "w:p", "attrs": {"w14:paraId": "00000003"}},
+    {"tag": "w:del", "attrs": {"w:id": "2"}},
+    {"tag": "w:ins", "attrs": {"w:id": "2"}},
+    {"tag": "w:bookmarkStart", "attrs": {"w:name": "first"}},
+    {"tag": "w:t", "contains": "&#8220;Agreement"},
+    {"tag": "w:p", "contains": "“Agreement”"},
+    {"tag": "w:p", "contains": "item with two runs & an"},
+    {"tag": "w:p", "contains": "Repeated text."},
+    {"tag": "w:r", "contains": "Repeated", "line_number": range(40, 50)},
+    {"tag": "w:body", "contains": "contract.Numbered"},
+    {"tag": "*", "attrs": {"w:id": "1"}},
+    {"tag": "w:document"},
+    {"tag": "w:tbl"},
+]
+
+DATES = re.compile(rb'(w:date|w16du:dateUtc|w16cex:dateUtc)="[^"]*"')
+
+
+def canonical(path):
+    """Return the C14N form of an XML file, with generated dates blanked."""
+    data = DATES.sub(rb'\1=""', Path(path).read_bytes())
+    return lxml.etree.tostring(lxml.etree.fromstring(data), method="c14n")
+
+
+def describe(editor, result):
+    """Return a backend-independent description of a lookup result."""
+    if isinstance(result, ValueError):
+        return str(result)
+    return (
+        editor._tag(result),
+        editor._line(result),
+        editor._get_element_text(result),
+    )
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestLxmlBackendMatchesMinidom(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def editors(self, minidom_class=DocxXMLEditor, lxml_class=LxmlDocxXMLEditor):
+        """Return a minidom and an lxml editor, each on its own copy."""
+        editors = []
+        for editor_class in (minidom_class, lxml_class):
+            path = self.temp_dir / f"{editor_class.__name__}.xml"
+            path.write_text(DOCUMENT_XML, encoding="ascii")
+            if issubclass(editor_class, DocxXMLEditor):
+                editors.append(editor_class(path, rsid="00AB12CD", author="Tester"))
+            else:
+                editors.append(editor_class(path))
+        return editors
+
+    def assertSameDocument(self, minidom_editor, lxml_editor):
+        minidom_editor.save()
+        lxml_editor.save()
+        self.assertEqual(
+            canonical(minidom_editor.xml_path), canonical(lxml_editor.xml_path)
+        )
+        # Namespaces are declared in the same places
+        self.assertEqual(
+            minidom_editor.xml_path.read_bytes().count(b"xmlns"),
+            lxml_editor.xml_path.read_bytes().count(b"xmlns"),
+        )
+
+    def test_save_without_changes_matches(self):
+        """Saving an unchanged file gives the same document"""
+        self.assertSameDocument(*self.editors(XMLEditor, LxmlXMLEditor))
+
+    def test_get_node_matches(self):
+        """get_node finds the same element, or raises the same error"""
+        minidom_editor, lxml_editor = self.editors(XMLEditor, LxmlXMLEditor)
+        for query in QUERIES:
+            with self.subTest(query=query):
+                results = []
+                for editor in (minidom_editor, lxml_editor):
+                    try:
+                        result = editor.get_node(**query)
+                    except ValueError as e:
+                        result = e
+                    results.append(describe(editor, result))
+                self.assertEqual(results[0], results[1])
+
+    def test_get_nodes_matches(self):
+        """get_nodes gives the same results as on minidom"""
+        minidom_editor, lxml_editor = self.editors(XMLEditor, LxmlXMLEditor)
+        self.assertEqual(
+            [describe(minidom_editor, r) for r in minidom_editor.get_nodes(QUERIES)],
+            [describe(lxml_editor, r) for r in lxml_editor.get_nodes(QUERIES)],
+        )
+
+    def test_edits_match(self):
+        """replace_node, insert_* and append_to give the same document"""
+        editors = self.editors(XMLEditor, LxmlXMLEditor)
+        for editor in editors:
+            first = editor.get_node(tag="w:p", attrs={"w14:paraId": "00000001"})
+            run = editor.get_node(tag="w:r", contains="Numbered item")
+            last = editor.get_node(tag="w:p", attrs={"w14:paraId": "00000005"})
+            editor.insert_before(first, "\n    <w:p><w:r><w:t>Before</w:t></w:r></w:p>")
+            nodes = editor.insert_after(run, "<w:r><w:t> A</w:t></w:r>")
+            editor.insert_after(nodes[-1], "<w:r><w:t>B</w:t></w:r>\n<w:r/>")
+            editor.append_to(last, "<w:r><w:t>Appended</w:t></w:r><!-- note -->")
+            editor.replace_node(
+                editor.get_node(tag="w:t", contains="Repeated", line_number=44),
+                "<w:t>Replaced</w:t>",
+            )
+        self.assertSameDocument(*editors)
+        # The indexes followed the edits
+        for query in [
+            {"tag": "w:p", "contains": "Before"},
+            {"tag": "w:r", "contains": "Numbered item"},
+            {"tag": "w:p", "contains": "Replaced"},
+            {"tag": "w:p", "contains": "Repeated text."},
+            {"tag": "w:r", "line_number": range(1, 30)},
+        ]:
+            with self.subTest(query=query):
+                results = []
+                for editor in editors:
+                    try:
+                        results.append(describe(editor, editor.get_node(**query)))
+                    except ValueError as e:
+                        results.append(str(e))
+                self.assertEqual(results[0], results[1])
+
+    def test_tracked_changes_match(self):
+        """DocxXMLEditor's tracked-change methods give the same document"""
+        editors = self.editors()
+        for editor in editors:
+            random.seed(0)  # Generated paraIds
+            editor.suggest_deletion(editor.get_node(tag="w:r", contains="Agreement"))
+            editor.suggest_deletion(
+                editor.get_node(tag="w:p", attrs={"w14:paraId": "00000002"})
+            )
+            editor.revert_insertion(editor.get_node(tag="w:ins", attrs={"w:id": "1"}))
+            nodes = editor.revert_deletion(
+                editor.get_node(tag="w:del", attrs={"w:id": "2"})
+            )
+            self.assertEqual(len(nodes), 2)
+            editor.insert_after(
+                editor.get_node(tag="w:p", attrs={"w14:paraId": "00000004"}),
+                "<w:p><w:ins><w:r><w:t> New paragraph</w:t></w:r></w:ins></w:p>",
+            )
+        self.assertSameDocument(*editors)
+        # w16du, needed for the dates of the new changes, is declared on the root
+        self.assertIn(
+            "w16du", lxml.etree.parse(str(editors[1].xml_path)).getroot().nsmap
+        )
+
+    def test_new_nodes_have_no_line_number(self):
+        """Inserted and renamed elements are not found by line number"""
+        for editor in self.editors():
+            with self.subTest(editor=type(editor).__name__):
+                run = editor.get_node(tag="w:r", line_number=5)
+                editor.suggest_deletion(run)
+                with self.assertRaises(ValueError):
+                    editor.get_node(tag="w:delText", line_number=6)
+                self.assertIsNone(
+                    editor._line(editor.get_node(tag="w:del", contains="Agreement"))
+                )
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestFragments(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def editor(self, editor_class, name="document.xml"):
+        path = self.temp_dir / f"{editor_class.__name__}-{name}"
+        path.write_text(DOCUMENT_XML, encoding="ascii")
+        if issubclass(editor_class, DocxXMLEditor):
+            return editor_class(path, rsid="00AB12CD", author="Tester")
+        return editor_class(path)
+
+    def edits(self, editor):
+        """Return edits for insert_many, or the same calls one at a time."""
+        first = editor.get_node(tag="w:p", attrs={"w14:paraId": "00000001"})
+        run = editor.get_node(tag="w:r", contains="Numbered item")
+        last = editor.get_node(tag="w:p", attrs={"w14:paraId": "00000005"})
+        edits = []
+        for i in range(3):
+            edits += [
+                ("insert_before", first, f'<w:commentRangeStart w:id="{i}"/>'),
+                ("append_to", last, f'<w:commentRangeEnd w:id="{i}"/>\n'),
+                ("insert_after", run, f"<w:ins><w:r><w:t> {i}</w:t></w:r></w:ins>"),
+            ]
+        edits.append(("replace_node", last, '<w:p w14:paraId="0000000A"/>'))
+        return edits
+
+    def test_insert_many_matches_single_inserts(self):
+        """insert_many gives the same document as calling each method"""
+        for editor_class in (DocxXMLEditor, LxmlDocxXMLEditor):
+            with self.subTest(editor=editor_class.__name__):
+                single = self.editor(editor_class, "single.xml")
+                batch = self.editor(editor_class, "batch.xml")
+                random.seed(0)
+                expected = [
+                    getattr(single, method)(elem, xml)
+                    for method, elem, xml in self.edits(single)
+                ]
+                random.seed(0)
+                results = batch.insert_many(self.edits(batch))
+                self.assertEqual(
+                    [len(nodes) for nodes in results],
+                    [len(nodes) for nodes in expected],
+                )
+                single.save()
+                batch.save()
+                self.assertEqual(canonical(single.xml_path), canonical(batch.xml_path))
+                # Change IDs were given in order
+                self.assertEqual(
+                    batch._get_attr(results[2][0], "w:id"),
+                    str(int(batch._get_attr(results[5][0], "w:id")) - 1),
+                )
+
+    def test_fragments_of_one_shape_get_their_own_values(self):
+        """Fragments copied from a template have their own nodes and values"""
+        for editor_class in (XMLEditor, LxmlXMLEditor):
+            with self.subTest(editor=editor_class.__name__):
+                editor = self.editor(editor_class)
+                para = editor.get_node(tag="w:p", attrs={"w14:paraId": "00000004"})
+                inserted = [
+                    editor.append_to(para, f"<w:r w:rsidR='{i}'><w:t>x</w:t></w:r>\n")[
+                        0
+                    ]
+                    for i in range(3)
+                ]
+                self.assertEqual(len(editor._fragment_templates), 1)
+                self.assertEqual(len({id(node) for node in inserted}), 3)
+                self.assertEqual(
+                    [editor._get_attr(node, "w:rsidR") for node in inserted],
+                    ["0", "1", "2"],
+                )
+                for i in range(3):
+                    self.assertEqual(
+                        editor._get_attr(
+                            editor.get_node(tag="w:r", attrs={"w:rsidR": str(i)}),
+                            "w:rsidR",
+                        ),
+                        str(i),
+                    )
+
+    def test_fragment_shape(self):
+        self.assertEqual(
+            _fragment_shape(
+                '<w:p w14:paraId="1A"><w:r xmlns:x="urn:x" a=\'>\'>x="2"</w:r></w:p>'
+            ),
+            (
+                '<w:p w14:paraId=""><w:r xmlns:x="urn:x" a=\'\'>x="2"</w:r></w:p>',
+                ["1A", ">"],
+            ),
+        )
+        # Always parsed
+        self.assertIsNone(_fragment_shape('<w:t a="&amp;">x</w:t>'))
+        self.assertIsNone(_fragment_shape('<w:t a="x\ny">x</w:t>'))
+        self.assertIsNone(_fragment_shape("<w:t>x</w:t><!-- note -->"))
+
+    def test_bad_fragment_in_a_batch(self):
+        for editor_class in (XMLEditor, LxmlXMLEditor):
+            with self.subTest(editor=editor_class.__name__):
+                editor = self.editor(editor_class)
+                para = editor.get_node(tag="w:p", attrs={"w14:paraId": "00000004"})
+                with self.assertRaises(Exception):
+                    editor.insert_many(
+                        [("append_to", para, "<w:r/>"), ("append_to", para, "<w:r>")]
+                    )
+                with self.assertRaises(AssertionError):
+                    editor.insert_many(
+                        [("append_to", para, "<w:r/>"), ("append_to", para, "text")]
+                    )
+                with self.assertRaises(ValueError):
+                    editor.insert_many([("prepend_to", para, "<w:r/>")])
+                # Nothing was inserted
+                self.assertEqual(editor._find_all(para, "w:r")[1:], [])
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestIdAllocation(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def test_change_ids_are_unique(self):
+        """Change IDs stay unique when fragments bring IDs of their own"""
+        for editor_class in (DocxXMLEditor, LxmlDocxXMLEditor):
+            with self.subTest(editor=editor_class.__name__):
+                path = self.temp_dir / f"{editor_class.__name__}.xml"
+                path.write_text(DOCUMENT_XML, encoding="ascii")
+                editor = editor_class(path, rsid="00AB12CD")
+                first = editor.suggest_deletion(
+                    editor.get_node(tag="w:r", contains="Agreement")
+                )
+                self.assertEqual(editor._get_attr(first, "w:id"), "3")
+                para = editor.get_node(tag="w:p", attrs={"w14:paraId": "00000004"})
+                nodes = editor.append_to(
+                    para,
+                    '<w:del w:id="40"><w:r><w:delText>x</w:delText></w:r></w:del>'
+                    "<w:ins><w:r><w:t>y</w:t></w:r></w:ins>",
+                )
+                self.assertEqual(editor._get_attr(nodes[1], "w:id"), "41")
+                revert = editor.revert_deletion(nodes[0])
+                self.assertEqual(editor._get_attr(revert[1], "w:id"), "42")
+                editor.revert_insertion(nodes[1])
+                ids = [
+                    editor._get_attr(elem, "w:id")
+                    for tag in ("w:ins", "w:del")
+                    for elem in editor._find_all(editor._root(), tag)
+                ]
+                self.assertEqual(len(ids), len(set(ids)))
+                self.assertIn("43", ids)
+
+                # Direct changes are seen after invalidate_index()
+                editor._set_attr(first, "w:id", "99")
+                editor.invalidate_index()
+                self.assertEqual(editor._get_next_change_id(), 100)
+
+    def test_change_ids_skip_ids_added_through_the_tree(self):
+        """invalidate_index() shows IDs added through a held editor.dom or root"""
+        for editor_class in (DocxXMLEditor, LxmlDocxXMLEditor):
+            with self.subTest(editor=editor_class.__name__):
+                path = self.temp_dir / f"{editor_class.__name__}.xml"
+                # Without the other author's changes, so IDs start at 0
+                xml = re.sub(
+                    r'<w:p w14:paraId="00000003">.*?</w:p>',
+                    "",
+                    DOCUMENT_XML,
+                    flags=re.S,
+                )
+                path.write_text(xml, encoding="ascii")
+                editor = editor_class(path, rsid="00AB12CD")
+                # Held from before the first ID is given out
+                tree = editor.dom if editor_class is DocxXMLEditor else editor.root
+                first = editor.suggest_deletion(
+                    editor.get_node(tag="w:r", contains="Agreement")
+                )
+                self.assertEqual(editor._get_attr(first, "w:id"), "0")
+
+                if editor_class is DocxXMLEditor:
+                    ins = tree.createElement("w:ins")
+                    ins.setAttribute("w:id", "1")
+                    tree.getElementsByTagName("w:body")[0].appendChild(ins)
+                else:
+                    body = editor._find_all(tree, "w:body")[0]
+                    ins = lxml.etree.SubElement(body, editor._clark("w:ins"))
+                    ins.set(editor._clark("w:id", attribute=True), "1")
+                editor.invalidate_index()
+
+                second = editor.suggest_deletion(
+                    editor.get_node(tag="w:r", contains="Numbered item")
+                )
+                ids = [
+                    editor._get_attr(elem, "w:id")
+                    for tag in ("w:ins", "w:del")
+                    for elem in editor._find_all(editor._root(), tag)
+                ]
+                self.assertEqual(editor._get_attr(second, "w:id"), "2")
+                self.assertEqual(len(ids), len(set(ids)))
+
+    def test_get_next_rid_follows_insertions(self):
+        for editor_class in (XMLEditor, LxmlXMLEditor):
+            with self.subTest(editor=editor_class.__name__):
+                path = self.temp_dir / f"{editor_class.__name__}.rels"
+                path.write_text(
+                    DOCUMENT_RELS_XML.replace(
+                        "</Relationships>",
+                        '<Relationship Id="rId7" Type="t" Target="a.xml"/></Relationships>',
+                    )
+                )
+                editor = editor_class(path)
+                self.assertEqual(editor.get_next_rid(), "rId8")
+                self.assertEqual(editor.get_next_rid(), "rId8")
+                root = editor.get_node(tag="Relationships")
+                editor.append_to(
+                    root, '<Relationship Id="rId8" Type="t" Target="b.xml"/>'
+                )
+                self.assertEqual(editor.get_next_rid(), "rId9")
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestDocumentBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.unpacked = self.temp_dir / "unpacked"
+        (self.unpacked / "word" / "_rels").mkdir(parents=True)
+        (self.unpacked / "[Content_Types].xml").write_text(CONTENT_TYPES_XML)
+        (self.unpacked / "word" / "document.xml").write_text(DOCUMENT_XML)
+        (self.unpacked / "word" / "settings.xml").write_text(SETTINGS_XML)
+        (self.unpacked / "word" / "_rels" / "document.xml.rels").write_text(
+            DOCUMENT_RELS_XML
+        )
+
+    def edit(self, backend):
+        random.seed(0)
+        doc = Document(self.unpacked, rsid="00AB12CD", backend=backend)
+        editor = doc["word/document.xml"]
+        para = editor.get_node(tag="w:p", contains="Agreement")
+        comment_id = doc.add_comment(start=para, end=para, text="Why?")
+        doc.reply_to_comment(comment_id, "Because.")
+        editor.suggest_deletion(editor.get_node(tag="w:r", contains="two runs"))
+        output = self.temp_dir / backend
+        doc.save(output, validate=False)
+        return doc, output
+
+    def test_lxml_backend_edits_document_xml_only(self):
+        """backend="lxml" applies to word/document.xml"""
+        doc, _ = self.edit("lxml")
+        self.assertIsInstance(doc["word/document.xml"], LxmlDocxXMLEditor)
+        self.assertNotIsInstance(doc["word/comments.xml"], LxmlXMLEditor)
+
+    def test_backends_save_the_same_document(self):
+        """Comments and tracked changes come out the same with both backends"""
+        _, minidom_output = self.edit("minidom")
+        _, lxml_output = self.edit("lxml")
+        for path in sorted(minidom_output.rglob("*.xml")):
+            with self.subTest(part=str(path.relative_to(minidom_output))):
+                self.assertEqual(
+                    canonical(path),
+                    canonical(lxml_output / path.relative_to(minidom_output)),
+                )
+
+    def test_comment_ids(self):
+        doc = Document(self.unpacked, rsid="00AB12CD")
+        para = doc["word/document.xml"].get_node(tag="w:p", contains="Agreement")
+        self.assertEqual(doc.next_comment_id, 0)
+        self.assertEqual(doc.add_comment(start=para, end=para, text="One"), 0)
+        self.assertEqual(doc.reply_to_comment(0, "Two"), 1)
+        doc["word/comments.xml"].append_to(
+            doc["word/comments.xml"].get_node(tag="w:comments"),
+            '<w:comment w:id="5"><w:p><w:r><w:t>Three</w:t></w:r></w:p></w:comment>',
+        )
+        self.assertEqual(doc.add_comment(start=para, end=para, text="Four"), 6)
+
+        # Assignable, as before it was derived from comments.xml
+        doc.next_comment_id = 10
+        self.assertEqual(doc.add_comment(start=para, end=para, text="Five"), 10)
+        self.assertEqual(doc.next_comment_id, 11)
+
+    def test_next_comment_id_before_comments_xml_exists(self):
+        doc = Document(self.unpacked, rsid="00AB12CD")
+        para = doc["word/document.xml"].get_node(tag="w:p", contains="Agreement")
+        doc.next_comment_id = 3
+        self.assertEqual(doc.add_comment(start=para, end=para, text="One"), 3)
+        self.assertEqual(doc.reply_to_comment(3, "Two"), 4)
+
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Document(self.unpacked, backend="etree")
+
+
+def generate_document(paragraphs):
+    """Return a document.xml with this many paragraphs, formatted like unpack.py output."""
+    parts = [
+        '<?xml version="1.0" encoding="ascii"?>\n'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+        ' xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml">\n'
+        "  <w:body>\n"
+    ]
+    for i in range(paragraphs):
+        parts.append(
+            f'    <w:p w14:paraId="{i + 1:08X}" w:rsidR="00A1B2C3">\n'
+            "      <w:pPr>\n"
+            '        <w:pStyle w:val="BodyText"/>\n'
+            "      </w:pPr>\n"
+            "      <w:r>\n"
+            "        <w:rPr>\n"
+            "          <w:b/>\n"
+            "        </w:rPr>\n"
+            f'        <w:t xml:space="preserve">Clause {i}: </w:t>\n'
+            "      </w:r>\n"
+            "      <w:r>\n"
+            f"        <w:t>Paragraph {i} text here, with the body of the clause.</w:t>\n"
+            "      </w:r>\n"
+            "    </w:p>\n"
+        )
+    parts.append("  </w:body>\n</w:document>\n")
+    return "".join(parts)
+
+
+def benchmark(backend, path, paragraphs):
+    """Time the main operations on one backend; print the results as JSON."""
+    editor_class = {"minidom": DocxXMLEditor, "lxml": LxmlDocxXMLEditor}[backend]
+    picks = random.Random(0).sample(range(paragraphs), 200)
+    results = {}
+
+    def timed(name, operation):
+        start = time.perf_counter()
+        result = operation()
+        results[name] = round(time.perf_counter() - start, 2)
+        return result
+
+    editor = timed("parse", lambda: editor_class(path, rsid="00AB12CD"))
+    timed("index", lambda: editor.get_node(tag="w:p", attrs={"w14:paraId": "00000001"}))
+    timed(
+        "200 lookups",
+        lambda: [
+            editor.get_node(tag="w:r", contains=f"Paragraph {i} text") for i in picks
+        ],
+    )
+
+    def edit():
+        for k, i in enumerate(picks):
+            run = editor.get_node(tag="w:r", contains=f"Paragraph {i} text")
+            if k % 2:
+                editor.suggest_deletion(run)
+            else:
+                editor.insert_after(
+                    run, f"<w:ins><w:r><w:t>new {k}</w:t></w:r></w:ins>"
+                )
+
+    timed("200 edits", edit)
+    timed("save", editor.save)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results["peak MB"] = round(peak / 1024)  # ru_maxrss is in KB on Linux
+    print(json.dumps(results))
+
+
+def run_benchmarks(paragraphs):
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        source = temp_dir / "document.xml"
+        source.write_text(generate_document(paragraphs), encoding="ascii")
+        size = source.stat().st_size / 1024 / 1024
+        print(f"document.xml: {paragraphs} paragraphs, {size:.0f} MB")
+        for backend in ("minidom", "lxml"):
+            path = temp_dir / f"{backend}.xml"
+            shutil.copy(source, path)
+            output = subprocess.run(
+                [sys.executable, "-m", "scripts.document_test", "benchmark-backend"]
+                + [backend, str(path), str(paragraphs)],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            print(f"{backend:8s} {output.strip()}")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["benchmark"]:
+        run_benchmarks(int(sys.argv[2]) if len(sys.argv) > 2 else 100000)
+    elif sys.argv[1:2] == ["benchmark-backend"]:
+        benchmark(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    else:
+        unittest.main()
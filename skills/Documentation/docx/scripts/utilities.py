@@ -22,20 +22,53 @@ Example usage:
     # Combine filters
     elem = editor.get_node(tag="w:p", line_number=range(1, 50), contains="text")
 
+    # Find many nodes in one pass (each result is an element or a ValueError)
+    elems = editor.get_nodes(
+        [{"tag": "w:p", "contains": "first"}, {"tag": "w:p", "contains": "second"}]
+    )
+
     # Replace, insert, or manipulate
     new_elem = editor.replace_node(elem, "<w:r><w:t>new text</w:t></w:r>")
     editor.insert_after(new_elem, "<w:r><w:t>more</w:t></w:r>")
 
+    # Make many insertions, parsing their XML in one go
+    editor.insert_many(
+        [("insert_before", new_elem, "<w:r/>"), ("append_to", new_elem, "<w:r/>")]
+    )
+
     # Save changes
     editor.save()
+
+Lookups go through an index built on the first get_node call (elements by
+tag, by original line, by ID attributes like w:id and w14:paraId, and the
+text content of elements), so repeated lookups in large documents don't
+rescan the whole tree. The editing methods keep the index up to date; call
+invalidate_index() after changing text or attributes through editor.dom, or
+adding elements there. The change, comment and relationship IDs the editor
+gives out are tracked the same way, so until then they may reuse IDs added
+directly.
+
+XML given to the editing methods is parsed with just the root's namespace
+declarations it uses, and XML differing from an earlier fragment only in
+attribute values (like the w:id of comment ranges) is copied from that one
+instead of parsed again.
+
+LxmlXMLEditor has the same API on an lxml tree (editor.tree) instead of a
+minidom DOM. It parses large parts several times faster in a fraction of the
+memory; the nodes it returns are lxml elements.
 """
 
+import copy
 import html
+import re
+from bisect import bisect_left
+from collections import deque
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
 
 
 class XMLEditor:
@@ -52,6 +85,10 @@ class XMLEditor:
         dom: Parsed DOM tree with parse_position attributes on elements
     """
 
+    # Kinds of numeric IDs the editor allocates: the tags of the elements
+    # that have them, the ID attribute, its prefix and the first ID
+    _ID_KINDS = {"rId": (("Relationship",), "Id", "rId", 1)}
+
     def __init__(self, xml_path):
         """
         Initialize with path to XML file and parse with line number tracking.
@@ -73,6 +110,19 @@ class XMLEditor:
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
 
+        # Lookup index for get_node, built on first use
+        self._index = None
+        # Changes not yet applied to the index: (node, parent it was removed
+        # from, or None if the node was added or changed in place)
+        self._index_changes = []
+
+        # The root's namespace declarations, for parsing fragments, by prefix
+        self._namespace_declarations = None
+        # Parsed fragments by shape (see _fragment_shape), to copy
+        self._fragment_templates = {}
+        # ID allocators by kind, made on first use
+        self._id_allocators = {}
+
     def get_node(
         self,
         tag: str,
@@ -109,78 +159,141 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
+        matches = self._find_nodes(tag, attrs, line_number, contains)
+        if len(matches) != 1:
+            raise _lookup_error(tag, attrs, line_number, contains, matches)
+        return matches[0]
+
+    def get_nodes(self, queries):
+        """
+        Get several DOM elements at once, one per query.
+
+        Each query is a dict of get_node's arguments. Text searches are done
+        together: the text of each element is scanned once for all the
+        contains= strings of its tag, instead of once per query.
+
+        Args:
+            queries: List of dicts with get_node's keyword arguments
+                     ("tag", and optionally "attrs", "line_number", "contains")
+
+        Returns:
+            list: For each query, the matching element, or the ValueError
+                  get_node would raise if no node or several nodes match
+
+        Example:
+            results = editor.get_nodes([
+                {"tag": "w:p", "contains": "first clause"},
+                {"tag": "w:p", "contains": "second clause"},
+                {"tag": "w:del", "attrs": {"w:id": "1"}},
+            ])
+            for result in results:
+                if isinstance(result, ValueError):
+                    print(result)
+        """
+        specs = [_query_spec(**query) for query in queries]
+
+        # Elements containing each search string, found with one pass per tag
+        index = self._get_index()
+        hits_by_tag = {}
+        for tag, _, _, contains in specs:
+            if contains is not None:
+                hits_by_tag.setdefault(tag, {})[html.unescape(contains)] = []
+        for tag, hits in hits_by_tag.items():
+            patterns = list(hits)
+            matcher = _MultiPatternMatcher(patterns)
+            for elem in index.candidates(tag, None, None):
+                for number in matcher.search(index.text(elem)):
+                    hits[patterns[number]].append(elem)
+
+        results = []
+        for tag, attrs, line_number, contains in specs:
+            candidates = None
             if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
+                candidates = hits_by_tag[tag][html.unescape(contains)]
+            matches = self._find_nodes(tag, attrs, line_number, contains, candidates)
+            if len(matches) == 1:
+                results.append(matches[0])
+            else:
+                results.append(
+                    _lookup_error(tag, attrs, line_number, contains, matches)
+                )
+        return results
 
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+    def _find_nodes(self, tag, attrs, line_number, contains, candidates=None):
+        """
+        Return every element matching get_node's filters.
+
+        Candidates come from the lookup index unless given (they may be a
+        superset); matches are checked against the live tree.
+        """
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        index = self._get_index()
+        if candidates is None:
+            candidates = index.candidates(tag, attrs, line_number)
+            if normalized_contains is not None:
+                text = index.text
+                candidates = [
+                    elem for elem in candidates if normalized_contains in text(elem)
+                ]
+        matches = []
+        for elem in candidates:
+            if tag != "*" and self._tag(elem) != tag:
+                continue
+            if not self._matches(elem, attrs, line_number, None):
+                continue
+            # The index goes stale if the DOM is changed directly, so check
+            # each match against the live tree
+            if not self._is_attached(elem):
+                index.discard(elem)
+            elif self._matches(elem, attrs, line_number, normalized_contains):
+                matches.append(elem)
 
         if not matches:
-            # Build descriptive error message
-            filters = []
-            if line_number is not None:
-                line_str = (
-                    f"lines {line_number.start}-{line_number.stop - 1}"
-                    if isinstance(line_number, range)
-                    else f"line {line_number}"
-                )
-                filters.append(f"at {line_str}")
-            if attrs is not None:
-                filters.append(f"with attributes {attrs}")
-            if contains is not None:
-                filters.append(f"containing '{contains}'")
-
-            filter_desc = " ".join(filters) if filters else ""
-            base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
-
-            # Add helpful hint based on filters used
-            if contains:
-                hint = "Text may be split across elements or use different wording."
-            elif line_number:
-                hint = "Line numbers may have changed if document was modified."
-            elif attrs:
-                hint = "Verify attribute values are correct."
+            # Elements the index doesn't know about are only found by a scan
+            root = self._root()
+            elements = [root] if tag in ("*", self._tag(root)) else []
+            elements.extend(self._find_all(root, tag))
+            for elem in elements:
+                if self._matches(elem, attrs, line_number, normalized_contains):
+                    matches.append(elem)
+            if matches:
+                self.invalidate_index()
+
+        return matches
+
+    def _matches(self, elem, attrs, line_number, contains):
+        """Return True if elem passes the get_node filters (contains normalized)."""
+        # Check line_number filter
+        if line_number is not None:
+            elem_line = self._line(elem)
+
+            # Handle both single line number and range
+            if isinstance(line_number, range):
+                if elem_line not in line_number:
+                    return False
             else:
-                hint = "Try adding filters (attrs, line_number, or contains)."
+                if elem_line != line_number:
+                    return False
 
-            raise ValueError(f"{base_msg}. {hint}")
-        if len(matches) > 1:
-            raise ValueError(
-                f"Multiple nodes found: <{tag}>. "
-                f"Add more filters (attrs, line_number, or contains) to narrow the search."
-            )
-        return matches[0]
+        # Check attrs filter
+        if attrs is not None:
+            if not all(
+                self._get_attr(elem, attr_name) == attr_value
+                for attr_name, attr_value in attrs.items()
+            ):
+                return False
 
-    def _get_element_text(self, elem):
+        # Check contains filter
+        if contains is not None:
+            if contains not in self._get_element_text(elem):
+                return False
+
+        return True
+
+    def _get_element_text(self, elem, text_of=None):
         """
         Recursively extract all text content from an element.
 
@@ -189,10 +302,13 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to extract text from
+            text_of: Function returning the text of a child element
+                     (default: this method; the lookup index passes its cache)
 
         Returns:
             str: Concatenated text from all non-whitespace text nodes within the element
         """
+        text_of = text_of or self._get_element_text
         text_parts = []
         for node in elem.childNodes:
             if node.nodeType == node.TEXT_NODE:
@@ -200,9 +316,60 @@ class XMLEditor:
                 if node.data.strip():
                     text_parts.append(node.data)
             elif node.nodeType == node.ELEMENT_NODE:
-                text_parts.append(self._get_element_text(node))
+                text_parts.append(text_of(node))
         return "".join(text_parts)
 
+    def _get_elements(self, tag):
+        """Return the elements with this tag, like dom.getElementsByTagName(tag)."""
+        return [
+            elem
+            for elem in self._get_index().candidates(tag, None, None)
+            if self._tag(elem) == tag and self._is_attached(elem)
+        ]
+
+    def invalidate_index(self):
+        """
+        Discard the get_node lookup index; the next lookup rebuilds it.
+
+        Call this after changing text or attributes through self.dom directly.
+        Changes made with replace_node, insert_after, insert_before and
+        append_to are tracked automatically. This also forgets the root's
+        namespace declarations and the IDs in use, in case they were changed
+        too.
+        """
+        self._index = None
+        self._index_changes.clear()
+        self._namespace_declarations = None
+        self._fragment_templates.clear()
+        self._id_allocators.clear()
+
+    def _get_index(self):
+        """Return the lookup index, building it or applying pending changes."""
+        if self._index is None:
+            self._index = _NodeIndex(self)
+            self._index_changes.clear()
+        for node, removed_from in self._index_changes:
+            self._index.update(node, removed_from)
+        self._index_changes.clear()
+        return self._index
+
+    def _index_changed(self, node, removed_from=None):
+        """
+        Record a DOM change for the lookup index.
+
+        Methods that change the DOM call this for every node they add, remove
+        (passing its former parent) or restructure. Changes are applied at the
+        next lookup, so attributes set right after an insertion are indexed.
+        """
+        if self._index is not None:
+            self._index_changes.append((node, removed_from))
+
+    def _is_attached(self, elem):
+        """Return True if elem is still part of this editor's document."""
+        while elem.parentNode is not None:
+            elem = elem.parentNode
+        return elem is self.dom
+
     def replace_node(self, elem, new_content):
         """
         Replace a DOM element with new XML content.
@@ -217,12 +384,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
-        return nodes
+        return self._place("replace_node", elem, self._parse_fragment(new_content))
 
     def insert_after(self, elem, xml_content):
         """
@@ -238,15 +400,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
-        return nodes
+        return self._place("insert_after", elem, self._parse_fragment(xml_content))
 
     def insert_before(self, elem, xml_content):
         """
@@ -262,11 +416,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        return nodes
+        return self._place("insert_before", elem, self._parse_fragment(xml_content))
 
     def append_to(self, elem, xml_content):
         """
@@ -282,22 +432,42 @@ class XMLEditor:
         Example:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            elem.appendChild(node)
-        return nodes
+        return self._place("append_to", elem, self._parse_fragment(xml_content))
+
+    def insert_many(self, edits):
+        """
+        Make several insertions, parsing the XML of all of them in one go.
+
+        Args:
+            edits: List of (method, elem, xml_content) tuples, where method is
+                   "replace_node", "insert_after", "insert_before" or
+                   "append_to". They are applied in order, as if each method
+                   were called in turn.
+
+        Returns:
+            List with the inserted nodes of each edit
+
+        Raises:
+            ValueError: If a method is not one of the above
+
+        Example:
+            editor.insert_many([
+                ("insert_before", start, '<w:commentRangeStart w:id="0"/>'),
+                ("append_to", end, '<w:commentRangeEnd w:id="0"/>'),
+            ])
+        """
+        for method, _, _ in edits:
+            if method not in _INSERT_METHODS:
+                raise ValueError(f"Unknown insert method: {method}")
+        fragments = self._parse_fragments([xml for _, _, xml in edits])
+        return [
+            self._place(method, elem, fragment)
+            for (method, elem, _), fragment in zip(edits, fragments)
+        ]
 
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
-        max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
-            rel_id = rel_elem.getAttribute("Id")
-            if rel_id.startswith("rId"):
-                try:
-                    max_id = max(max_id, int(rel_id[3:]))
-                except ValueError:
-                    pass
-        return f"rId{max_id + 1}"
+        return self._id_allocator("rId").peek()
 
     def save(self):
         """
@@ -309,39 +479,947 @@ class XMLEditor:
         content = self.dom.toxml(encoding=self.encoding)
         self.xml_path.write_bytes(content)
 
+    def _place(self, method, elem, fragment):
+        """Insert the nodes of a parsed fragment the way the named method does."""
+        nodes = self._place_nodes(method, elem, fragment)
+        self._ids_added(nodes)
+        return nodes
+
+    def _id_allocator(self, kind):
+        """Return the allocator for a kind of ID in _ID_KINDS, made on first use."""
+        allocator = self._id_allocators.get(kind)
+        if allocator is None:
+            allocator = self._id_allocators[kind] = _IdAllocator(
+                self, *self._ID_KINDS[kind]
+            )
+        return allocator
+
+    def _ids_added(self, nodes):
+        """Show the allocators in use the IDs of inserted nodes."""
+        if not self._id_allocators:
+            return
+        elements = self._fragment_elements(nodes)
+        for allocator in self._id_allocators.values():
+            for elem in elements:
+                if self._tag(elem) in allocator.tags:
+                    allocator.add(elem)
+
+    def _place_nodes(self, method, elem, fragment):
+        _, nodes = fragment
+        if method == "append_to":
+            for node in nodes:
+                elem.appendChild(node)
+                self._index_changed(node)
+            return nodes
+
+        parent = elem.parentNode
+        next_sibling = elem.nextSibling if method == "insert_after" else elem
+        for node in nodes:
+            if next_sibling:
+                parent.insertBefore(node, next_sibling)
+            else:
+                parent.appendChild(node)
+            self._index_changed(node)
+        if method == "replace_node":
+            parent.removeChild(elem)
+            self._index_changed(elem, removed_from=parent)
+        return nodes
+
+    # Fragment parsing. Each fragment is parsed inside a wrapper element
+    # declaring the root's namespaces it uses, and fragments that differ from
+    # an earlier one only in attribute values are copied from a template.
+
     def _parse_fragment(self, xml_content):
         """
-        Parse XML fragment and return list of imported nodes.
+        Parse XML fragment into nodes for this document.
 
         Args:
             xml_content: String containing XML fragment
 
         Returns:
-            List of defusedxml.minidom.Node objects imported into this document
+            Tuple of the text before the first node and the list of top-level
+            nodes. minidom keeps text in nodes of its own, so the text is
+            None; LxmlXMLEditor returns text there and in each node's tail.
 
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
+        return self._parse_fragments([xml_content])[0]
+
+    def _parse_fragments(self, contents):
+        """Parse several XML fragments, returning (text, nodes) for each."""
+        results = [None] * len(contents)
+        misses = []
+        for i, xml_content in enumerate(contents):
+            shape = _fragment_shape(xml_content)
+            template = self._fragment_templates.get(shape[0]) if shape else None
+            if template is not None:
+                results[i] = self._fill_template(template, shape[1])
+            else:
+                misses.append((i, xml_content, shape))
+        if not misses:
+            return results
+
+        parsed = None
+        if len(misses) > 1:
+            # One parse for all of them, each in a wrapper of its own
+            try:
+                parsed = self._parse_batch([xml for _, xml, _ in misses])
+            except Exception:
+                # Parse them one by one below, so the error is for the bad one
+                pass
+        if parsed is None:
+            parsed = [
+                self._parse_wrapped(
+                    f"<root {self._namespace_prologue([xml])}>{xml}</root>"
+                )
+                for _, xml, _ in misses
+            ]
+
+        for (i, _, shape), fragment in zip(misses, parsed):
+            text, nodes = fragment
+            elements = [n for n in nodes if self._is_element(n)]
+            assert elements, "Fragment must contain at least one element"
+            if shape and shape[0] not in self._fragment_templates:
+                self._add_template(shape, fragment)
+            results[i] = fragment
+        return results
+
+    def _parse_batch(self, contents):
+        """Parse fragments in one document; None if they don't come out apart."""
+        prologue = self._namespace_prologue(contents)
+        wrappers = "".join(f"<fragment>{xml}</fragment>" for xml in contents)
+        text, nodes = self._parse_wrapped(f"<root {prologue}>{wrappers}</root>")
+        if text or len(nodes) != len(contents):
+            return None
+        if not all(
+            self._is_element(node) and self._tag(node) == "fragment" for node in nodes
+        ):
+            return None
+        return [self._unwrap(node) for node in nodes]
+
+    def _namespace_prologue(self, contents):
+        """Return the root's namespace declarations that fragments may use."""
+        if self._namespace_declarations is None:
+            self._namespace_declarations = self._root_namespace_declarations()
+        used = {None}
+        for xml_content in contents:
+            used.update(_PREFIX_USE.findall(xml_content))
+        return " ".join(
+            declaration
+            for prefix, declaration in self._namespace_declarations.items()
+            if prefix in used
+        )
+
+    def _add_template(self, shape, fragment):
+        """Keep a copy of a parsed fragment for later ones of the same shape."""
+        key, values = shape
+        text, nodes = fragment
+        slots = []
+        found = []
+        for number, elem in enumerate(self._fragment_elements(nodes)):
+            for name, value in self._attributes(elem):
+                slots.append((number, name))
+                found.append(value)
+        if found != values:
+            # The shape's values aren't the parsed attributes, in order
+            template = None
+        else:
+            template = (text, [self._copy_node(node) for node in nodes], slots)
+        if len(self._fragment_templates) >= _MAX_FRAGMENT_TEMPLATES:
+            self._fragment_templates.clear()
+        self._fragment_templates[key] = template
+
+    def _fill_template(self, template, values):
+        """Return a copy of a template fragment with these attribute values."""
+        text, nodes, slots = template
+        nodes = [self._copy_node(node) for node in nodes]
+        elements = self._fragment_elements(nodes)
+        for (number, name), value in zip(slots, values):
+            self._set_attr(elements[number], name, value)
+        return text, nodes
+
+    def _fragment_elements(self, nodes):
+        """Return the elements of a fragment in document order."""
+        elements = []
+        for node in nodes:
+            if self._is_element(node):
+                elements.append(node)
+                elements.extend(self._find_all(node, "*"))
+        return elements
+
+    def _parse_wrapped(self, wrapper):
+        """Parse a wrapper element, returning (text, nodes) of its content."""
         fragment_doc = defusedxml.minidom.parseString(wrapper)
         nodes = [
             self.dom.importNode(child, deep=True)
             for child in fragment_doc.documentElement.childNodes  # type: ignore
         ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
+        return None, nodes
+
+    def _unwrap(self, elem):
+        """Return (text, nodes) of the content of a detached element."""
+        nodes = list(elem.childNodes)
+        for node in nodes:
+            elem.removeChild(node)
+        return None, nodes
+
+    def _root_namespace_declarations(self):
+        """Return the root's namespace declarations by prefix (None: default)."""
+        declarations = {}
+        for attr in self.dom.documentElement.attributes.values():  # type: ignore
+            if attr.name == "xmlns":
+                declarations[None] = f'xmlns="{attr.value}"'
+            elif attr.name.startswith("xmlns:"):
+                declarations[attr.name[len("xmlns:") :]] = f'{attr.name}="{attr.value}"'
+        return declarations
+
+    def _attributes(self, elem):
+        """Return (name, value) for the attributes of elem, in order."""
+        return [
+            (attr.name, attr.value)
+            for attr in elem.attributes.values()
+            if attr.name != "xmlns" and not attr.name.startswith("xmlns:")
+        ]
+
+    def _copy_node(self, node):
+        return node.cloneNode(True)
+
+    # Node access. The lookups above and DocxXMLEditor's tracked-change
+    # methods only touch nodes through these, which LxmlXMLEditor overrides.
+
+    def _root(self):
+        """Return the root element."""
+        return self.dom.documentElement
+
+    def _is_element(self, node):
+        return node.nodeType == node.ELEMENT_NODE
+
+    def _tag(self, elem):
+        """Return the qualified tag name of elem, e.g. "w:p"."""
+        return elem.tagName
+
+    def _line(self, elem):
+        """Return the line elem starts on in the original file, or None."""
+        return getattr(elem, "parse_position", (None,))[0]
+
+    def _parent(self, node):
+        """Return the parent element of node, or None."""
+        parent = node.parentNode
+        if parent is not None and parent.nodeType == parent.ELEMENT_NODE:
+            return parent
+        return None
+
+    def _find_all(self, elem, tag):
+        """Return the descendants of elem with this tag ("*" for all) as a list."""
+        return elem.getElementsByTagName(tag)
+
+    def _get_attr(self, elem, name):
+        """Return the value of attribute name, or "" if elem doesn't have it."""
+        return elem.getAttribute(name)
+
+    def _has_attr(self, elem, name):
+        return elem.hasAttribute(name)
+
+    def _set_attr(self, elem, name, value):
+        elem.setAttribute(name, value)
+
+    def _remove_attr(self, elem, name):
+        elem.removeAttribute(name)
+
+    def _leading_text(self, elem):
+        """Return the text before the first child element of elem, if any."""
+        if elem.firstChild and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE:
+            return elem.firstChild.data
+        return None
+
+    def _create_element(self, tag):
+        """Return a new, detached element."""
+        return self.dom.createElement(tag)
+
+    def _rename(self, elem, tag):
+        """Change the tag of elem, keeping its attributes and children.
+
+        Returns the renamed element, which may be a new node in elem's place.
+        """
+        renamed = self.dom.createElement(tag)
+        # Copy ALL child nodes (not just firstChild) to handle entities
+        while elem.firstChild:
+            renamed.appendChild(elem.firstChild)
+        # Preserve attributes like xml:space
+        for i in range(elem.attributes.length):
+            attr = elem.attributes.item(i)
+            renamed.setAttribute(attr.name, attr.value)
+        elem.parentNode.replaceChild(renamed, elem)
+        return renamed
+
+    def _append_child(self, parent, child):
+        parent.appendChild(child)
+
+    def _prepend_child(self, parent, child):
+        if parent.firstChild:
+            parent.insertBefore(child, parent.firstChild)
+        else:
+            parent.appendChild(child)
+
+    def _wrap(self, elem, wrapper):
+        """Put wrapper in the place of elem and elem inside it."""
+        parent = elem.parentNode
+        parent.insertBefore(wrapper, elem)
+        parent.removeChild(elem)
+        wrapper.appendChild(elem)
+
+    def _move_children(self, source, target, skip_tag=None):
+        """Append the children of source to target, except elements named skip_tag."""
+        for child in list(source.childNodes):
+            if skip_tag is None or child.nodeName != skip_tag:
+                source.removeChild(child)
+                target.appendChild(child)
+
+    def _clone(self, elem):
+        """Return a deep, detached copy of elem."""
+        return elem.cloneNode(True)
+
+    def _to_xml(self, elem):
+        return elem.toxml()
+
+    def _declare_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element unless it is declared."""
+        root = self.dom.documentElement
+        if not root.hasAttribute(f"xmlns:{prefix}"):  # type: ignore
+            root.setAttribute(f"xmlns:{prefix}", uri)  # type: ignore
+            self._namespace_declarations = None
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor on an lxml tree instead of a minidom DOM.
+
+    The API is the same, but nodes are lxml.etree elements: text lives in
+    their .text and .tail, and there is no self.dom. lxml keeps the tree in
+    C, so parsing, lookups and saving take a fraction of minidom's time and
+    memory on large parts. Line numbers come from lxml's sourceline, which
+    for a start tag spanning several lines is the line it ends on.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml.etree._ElementTree
+        root: Its root element
+    """
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file and parse it with lxml.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+
+        with open(self.xml_path, "rb") as f:
+            header = f.read(200).decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+
+        # Entities stay unexpanded and nothing is fetched, as with defusedxml
+        self._parser = lxml.etree.XMLParser(
+            resolve_entities=False, no_network=True, huge_tree=True
+        )
+        # Like the minidom parser, drop the file's comments
+        self.tree = lxml.etree.parse(
+            str(self.xml_path),
+            lxml.etree.XMLParser(
+                resolve_entities=False,
+                no_network=True,
+                huge_tree=True,
+                remove_comments=True,
+            ),
+        )
+        self.root = self.tree.getroot()
+        self._namespaces_changed()
+
+        self._index = None
+        self._index_changes = []
+        self._fragment_templates = {}
+        self._id_allocators = {}
+
+    def _namespaces_changed(self):
+        """Refresh the prefixes used to resolve qualified names."""
+        self._namespaces = dict(self.root.nsmap)
+        self._namespaces["xml"] = "http://www.w3.org/XML/1998/namespace"
+        # (qualified name, is attribute) -> Clark name ("{uri}local")
+        self._clark_names = {}
+        # (Clark name, prefix) -> qualified name
+        self._qualified_names = {}
+        self._namespace_declarations = None
+
+    def _clark(self, name, attribute=False, elem=None):
+        """
+        Return the Clark name ("{uri}local") lxml uses for a qualified name.
+
+        Prefixes resolve against the root element's declarations, then those
+        in scope at elem. Unprefixed tags are in the default namespace,
+        unprefixed attributes in none. Clark names are returned as they are.
+
+        Raises:
+            ValueError: If the prefix is not declared
+        """
+        if name[0] == "{":
+            return name
+        key = (name, attribute)
+        clark = self._clark_names.get(key)
+        if clark is None:
+            prefix, _, local = name.rpartition(":")
+            if prefix:
+                uri = self._namespaces.get(prefix)
+                if uri is None and elem is not None:
+                    uri = elem.nsmap.get(prefix)
+                    if uri is not None:
+                        return f"{{{uri}}}{local}"
+                if uri is None:
+                    raise ValueError(f"Namespace prefix not declared: {prefix}")
+            else:
+                uri = None if attribute else self._namespaces.get(None)
+            clark = self._clark_names[key] = f"{{{uri}}}{local}" if uri else local
+        return clark
+
+    def _place_nodes(self, method, elem, fragment):
+        text, nodes = fragment
+        if method == "append_to":
+            self._append_text(elem, text)
+            for node in nodes:
+                elem.append(node)
+                self._index_changed(node)
+        elif method == "insert_after":
+            # The text after elem ends up after the inserted nodes
+            tail, elem.tail = elem.tail, text
+            previous = elem
+            for node in nodes:
+                previous.addnext(node)
+                self._index_changed(node)
+                previous = node
+            if tail:
+                previous.tail = (previous.tail or "") + tail
+        else:
+            self._insert_before(elem, text, nodes)
+            if method == "replace_node":
+                parent = elem.getparent()
+                # The text after elem stays, as it is a node of its own in minidom
+                tail, elem.tail = elem.tail, None
+                self._insert_text_before(elem, tail)
+                parent.remove(elem)
+                self._index_changed(elem, removed_from=parent)
         return nodes
 
+    def _insert_before(self, elem, text, nodes):
+        self._insert_text_before(elem, text)
+        for node in nodes:
+            # addprevious moves each node's tail along with it
+            elem.addprevious(node)
+            self._index_changed(node)
+
+    def _insert_text_before(self, elem, text):
+        """Add text right before elem, after the text already there."""
+        if text:
+            previous = elem.getprevious()
+            if previous is not None:
+                previous.tail = (previous.tail or "") + text
+            else:
+                parent = elem.getparent()
+                parent.text = (parent.text or "") + text
+
+    def _append_text(self, elem, text):
+        """Add text after the last child of elem."""
+        if text:
+            if len(elem):
+                elem[-1].tail = (elem[-1].tail or "") + text
+            else:
+                elem.text = (elem.text or "") + text
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Writes the same XML declaration minidom does, preserving the original
+        encoding (ascii or utf-8).
+        """
+        content = lxml.etree.tostring(
+            self.tree, encoding=self.encoding, xml_declaration=False
+        )
+        declaration = f'<?xml version="1.0" encoding="{self.encoding}"?>'
+        self.xml_path.write_bytes(declaration.encode("ascii") + content)
+
+    def _parse_wrapped(self, wrapper):
+        wrapper = lxml.etree.fromstring(wrapper, self._parser)
+        # New nodes have no line in the original file
+        for elem in wrapper.iter(lxml.etree.Element):
+            elem.sourceline = 0
+        return wrapper.text, list(wrapper)
+
+    def _unwrap(self, elem):
+        # The nodes move out of elem when they are inserted
+        return elem.text, list(elem)
+
+    def _root_namespace_declarations(self):
+        return {
+            prefix: f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self.root.nsmap.items()
+        }
+
+    def _attributes(self, elem):
+        # Clark names, which _set_attr takes as they are
+        return list(elem.attrib.items())
+
+    def _copy_node(self, node):
+        # Unlike _clone, keeps the tail, which is fragment text
+        return copy.deepcopy(node)
+
+    def _is_attached(self, elem):
+        parent = elem.getparent()
+        while parent is not None:
+            elem, parent = parent, parent.getparent()
+        return elem is self.root
+
+    def _get_element_text(self, elem, text_of=None):
+        text_of = text_of or self._get_element_text
+        text_parts = []
+        if elem.text:
+            text_parts.append(_strip_formatting(elem.text))
+        for child in elem:
+            if isinstance(child.tag, str):
+                text_parts.append(text_of(child))
+            if child.tail:
+                text_parts.append(_strip_formatting(child.tail))
+        return "".join(text_parts)
+
+    def _root(self):
+        return self.root
+
+    def _is_element(self, node):
+        # Comments and processing instructions have a factory function as tag
+        return isinstance(node.tag, str)
+
+    def _tag(self, elem):
+        key = (elem.tag, elem.prefix)
+        name = self._qualified_names.get(key)
+        if name is None:
+            local = elem.tag.rpartition("}")[2]
+            name = f"{elem.prefix}:{local}" if elem.prefix else local
+            self._qualified_names[key] = name
+        return name
+
+    def _line(self, elem):
+        # Nodes inserted from fragments have their sourceline set to 0 (None)
+        return elem.sourceline
+
+    def _parent(self, node):
+        return node.getparent()
+
+    def _find_all(self, elem, tag):
+        if tag == "*":
+            return list(elem.iterdescendants(lxml.etree.Element))
+        try:
+            return list(elem.iterdescendants(self._clark(tag)))
+        except ValueError:
+            # A prefix declared below the root
+            return [
+                child
+                for child in elem.iterdescendants(lxml.etree.Element)
+                if self._tag(child) == tag
+            ]
+
+    def _get_attr(self, elem, name):
+        try:
+            return elem.get(self._clark(name, True, elem), "")
+        except ValueError:
+            return ""
+
+    def _has_attr(self, elem, name):
+        try:
+            return self._clark(name, True, elem) in elem.attrib
+        except ValueError:
+            return False
+
+    def _set_attr(self, elem, name, value):
+        elem.set(self._clark(name, True, elem), value)
+
+    def _remove_attr(self, elem, name):
+        elem.attrib.pop(self._clark(name, True, elem), None)
+
+    def _leading_text(self, elem):
+        return elem.text
+
+    def _create_element(self, tag):
+        # With the root's declarations, so moved-in children keep their
+        # prefixes; lxml drops the redundant ones once the element is inserted
+        return self.root.makeelement(self._clark(tag), nsmap=self.root.nsmap)
+
+    def _rename(self, elem, tag):
+        elem.tag = self._clark(tag, elem=elem)
+        # Like the new element minidom puts in its place, it has no line
+        elem.sourceline = 0
+        return elem
+
+    def _append_child(self, parent, child):
+        parent.append(child)
+
+    def _prepend_child(self, parent, child):
+        child.tail, parent.text = parent.text, None
+        parent.insert(0, child)
+
+    def _wrap(self, elem, wrapper):
+        tail, elem.tail = elem.tail, None
+        elem.addprevious(wrapper)
+        wrapper.append(elem)
+        wrapper.tail = tail
+
+    def _move_children(self, source, target, skip_tag=None):
+        self._append_text(target, source.text)
+        source.text = None
+        for child in list(source):
+            if skip_tag is not None and self._tag(child) == skip_tag:
+                # Text between the children moves with them, as in minidom
+                tail, child.tail = child.tail, None
+                self._append_text(target, tail)
+            else:
+                target.append(child)
+
+    def _clone(self, elem):
+        clone = copy.deepcopy(elem)
+        clone.tail = None
+        return clone
+
+    def _to_xml(self, elem):
+        return lxml.etree.tostring(elem, encoding="unicode")
+
+    def _declare_namespace(self, prefix, uri):
+        if prefix in self.root.nsmap:
+            return
+        # lxml can't add a declaration to an existing element, but the
+        # cleanup can: it declares top_nsmap on the root. The keep list stops
+        # it from dropping declarations it considers unused, which
+        # mc:Ignorable may still refer to, and the new one.
+        prefixes = {prefix}
+        for elem in self.root.iter(lxml.etree.Element):
+            prefixes.update(elem.nsmap)
+        prefixes.discard(None)
+        lxml.etree.cleanup_namespaces(
+            self.root, top_nsmap={prefix: uri}, keep_ns_prefixes=sorted(prefixes)
+        )
+        self._namespaces_changed()
+
+
+# Methods insert_many can apply
+_INSERT_METHODS = ("replace_node", "insert_after", "insert_before", "append_to")
+
+# Fragment shapes kept per editor; the cache starts over when it is full
+_MAX_FRAGMENT_TEMPLATES = 256
+
+# Namespace prefixes of the tags and attributes in a fragment, and some more
+_PREFIX_USE = re.compile(r"[<\s/]([^\s<>/=:\"']+):")
+
+# Start tags (values may contain ">"), and the attributes in one
+_START_TAG = re.compile(r"""<[^!?/](?:[^>"']|"[^"]*"|'[^']*')*>""")
+_ATTRIBUTE = re.compile(r"""(\s[^\s=]+\s*=\s*)(?:"([^"]*)"|'([^']*)')""")
+
+# Values the parser would change: entities and whitespace it normalizes
+_UNSAFE_VALUE = re.compile(r"[&<\t\n\r]")
+
+
+def _fragment_shape(xml_content):
+    """
+    Split an XML fragment into its shape and attribute values.
+
+    The shape is the fragment with its attribute values blanked, except in
+    namespace declarations, so fragments that only differ in values like w:id
+    share one. Returns (shape, values), or None for fragments that are always
+    parsed: those with comments, CDATA or processing instructions, and those
+    with values the parser would change.
+    """
+    if "<!" in xml_content or "<?" in xml_content:
+        return None
+    values = []
+
+    def blank_value(attr):
+        name, double_quoted, single_quoted = attr.groups()
+        if name.lstrip().startswith("xmlns"):
+            return attr.group(0)
+        if double_quoted is not None:
+            values.append(double_quoted)
+            return f'{name}""'
+        values.append(single_quoted)
+        return f"{name}''"
+
+    shape = _START_TAG.sub(
+        lambda tag: _ATTRIBUTE.sub(blank_value, tag.group(0)), xml_content
+    )
+    if any(_UNSAFE_VALUE.search(value) for value in values):
+        return None
+    return shape, values
+
+
+def _strip_formatting(text):
+    """
+    Return text without the whitespace XMLEditor._get_element_text skips.
+
+    minidom's line-tracking parser starts a new text node at every line
+    break, and whitespace-only nodes are skipped as XML formatting. lxml keeps
+    the text between two elements in one string, so drop its whitespace-only
+    lines instead.
+    """
+    if "\n" not in text:
+        return text if text.strip() else ""
+    return "".join(line for line in text.split("\n") if line.strip())
+
+
+def _lookup_error(tag, attrs, line_number, contains, matches):
+    """Return the ValueError for a get_node lookup with no match or several."""
+    if not matches:
+        # Build descriptive error message
+        filters = []
+        if line_number is not None:
+            line_str = (
+                f"lines {line_number.start}-{line_number.stop - 1}"
+                if isinstance(line_number, range)
+                else f"line {line_number}"
+            )
+            filters.append(f"at {line_str}")
+        if attrs is not None:
+            filters.append(f"with attributes {attrs}")
+        if contains is not None:
+            filters.append(f"containing '{contains}'")
+
+        filter_desc = " ".join(filters) if filters else ""
+        base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
+
+        # Add helpful hint based on filters used
+        if contains:
+            hint = "Text may be split across elements or use different wording."
+        elif line_number:
+            hint = "Line numbers may have changed if document was modified."
+        elif attrs:
+            hint = "Verify attribute values are correct."
+        else:
+            hint = "Try adding filters (attrs, line_number, or contains)."
+
+        return ValueError(f"{base_msg}. {hint}")
+    return ValueError(
+        f"Multiple nodes found: <{tag}>. "
+        f"Add more filters (attrs, line_number, or contains) to narrow the search."
+    )
+
+
+def _query_spec(tag, attrs=None, line_number=None, contains=None):
+    """Unpack a get_nodes query, rejecting unknown keys like get_node does."""
+    return tag, attrs, line_number, contains
+
+
+class _MultiPatternMatcher:
+    """
+    Aho-Corasick automaton finding which of several strings occur in a text.
+
+    Scanning a text costs one step per character however many strings are
+    searched for, where checking each string with `in` costs one scan each.
+    """
+
+    def __init__(self, patterns):
+        # Trie of the patterns: per state, its transitions and the patterns
+        # (by number) that end there
+        self.goto = [{}]
+        self.output = [set()]
+        for number, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.output.append(set())
+                state = next_state
+            self.output[state].add(number)
+
+        # Failure links, breadth first: the longest proper suffix of a state
+        # that is also in the trie. Patterns ending there end here too.
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] |= self.output[self.fail[next_state]]
+
+    def search(self, text):
+        """Return the numbers of the patterns occurring in text."""
+        goto, fail, output = self.goto, self.fail, self.output
+        found = set(output[0])  # The empty string occurs in every text
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+# Attributes identifying an element, indexed for get_node(attrs=...)
+_KEY_ATTRIBUTES = ("w:id", "w14:paraId", "w14:textId", "w16cid:durableId", "Id")
+
+
+class _NodeIndex:
+    """
+    Lookup tables for XMLEditor.get_node, built with one walk over the tree.
+
+    Holds the elements by tag, by key attribute value and by original line
+    number, and caches the text content of elements as it is computed. The
+    tables only narrow down candidates: get_node checks them against the
+    live tree, so stale entries are harmless.
+    """
+
+    def __init__(self, editor):
+        self.editor = editor
+        # Dicts used as insertion-ordered sets of elements
+        self.by_tag = {}
+        self.by_attr = {}
+        self.texts = {}
+
+        root = editor._root()
+        elements = [root]
+        elements.extend(editor._find_all(root, "*"))
+        positioned = {}
+        for elem in elements:
+            tag = self.add(elem)
+            line = editor._line(elem)
+            if line is not None:
+                positioned.setdefault(tag, []).append((line, elem))
+
+        # Per tag, line numbers in ascending order and the elements on them
+        self.line_numbers = {}
+        self.line_elements = {}
+        for tag, entries in positioned.items():
+            entries.sort(key=lambda entry: entry[0])
+            self.line_numbers[tag] = [line for line, _ in entries]
+            self.line_elements[tag] = [elem for _, elem in entries]
+
+    def add(self, elem):
+        """Index elem and return its tag."""
+        tag = self.editor._tag(elem)
+        self.by_tag.setdefault(tag, {})[elem] = None
+        for name in _KEY_ATTRIBUTES:
+            value = self.editor._get_attr(elem, name)
+            if value:
+                self.by_attr.setdefault((name, value), {})[elem] = None
+        self.texts.pop(elem, None)
+        return tag
+
+    def discard(self, elem):
+        self.by_tag.get(self.editor._tag(elem), {}).pop(elem, None)
+        for name in _KEY_ATTRIBUTES:
+            value = self.editor._get_attr(elem, name)
+            if value:
+                self.by_attr.get((name, value), {}).pop(elem, None)
+        self.texts.pop(elem, None)
+
+    def update(self, node, removed_from=None):
+        """Apply a change recorded by XMLEditor._index_changed."""
+        editor = self.editor
+        if editor._is_element(node):
+            elements = [node]
+            elements.extend(editor._find_all(node, "*"))
+            for elem in elements:
+                if removed_from is None:
+                    self.add(elem)
+                else:
+                    self.discard(elem)
+        # The text of every ancestor includes the changed node's
+        parent = removed_from if removed_from is not None else editor._parent(node)
+        while parent is not None:
+            self.texts.pop(parent, None)
+            parent = editor._parent(parent)
+
+    def candidates(self, tag, attrs, line_number):
+        """Return the elements that can match, from the most selective table."""
+        if tag == "*":
+            return [elem for elements in self.by_tag.values() for elem in elements]
+        for name, value in (attrs or {}).items():
+            if name in _KEY_ATTRIBUTES and value:
+                return [
+                    elem
+                    for elem in self.by_attr.get((name, value), ())
+                    if self.editor._tag(elem) == tag
+                ]
+        if line_number is not None:
+            lines = (
+                line_number
+                if isinstance(line_number, range)
+                else range(line_number, line_number + 1)
+            )
+            if lines.step == 1:
+                numbers = self.line_numbers.get(tag, [])
+                start = bisect_left(numbers, lines.start)
+                stop = bisect_left(numbers, lines.stop)
+                return self.line_elements.get(tag, [])[start:stop]
+        return list(self.by_tag.get(tag, ()))
+
+    def text(self, elem):
+        """Return the text content of elem, like XMLEditor._get_element_text."""
+        text = self.texts.get(elem)
+        if text is None:
+            text = self.texts[elem] = self.editor._get_element_text(elem, self.text)
+        return text
+
+
+class _IdAllocator:
+    """
+    Numeric IDs for one kind of element, above every one in use.
+
+    Scans the elements once when made; after that the editor shows it the
+    elements it inserts, so peek() and allocate() don't rescan the tree.
+    Like the lookup index, it misses IDs added to the tree directly until
+    invalidate_index() drops it.
+    """
+
+    def __init__(self, editor, tags, attr, prefix, first):
+        self.editor = editor
+        self.tags = tags
+        self.attr = attr
+        self.prefix = prefix
+        self.next_id = first
+        for tag in tags:
+            for elem in editor._get_elements(tag):
+                self.add(elem)
+
+    def add(self, elem):
+        """Take note of the ID of an element in the tree."""
+        value = self.editor._get_attr(elem, self.attr)
+        if value.startswith(self.prefix):
+            try:
+                number = int(value[len(self.prefix) :])
+            except ValueError:
+                return
+            if number >= self.next_id:
+                self.next_id = number + 1
+
+    def peek(self):
+        """Return the next ID without taking it."""
+        return f"{self.prefix}{self.next_id}"
+
+    def allocate(self):
+        """Return the next ID and take it."""
+        allocated = self.peek()
+        self.next_id += 1
+        return allocated
+
 
 def _create_line_tracking_parser():
     """
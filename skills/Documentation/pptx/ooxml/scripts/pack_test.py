@@ -0,0 +1,211 @@
+import tempfile
+import unittest
+import xml.parsers.expat
+import zipfile
+from pathlib import Path
+from unittest import mock
+import defusedxml
+import defusedxml.minidom
+import pack
+from pack import _condense_xml_minidom, condense_xml_string, pretty_xml_string
+
+WORD_DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<!-- leading comment -->
+<?mso-application progid="Word.Document"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+            xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+  <w:body>
+    <!-- comment between paragraphs -->
+    <w:p w14:paraId="1A2B3C4D" xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml">
+      <w:r>
+        <w:t xml:space="preserve">  leading and trailing  </w:t>
+      </w:r>
+      <w:r><w:t>   </w:t></w:r>
+      <w:r><w:t>before<!-- kept inside w:t -->after</w:t></w:r>
+      <w:r><w:t/></w:r>
+    </w:p>
+    <w:p>text <!-- splits --> node&#160;<!-- x -->&#160;<w:r/>tail &amp; more</w:p>
+    <w:p><w:r><w:tab/><w:t>café — \U0001f600 &lt;&gt;&quot;'</w:t></w:r></w:p>
+    <w:p><w:pPr><w:pStyle w:val="a&amp;b &lt;c&gt; &quot;d&quot; 'e' &#10;&#9;ü"/></w:pPr></w:p>
+    <w:sectPr/>
+  </w:body>
+</w:document>
+<!-- trailing comment -->
+"""
+
+DRAWING_PART = """<?xml version="1.0" encoding="UTF-8"?>
+<p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
+  xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">
+  <p:cSld>
+    <mc:AlternateContent><mc:Choice Requires="a"><p:sp/></mc:Choice></mc:AlternateContent>
+    <a:p><a:r><a:t> </a:t></a:r><a:r><a:t>x</a:t></a:r></a:p>
+    <t> unprefixed t is condensed </t>
+    <plain xmlns="urn:default"><inner xmlns="">  </inner><?pi  data ?><?empty?></plain>
+  </p:cSld>
+</p:sld>
+"""
+
+RELATIONSHIPS_PART = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://example.com/t" Target="a.xml"/>'
+    "</Relationships>"
+)
+
+CONTENT_TYPES_PART = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+  <Default Extension="png" ContentType="image/png"/>
+  <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>
+"""
+
+CDATA_PART = """<?xml version="1.0"?>
+<root>
+  <a><![CDATA[ <raw> & ]]></a>
+  <b>  </b>
+</root>
+"""
+
+DOCTYPE_PART = """<?xml version="1.0"?>
+<!DOCTYPE root>
+<root>  <a/>  </root>
+"""
+
+ENTITY_PART = """<?xml version="1.0"?>
+<!DOCTYPE root [<!ENTITY e "expanded">]>
+<root>&e;</root>
+"""
+
+SAMPLES = [WORD_DOCUMENT, DRAWING_PART, RELATIONSHIPS_PART, CDATA_PART, DOCTYPE_PART]
+
+
+def minidom_pretty(content):
+    return defusedxml.minidom.parseString(content).toprettyxml(
+        indent="  ", encoding="ascii"
+    )
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestSerializerMatchesMinidom(unittest.TestCase):
+
+    def test_condense_matches_minidom(self):
+        """Condensing gives byte-identical output to the minidom implementation"""
+        for sample in SAMPLES:
+            with self.subTest(sample=sample[:80]):
+                self.assertEqual(
+                    condense_xml_string(sample), _condense_xml_minidom(sample)
+                )
+
+    def test_pretty_print_matches_minidom(self):
+        """Pretty-printing gives byte-identical output to toprettyxml"""
+        for sample in SAMPLES:
+            with self.subTest(sample=sample[:80]):
+                self.assertEqual(pretty_xml_string(sample), minidom_pretty(sample))
+
+    def test_round_trip_matches_minidom(self):
+        """Unpacking then packing a part matches minidom at every step"""
+        for sample in SAMPLES:
+            with self.subTest(sample=sample[:80]):
+                pretty = pretty_xml_string(sample).decode("ascii")
+                self.assertEqual(pretty, minidom_pretty(sample).decode("ascii"))
+                self.assertEqual(
+                    condense_xml_string(pretty), _condense_xml_minidom(pretty)
+                )
+
+    def test_whitespace_in_t_elements_is_kept(self):
+        """Text and comments inside *:t elements survive condensing"""
+        condensed = condense_xml_string(WORD_DOCUMENT).decode("utf-8")
+        self.assertIn(
+            '<w:t xml:space="preserve">  leading and trailing  </w:t>', condensed
+        )
+        self.assertIn("<w:t>   </w:t>", condensed)
+        self.assertIn("<w:t>before<!-- kept inside w:t -->after</w:t>", condensed)
+        self.assertNotIn("comment between paragraphs", condensed)
+
+    def test_entities_are_rejected(self):
+        """Entity declarations are refused like defusedxml does"""
+        with self.assertRaises(defusedxml.EntitiesForbidden):
+            condense_xml_string(ENTITY_PART)
+        with self.assertRaises(defusedxml.EntitiesForbidden):
+            pretty_xml_string(ENTITY_PART)
+
+    def test_malformed_xml_raises(self):
+        """Malformed documents raise the same expat error as minidom"""
+        with self.assertRaises(xml.parsers.expat.ExpatError):
+            condense_xml_string("<a><b></a>")
+        with self.assertRaises(xml.parsers.expat.ExpatError):
+            pretty_xml_string("<a><b></a>")
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestIncrementalPack(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.input_dir = root / "unpacked"
+        self.output_file = root / "document.docx"
+        self.manifest = root / "manifest.json"
+        parts = {
+            "[Content_Types].xml": CONTENT_TYPES_PART,
+            "word/document.xml": WORD_DOCUMENT,
+            "word/_rels/document.xml.rels": RELATIONSHIPS_PART,
+            "word/media/image1.png": "not really a png " * 100,
+            "docProps/thumbnail.emf": "deflated binary " * 100,
+        }
+        for name, content in parts.items():
+            path = self.input_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def repack(self):
+        """Pack, edit one part, then repack reusing the unchanged members."""
+        pack.pack_document(
+            self.input_dir, self.output_file, manifest_path=self.manifest
+        )
+        document = self.input_dir / "word/document.xml"
+        document.write_text(WORD_DOCUMENT.replace("before", "edited"), encoding="utf-8")
+        pack.pack_document(
+            self.input_dir, self.output_file, manifest_path=self.manifest
+        )
+
+        full_pack = Path(self.temp_dir.name) / "full.docx"
+        pack.pack_document(self.input_dir, full_pack)
+        return self.output_file.read_bytes(), full_pack.read_bytes()
+
+    def check_archive(self):
+        with zipfile.ZipFile(self.output_file) as zf:
+            self.assertIsNone(zf.testzip())
+            self.assertEqual(zf.namelist()[0], "[Content_Types].xml")
+            self.assertIn(b"edited", zf.read("word/document.xml"))
+            self.assertEqual(
+                zf.getinfo("word/media/image1.png").compress_type, zipfile.ZIP_STORED
+            )
+
+    def test_repacked_archive_matches_full_pack(self):
+        """Members copied compressed give a valid archive identical to a full pack"""
+        with mock.patch.object(
+            pack, "_copy_compressed_member", wraps=pack._copy_compressed_member
+        ) as copy:
+            incremental, full = self.repack()
+        self.assertEqual(copy.call_count, 4)
+        with zipfile.ZipFile(self.output_file) as source, zipfile.ZipFile(
+            Path(self.temp_dir.name) / "target.zip", "w"
+        ) as target:
+            self.assertTrue(pack._can_copy_raw(source, target))
+        self.check_archive()
+        self.assertEqual(incremental, full)
+
+    def test_repack_without_zipfile_internals_rewrites_members(self):
+        """Without the zipfile internals the members are written with writestr"""
+        with mock.patch.object(pack, "_can_copy_raw", return_value=False):
+            incremental, full = self.repack()
+        self.check_archive()
+        self.assertEqual(incremental, full)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+"""
+Tests for the redlining validator's paragraph diff and tracked change removal.
+
+Run from this directory:
+    python -m unittest redlining_test
+
+Benchmark tracked change removal on generated documents with 10k of Claude's
+revisions, against the previous (quadratic) implementation:
+    python -m redlining_test benchmark [revisions]
+"""
+
+import random
+import sys
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+import lxml.etree
+
+from validation.redlining import RedliningValidator, _paragraph_word_diff
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def reference_remove_claude_tracked_changes(root):
+    """The previous implementation, kept as a reference for the linear one.
+
+    It ran on xml.etree.ElementTree and unwrapped each w:del with
+    list(parent).index(), which is quadratic in the number of siblings.
+    """
+    ins_tag = f"{{{W}}}ins"
+    del_tag = f"{{{W}}}del"
+    author_attr = f"{{{W}}}author"
+
+    # Remove w:ins elements
+    for parent in root.iter():
+        to_remove = []
+        for child in parent:
+            if child.tag == ins_tag and child.get(author_attr) == "Claude":
+                to_remove.append(child)
+        for elem in to_remove:
+            parent.remove(elem)
+
+    # Unwrap content in w:del elements where author is "Claude"
+    deltext_tag = f"{{{W}}}delText"
+    t_tag = f"{{{W}}}t"
+
+    for parent in root.iter():
+        to_process = []
+        for child in parent:
+            if child.tag == del_tag and child.get(author_attr) == "Claude":
+                to_process.append((child, list(parent).index(child)))
+
+        # Process in reverse order to maintain indices
+        for del_elem, del_index in reversed(to_process):
+            # Convert w:delText to w:t before moving
+            for elem in del_elem.iter():
+                if elem.tag == deltext_tag:
+                    elem.tag = t_tag
+
+            # Move all children of w:del to its parent before removing w:del
+            for child in reversed(list(del_elem)):
+                parent.insert(del_index, child)
+            parent.remove(del_elem)
+
+
+def random_content(rng, depth=0):
+    """Random runs, paragraphs and nested w:ins/w:del by Claude or another author."""
+    parts = []
+    for _ in range(rng.randint(1, 4)):
+        kind = rng.random()
+        if depth < 4 and kind < 0.3:
+            tag = rng.choice(["ins", "del"])
+            author = rng.choice(["Claude", "Bob"])
+            content = random_content(rng, depth + 1)
+            parts.append(f'<w:{tag} w:author="{author}">{content}</w:{tag}>')
+        elif depth < 4 and kind < 0.4:
+            parts.append(f"<w:p>{random_content(rng, depth + 1)}</w:p>")
+        else:
+            tag = rng.choice(["t", "delText"])
+            parts.append(f"<w:r><w:{tag}>x{rng.randint(0, 99)}</w:{tag}></w:r>")
+    return "".join(parts)
+
+
+def wrap_body(body):
+    return f'<w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>'
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestParagraphWordDiff(unittest.TestCase):
+
+    def test_unchanged_text_has_no_diff(self):
+        self.assertEqual(_paragraph_word_diff("p1\np2", "p1\np2"), "")
+
+    def test_changed_paragraph(self):
+        self.assertEqual(
+            _paragraph_word_diff("p1\nold text\np3", "p1\nnew text\np3"),
+            "[-old-]{+new+} text",
+        )
+
+    def test_merged_paragraphs_mark_the_removed_break(self):
+        self.assertEqual(
+            _paragraph_word_diff("p1\np2\np3", "p1 p2\np3"), "p1[-¶-]{+ +}p2"
+        )
+
+    def test_merged_paragraphs_without_separator(self):
+        self.assertEqual(_paragraph_word_diff("ab\ncd", "abcd"), "ab[-¶-]cd")
+
+    def test_split_paragraph(self):
+        self.assertEqual(_paragraph_word_diff("p1 p2\np3", "p1\np2\np3"), "p1[- -]\np2")
+
+    def test_appended_paragraph(self):
+        self.assertEqual(_paragraph_word_diff("p1\np2", "p1\np2\np3"), "{+p3+}")
+
+    def test_removed_paragraph(self):
+        self.assertEqual(_paragraph_word_diff("p1\np2\np3", "p1\np3"), "[-p2-]")
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestRemoveClaudeTrackedChanges(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = RedliningValidator(".", "original.docx")
+
+    def remove_both(self, xml):
+        """Remove Claude's changes with both implementations; return both texts.
+
+        Only the extracted text is compared: the reference iterates the tree
+        while unwrapping, so it can leave a nested w:del of Claude's in place.
+        """
+        reference = ET.fromstring(xml)
+        reference_remove_claude_tracked_changes(reference)
+        root = lxml.etree.fromstring(xml)
+        self.validator._remove_claude_tracked_changes(root)
+        self.assertFalse(self.validator._has_claude_tracked_changes(root), xml)
+        return (
+            self.validator._extract_text_content(reference),
+            self.validator._extract_text_content(root),
+        )
+
+    def test_nested_deletion_inside_deletion(self):
+        xml = wrap_body(
+            '<w:p><w:del w:author="Claude"><w:r><w:delText>a</w:delText></w:r>'
+            '<w:del w:author="Claude"><w:r><w:delText>b</w:delText></w:r></w:del>'
+            "</w:del><w:r><w:t>c</w:t></w:r></w:p>"
+        )
+        self.assertEqual(self.remove_both(xml), ("abc", "abc"))
+
+    def test_insertion_inside_deletion_is_dropped(self):
+        xml = wrap_body(
+            '<w:p><w:del w:author="Claude"><w:r><w:delText>a</w:delText></w:r>'
+            '<w:ins w:author="Claude"><w:r><w:t>b</w:t></w:r></w:ins></w:del></w:p>'
+        )
+        self.assertEqual(self.remove_both(xml), ("a", "a"))
+
+    def test_other_authors_deletions_are_not_restored(self):
+        xml = wrap_body(
+            '<w:p><w:ins w:author="Bob"><w:del w:author="Claude"><w:r>'
+            "<w:delText>a</w:delText></w:r></w:del></w:ins>"
+            '<w:del w:author="Bob"><w:r><w:delText>b</w:delText></w:r></w:del></w:p>'
+        )
+        self.assertEqual(self.remove_both(xml), ("a", "a"))
+
+    def test_random_nested_changes_match_reference(self):
+        rng = random.Random(0)
+        for _ in range(2000):
+            xml = wrap_body(
+                f"<w:p>{random_content(rng)}</w:p><w:p>{random_content(rng)}</w:p>"
+            )
+            reference_text, text = self.remove_both(xml)
+            self.assertEqual(text, reference_text, xml)
+
+
+def generate_revisions(paragraphs, pairs):
+    """A body where each run was replaced by Claude with a w:del/w:ins pair."""
+    body = []
+    for i in range(paragraphs):
+        runs = "".join(
+            f'<w:del w:author="Claude"><w:r><w:delText>w{i}_{j} </w:delText></w:r>'
+            f'</w:del><w:ins w:author="Claude"><w:r><w:t>new{j} </w:t></w:r></w:ins>'
+            for j in range(pairs)
+        )
+        body.append(f"<w:p>{runs}</w:p>")
+    return wrap_body("".join(body))
+
+
+def run_benchmarks(revisions):
+    """Time parsing, tracked change removal and text extraction, as validate() does."""
+    validator = RedliningValidator(".", "original.docx")
+    shapes = [
+        (f"{revisions // 10} paragraphs x 10 del/ins pairs", revisions // 10, 10),
+        (f"1 paragraph x {revisions} del/ins pairs", 1, revisions),
+    ]
+    for name, paragraphs, pairs in shapes:
+        xml = generate_revisions(paragraphs, pairs)
+        timings = {}
+        for label, parse, remove in [
+            ("reference", ET.fromstring, reference_remove_claude_tracked_changes),
+            ("linear", lxml.etree.fromstring, validator._remove_claude_tracked_changes),
+        ]:
+            start = time.perf_counter()
+            root = parse(xml)
+            remove(root)
+            validator._extract_text_content(root)
+            timings[label] = round(time.perf_counter() - start, 2)
+        print(f"{name}: {timings}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["benchmark"]:
+        run_benchmarks(int(sys.argv[2]) if len(sys.argv) > 2 else 10000)
+    else:
+        unittest.main()
@@ -0,0 +1,249 @@
+"""
+Tests for the warm LibreOffice workers.
+
+Run from this directory:
+    python -m unittest soffice_test
+"""
+
+import fcntl
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from soffice import (
+    OfficeError,
+    OfficePool,
+    OfficeTimeout,
+    _process_alive,
+    _Worker,
+    expire_idle_worker,
+    uno,
+)
+
+
+def fake_worker(directory, used_seconds_ago=0):
+    """Record a long-running process as the worker in directory, like _Worker.start.
+
+    Returns the process standing in for soffice and the one standing in for
+    its reaper.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    office = subprocess.Popen(["sleep", "60"], start_new_session=True)
+    reaper = subprocess.Popen(["sleep", "60"], start_new_session=True)
+    worker = _Worker(directory)
+    worker.info_file.write_text(
+        json.dumps({"pid": office.pid, "port": 0, "reaper": reaper.pid}),
+        encoding="utf-8",
+    )
+    worker.touch()
+    used = time.time() - used_seconds_ago
+    os.utime(worker.used_file, (used, used))
+    return office, reaper
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestWorkerLifecycle(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state_dir = Path(self.temp_dir.name)
+        self.processes = []
+
+    def tearDown(self):
+        for process in self.processes:
+            process.kill()
+            process.wait()
+        self.temp_dir.cleanup()
+
+    def start_fake_worker(self, index, used_seconds_ago=0):
+        directory = self.state_dir / f"worker-{index}"
+        processes = fake_worker(directory, used_seconds_ago)
+        self.processes.extend(processes)
+        return directory, processes
+
+    def assertStopped(self, process):
+        self.assertIsNotNone(process.wait(timeout=5))
+
+    def test_idle_worker_is_stopped(self):
+        """The reaper stops a worker that has been unused for the idle timeout"""
+        directory, (office, reaper) = self.start_fake_worker(0, used_seconds_ago=100)
+        expire_idle_worker(directory, office.pid, 10)
+        self.assertStopped(office)
+        self.assertStopped(reaper)
+        self.assertFalse((directory / "worker.json").exists())
+
+    def test_recently_used_worker_is_kept_until_idle(self):
+        """A worker is only stopped once the idle timeout has passed since its last use"""
+        directory, (office, _) = self.start_fake_worker(0)
+        reaper = threading.Thread(
+            target=expire_idle_worker, args=(directory, office.pid, 3)
+        )
+        reaper.start()
+        time.sleep(1.5)
+        self.assertIsNone(office.poll())
+        reaper.join(timeout=10)
+        self.assertFalse(reaper.is_alive())
+        self.assertStopped(office)
+
+    def test_busy_worker_is_kept(self):
+        """A worker whose lock is held by a request is not stopped"""
+        directory, (office, _) = self.start_fake_worker(0, used_seconds_ago=100)
+        lock_file = open(directory / "lock", "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            reaper = threading.Thread(
+                target=expire_idle_worker, args=(directory, office.pid, 1)
+            )
+            reaper.start()
+            time.sleep(2.5)
+            self.assertIsNone(office.poll())
+        finally:
+            lock_file.close()
+        reaper.join(timeout=10)
+        self.assertStopped(office)
+
+    def test_reaper_exits_when_worker_is_replaced(self):
+        """A reaper returns without stopping anything once its soffice is replaced"""
+        directory, (office, _) = self.start_fake_worker(0, used_seconds_ago=100)
+        expire_idle_worker(directory, office.pid + 1, 1)
+        self.assertIsNone(office.poll())
+
+    def test_shutdown_stops_every_worker(self):
+        """shutdown() stops all workers in the state directory, whatever the pool size"""
+        workers = [self.start_fake_worker(index) for index in range(3)]
+        OfficePool(size=1, state_dir=self.state_dir).shutdown()
+        for directory, processes in workers:
+            for process in processes:
+                self.assertStopped(process)
+            self.assertFalse((directory / "worker.json").exists())
+
+    def test_stop_workers_command(self):
+        """soffice.py --stop-workers stops the workers in SOFFICE_POOL_DIR"""
+        directory, (office, reaper) = self.start_fake_worker(0)
+        subprocess.run(
+            [sys.executable, str(Path(__file__).with_name("soffice.py"))]
+            + ["--stop-workers"],
+            env={**os.environ, "SOFFICE_POOL_DIR": str(self.state_dir)},
+            check=True,
+        )
+        self.assertStopped(office)
+        self.assertStopped(reaper)
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+@unittest.skipIf(
+    uno is None or shutil.which("soffice") is None,
+    "needs LibreOffice with its Python-UNO bridge",
+)
+class TestOfficePool(unittest.TestCase):
+    """Runs real conversions on a pool of one worker with its own state directory."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.pool = OfficePool(size=1, state_dir=root / "pool", idle_timeout=0)
+        self.source = root / "note.txt"
+        self.source.write_text("Hello from the worker pool\n", encoding="utf-8")
+        self.output_dir = root / "out"
+        self.output_dir.mkdir()
+
+    def tearDown(self):
+        self.pool.shutdown()
+        self.temp_dir.cleanup()
+
+    def convert(self):
+        output = self.pool.convert(
+            self.source, self.output_dir, "pdf:writer_pdf_Export", timeout=60
+        )
+        self.assertTrue(output.read_bytes().startswith(b"%PDF"))
+        output.unlink()
+
+    def worker_pid(self):
+        return _Worker(self.pool.state_dir / "worker-0")._read_info()["pid"]
+
+    def test_conversion_reuses_the_worker(self):
+        self.convert()
+        pid = self.worker_pid()
+        self.convert()
+        self.assertEqual(self.worker_pid(), pid)
+
+    def test_crashed_worker_is_restarted(self):
+        """A worker killed between requests is restarted by the next request"""
+        self.convert()
+        pid = self.worker_pid()
+        os.killpg(pid, signal.SIGKILL)
+        self.convert()
+        self.assertNotEqual(self.worker_pid(), pid)
+
+    def test_crash_during_request_is_retried(self):
+        """A request whose worker dies mid-request is retried once on a new worker"""
+        pids = []
+
+        def request(desktop):
+            pids.append(self.worker_pid())
+            if len(pids) == 1:
+                os.killpg(pids[0], signal.SIGKILL)
+                time.sleep(0.5)
+            return desktop.getComponents() is not None
+
+        self.assertTrue(self.pool._run(request, timeout=60))
+        self.assertEqual(len(pids), 2)
+        self.assertNotEqual(pids[0], pids[1])
+        self.convert()
+
+    def test_document_failure_is_not_retried(self):
+        """A request failing with its worker alive fails without a retry"""
+        calls = []
+
+        def request(desktop):
+            calls.append(desktop)
+            raise ValueError("broken document")
+
+        with self.assertRaises(OfficeError):
+            self.pool._run(request, timeout=60)
+        self.assertEqual(len(calls), 1)
+
+    def test_timeout_kills_the_worker(self):
+        """A request outliving its timeout raises OfficeTimeout and the worker is replaced"""
+        pid = None
+
+        def request(desktop):
+            nonlocal pid
+            pid = self.worker_pid()
+            deadline = time.monotonic() + 30
+            while time.monotonic() < deadline:
+                desktop.getComponents()  # Fails once the watchdog kills soffice
+                time.sleep(0.1)
+
+        with self.assertRaises(OfficeTimeout):
+            self.pool._run(request, timeout=2)
+        self.assertFalse(_process_alive(pid))
+        self.convert()
+
+    def test_idle_worker_exits(self):
+        """A worker unused for the idle timeout is stopped by its reaper"""
+        self.pool.idle_timeout = 2
+        self.convert()
+        pid = self.worker_pid()
+        deadline = time.monotonic() + 30
+        while _process_alive(pid) and time.monotonic() < deadline:
+            time.sleep(0.5)
+        self.assertFalse(_process_alive(pid))
+
+    def test_shutdown_stops_the_worker(self):
+        self.convert()
+        pid = self.worker_pid()
+        self.pool.shutdown()
+        self.assertFalse(_process_alive(pid))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,29 +1,114 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir> [--jobs N] [--include PATTERN ...]
+
+With --include, only the XML parts matching one of the glob patterns (e.g.
+"word/document.xml" or "ppt/slides/*.xml") are pretty-printed; every other
+part is extracted byte for byte, with no parse cost. pack.py accepts both.
+"""
+
+import argparse
 import random
-import sys
-import defusedxml.minidom
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatchcase
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+from pack import pretty_xml_string
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Unpack an Office file and pretty-print its XML parts"
+    )
+    parser.add_argument("office_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes extracting and pretty-printing (default: 1)",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="PATTERN",
+        help="Only pretty-print XML parts matching this glob, e.g. word/document.xml "
+        "(repeatable; default: all XML parts)",
+    )
+    args = parser.parse_args()
+
+    unpack_document(
+        args.office_file, args.output_dir, jobs=max(1, args.jobs), include=args.include
+    )
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, jobs=1, include=None):
+    """Extract an Office file and pretty-print its XML parts.
+
+    Members are extracted one at a time and each XML part is pretty-printed
+    right after it is written. With jobs > 1 the members are split between
+    worker processes, each reading its share straight from the archive.
+
+    Args:
+        input_file: Path to the Office file
+        output_dir: Directory to unpack into (created if missing)
+        jobs: Number of worker processes (default: 1)
+        include: Glob patterns matched against part names (e.g.
+            "word/document.xml"); only matching XML parts are pretty-printed,
+            the rest are extracted as is. None pretty-prints every XML part.
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(input_file) as zf:
+        # Largest first, so dealing them out round-robin balances the workers
+        members = sorted(zf.infolist(), key=lambda info: info.file_size, reverse=True)
+    names = [info.filename for info in members]
+
+    workers = min(jobs, len(names))
+    if workers > 1:
+        shares = [names[index::workers] for index in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_unpack_members, input_file, output_path, s, include)
+                for s in shares
+            ]
+            for future in futures:
+                future.result()
+    else:
+        _unpack_members(input_file, output_path, names, include)
+
+
+def _unpack_members(input_file, output_path, names, include):
+    """Extract the named members, pretty-printing the selected XML parts."""
+    with zipfile.ZipFile(input_file) as zf:
+        for name in names:
+            # extract() sanitizes the member path the same way extractall() does
+            try:
+                extracted = Path(zf.extract(name, output_path))
+            except FileExistsError:
+                # Another worker created the member's directory between
+                # zipfile's existence check and its makedirs call
+                extracted = Path(zf.extract(name, output_path))
+            if _should_pretty_print(name, include):
+                content = extracted.read_text(encoding="utf-8")
+                extracted.write_bytes(pretty_xml_string(content))
+
+
+def _should_pretty_print(name, include):
+    if not name.endswith((".xml", ".rels")):
+        return False
+    return include is None or any(fnmatchcase(name, pattern) for pattern in include)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,251 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
+import hashlib
+import json
+import multiprocessing
+import os
+import posixpath
 import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
 
 import lxml.etree
 
+from .cache import schemas_fingerprint, xsd_cache_key
+from .package import PackageGraph
+from .report import Issue, ValidationReport, record_issues, timed_check
+from .source import open_part_source
+
+# Compiled XSD schemas shared by every validator in this process
+# Format: resolved schema path -> lxml.etree.XMLSchema
+_SCHEMA_CACHE = {}
+
+
+def _load_schema(schema_path):
+    """Compile an XSD schema once per process and return the shared instance.
+
+    Compiling the main WordprocessingML/PresentationML schemas (and everything
+    they import) is the most expensive step of XSD validation, so every file and
+    every validator reuses the same compiled schema.
+    """
+    schema_path = Path(schema_path).resolve()
+    schema = _SCHEMA_CACHE.get(schema_path)
+    if schema is None:
+        with open(schema_path, "rb") as xsd_file:
+            parser = lxml.etree.XMLParser()
+            xsd_doc = lxml.etree.parse(
+                xsd_file, parser=parser, base_url=str(schema_path)
+            )
+        schema = lxml.etree.XMLSchema(xsd_doc)
+        _SCHEMA_CACHE[schema_path] = schema
+    return schema
+
+
+# XSD errors of original parts, shared by every validator in this process so
+# documents validated against the same original (batch runs, repeated saves)
+# validate each original part once. Least recently used originals are evicted.
+# Format: (validator name, resolved original path, mtime_ns, size) -> {part name: errors}
+_ORIGINAL_ERRORS_CACHE = {}
+_ORIGINAL_ERRORS_CACHE_SIZE = 64
+
+
+def _original_errors_for(validator_name, original_file):
+    """Return the shared part name -> XSD errors dict of an original package."""
+    original_file = Path(original_file).resolve()
+    stat = original_file.stat()
+    key = (validator_name, str(original_file), stat.st_mtime_ns, stat.st_size)
+    # Re-insert on every use so dict order tracks recency
+    errors = _ORIGINAL_ERRORS_CACHE.pop(key, None)
+    if errors is None:
+        errors = {}
+        while len(_ORIGINAL_ERRORS_CACHE) >= _ORIGINAL_ERRORS_CACHE_SIZE:
+            del _ORIGINAL_ERRORS_CACHE[next(iter(_ORIGINAL_ERRORS_CACHE))]
+    _ORIGINAL_ERRORS_CACHE[key] = errors
+    return errors
+
+
+# Validator owned by a process-pool worker, built once by _init_part_worker
+_WORKER_VALIDATOR = None
+
+
+def _init_part_worker(validator_class, args, kwargs):
+    """Build the validator a pool worker uses for all the parts it checks."""
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = validator_class(*args, **kwargs)
+
+
+def _run_part_checks(xml_file):
+    """Run all per-part checks for one file inside a pool worker.
+
+    Returns:
+        tuple: ({check_name: result}, bytes parsed by the worker for this file)
+    """
+    bytes_before = _WORKER_VALIDATOR._bytes_parsed
+    results = {
+        check: _WORKER_VALIDATOR._part_result(check, xml_file)
+        for check in _WORKER_VALIDATOR.PART_CHECKS
+    }
+    return results, _WORKER_VALIDATOR._bytes_parsed - bytes_before
+
+
+# Lowercase local names of qualified (Clark notation) tag and attribute names,
+# shared by every traversal in this process
+# Format: qualified name -> lowercase local name
+_LOCAL_NAMES = {}
+
+
+def _local_name(name):
+    """Return the lowercase local name of a qualified name, memoized."""
+    try:
+        return _LOCAL_NAMES[name]
+    except KeyError:
+        local = _LOCAL_NAMES[name] = name.rpartition("}")[2].lower()
+        return local
+
+
+def _part_sort_key(part_name):
+    """Sort key ordering part names like the paths they name (by path segment)."""
+    return part_name.split("/")
+
+
+def _encode_manifest_value(value):
+    """JSON encoder hook storing Issue objects in the manifest."""
+    if isinstance(value, Issue):
+        return {"__issue__": asdict(value)}
+    raise TypeError(f"Cannot store {type(value).__name__} in the manifest")
+
+
+def _decode_manifest_value(value):
+    """JSON decoder hook restoring Issue objects from the manifest."""
+    if "__issue__" in value:
+        return Issue(**value["__issue__"])
+    return value
+
+
+class StructureRule:
+    """A check run during the single shared traversal of a part.
+
+    Rules list the element tags they handle in TAGS (Clark notation, or None
+    for every element) and receive start and end events for those elements.
+    Attributes are available at the start event; text is only guaranteed
+    complete at the end event. Results must be picklable.
+    """
+
+    # Name of this rule's entry in the _check_part_structure result
+    NAME = None
+
+    # Element tags this rule handles; None handles every element
+    TAGS = None
+
+    def __init__(self, validator, xml_file):
+        self.validator = validator
+        self.xml_file = xml_file
+        self.relative_path = xml_file.relative_to(validator.unpacked_dir)
+        self.errors = []
+
+    @classmethod
+    def applies_to(cls, xml_file):
+        """Return True if this rule should run on the given part."""
+        return True
+
+    def start(self, elem):
+        """Handle the start of an element."""
+
+    def end(self, elem):
+        """Handle the end of an element."""
+
+    def fail(self, error):
+        """Record that the part could not be parsed or traversed."""
+        self.errors.append(
+            Issue(
+                code="parse_error",
+                message=f"Error: {error}",
+                part=str(self.relative_path),
+            )
+        )
+
+    def result(self):
+        """Return the rule's result for this part."""
+        return self.errors
+
+
+class UniqueIdRule(StructureRule):
+    """Check file-scoped ID uniqueness and collect global IDs outside mc:AlternateContent.
+
+    Result: entries in document order, either ("error", message) for file-level
+    violations or ("global", id_value, line, tag) for IDs whose global
+    uniqueness is checked across all parts by validate_unique_ids.
+    """
+
+    NAME = "unique_ids"
+
+    def __init__(self, validator, xml_file):
+        super().__init__(validator, xml_file)
+        self.alternate_content_tag = f"{{{validator.MC_NAMESPACE}}}AlternateContent"
+        self.alternate_content_depth = 0
+        self.file_ids = {}  # Track IDs that must be unique within this file
+        self.requirements = validator._unique_id_lookup
+
+    def start(self, elem):
+        if elem.tag == self.alternate_content_tag:
+            self.alternate_content_depth += 1
+        if self.alternate_content_depth:
+            return
+
+        try:
+            lookup = self.requirements[elem.tag]
+        except KeyError:
+            # Check if this element type has ID uniqueness requirements
+            tag = _local_name(elem.tag)
+            requirement = self.validator.UNIQUE_ID_REQUIREMENTS.get(tag)
+            lookup = (tag, requirement) if requirement else None
+            self.requirements[elem.tag] = lookup
+        if lookup is None:
+            return
+        tag, (attr_name, scope) = lookup
+
+        # Look for the specified attribute, whatever its namespace
+        id_value = None
+        for attr, value in elem.items():
+            if _local_name(attr) == attr_name:
+                id_value = value
+                break
+
+        if id_value is None:
+            return
+        if scope == "global":
+            self.errors.append(("global", id_value, elem.sourceline, tag))
+        elif scope == "file":
+            # Check file-level uniqueness
+            ids = self.file_ids.setdefault((tag, attr_name), {})
+            if id_value in ids:
+                self.errors.append(
+                    (
+                        "error",
+                        Issue(
+                            code="duplicate_id",
+                            message=f"Duplicate {attr_name}='{id_value}' in <{tag}> "
+                            f"(first occurrence at line {ids[id_value]})",
+                            part=str(self.relative_path),
+                            line=elem.sourceline,
+                        ),
+                    )
+                )
+            else:
+                ids[id_value] = elem.sourceline
+
+    def end(self, elem):
+        if elem.tag == self.alternate_content_tag:
+            self.alternate_content_depth -= 1
+
+    def fail(self, error):
+        super().fail(error)
+        self.errors[-1] = ("error", self.errors[-1])
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,275 +343,587 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    # Per-part checks: methods taking one XML file and returning picklable results.
+    # They are run up front for all parts (in parallel when jobs > 1) and their
+    # results are consumed by the validate_* methods.
+    # Subclasses extend this with format-specific per-part checks.
+    PART_CHECKS = (
+        "_check_part_xml",
+        "_check_part_namespaces",
+        "_check_part_structure",
+        "_check_part_xsd",
+        "_check_part_relationship_ids",
+        "_get_part_root_name",
+    )
+
+    # Rules run by _check_part_structure in one traversal of each part
+    # Subclasses extend this with format-specific rules.
+    STRUCTURE_RULES = (UniqueIdRule,)
+
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        jobs=1,
+        manifest_path=None,
+        streaming=False,
+        xsd_cache=None,
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
+        self.jobs = max(1, jobs)
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+
+        # Stream parts with iterparse instead of keeping parsed trees in memory
+        self.streaming = streaming
+
+        # XsdResultCache consulted before validating a part against its schema
+        self.xsd_cache = xsd_cache
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
+        # Read parts from the unpacked directory, or straight from the archive
+        # when unpacked_dir is a .docx/.pptx/.xlsx file. Parts are addressed as
+        # paths under unpacked_dir in both cases.
+        self.source = open_part_source(self.unpacked_dir)
+        self.part_names = self.source.names()
+
         # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            self.unpacked_dir / name
+            for suffix in (".xml", ".rels")
+            for name in self.part_names
+            if name.endswith(suffix)
         ]
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parsed trees shared by all checks, keyed by path
+        # Format: path -> ((mtime_ns, size), tree)
+        self._parsed_trees = {}
+
+        # Original package, opened on first use and read member by member
+        self._original_zip = None
+        self._original_members = {}
+
+        # XSD errors of original parts, keyed by part name; looked up in the
+        # process-wide cache on first use
+        self._original_errors = None
+
+        # Parts, content types and relationships, indexed on first use
+        self._package = None
+
+        # ID requirements by qualified tag, filled from UNIQUE_ID_REQUIREMENTS
+        # as tags are met and shared by the traversals of all parts
+        # Format: qualified tag -> (local lowercase tag, (attr_name, scope)) or None
+        self._unique_id_lookup = {}
+
+        # Results of per-part checks
+        # Format: (check_name, path) -> result
+        self._part_results = {}
+
+        # Content fingerprints of parts, used as manifest keys
+        # Format: path -> hex digest
+        self._fingerprints = {}
+
+        # Structured results of the checks run so far
+        self.report = ValidationReport(type(self).__name__)
+        self._current_check = None
+        self._bytes_parsed = 0
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    @timed_check
+    def run_part_checks(self):
+        """Run every per-part check for every XML file up front.
+
+        With a manifest, results of parts whose content is unchanged since the
+        last run are loaded from it, only the remaining parts are checked, and
+        the manifest is rewritten. Cross-part checks (global IDs, content types,
+        relationships) always rerun, but they work from the per-part results.
+
+        With jobs > 1, parts are fanned out to a process pool and each worker runs
+        all per-part checks on a part after a single parse. Results are stored in
+        file order, so reported errors are identical to a sequential run.
+        Without a manifest and with jobs == 1 this is a no-op and checks run lazily.
+        """
+        if self.manifest_path is not None:
+            self._load_manifest()
+
+        pending = [f for f in self.xml_files if not self._has_part_results(f)]
+        if self.jobs > 1 and len(pending) >= 2:
+            self._run_part_checks_in_pool(pending)
+        elif self.manifest_path is not None:
+            for xml_file in pending:
+                for check in self.PART_CHECKS:
+                    self._part_result(check, xml_file)
+
+        if self.manifest_path is not None:
+            self._save_manifest()
+
+    def _run_part_checks_in_pool(self, pending):
+        """Run all per-part checks for the pending files in a process pool."""
+        # Forked workers inherit schemas compiled here instead of each compiling them
+        if multiprocessing.get_start_method() == "fork":
+            for xml_file in pending:
+                schema_path = self._get_schema_path(
+                    xml_file.relative_to(self.unpacked_dir)
+                )
+                if schema_path:
+                    _load_schema(schema_path)
+
+        workers = min(self.jobs, len(pending))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_part_worker,
+            initargs=self._worker_init_args(),
+        ) as executor:
+            chunksize = max(1, len(pending) // (workers * 8))
+            for xml_file, (results, bytes_parsed) in zip(
+                pending,
+                executor.map(_run_part_checks, pending, chunksize=chunksize),
+            ):
+                self._bytes_parsed += bytes_parsed
+                for check, result in results.items():
+                    self._part_results[(check, xml_file)] = result
+
+    def _part_fingerprint(self, xml_file):
+        """Hash a part together with the inputs its per-part checks read.
+
+        The r:id check also reads the part's .rels file, so it is hashed in.
+        """
+        if xml_file not in self._fingerprints:
+            part_name = self._part_name(xml_file)
+            digest = hashlib.sha256(self.source.read(part_name))
+            rels_part = PackageGraph.rels_part_for(part_name)
+            if xml_file.suffix != ".rels" and rels_part in self.source:
+                digest.update(b"\0")
+                digest.update(self.source.read(rels_part))
+            self._fingerprints[xml_file] = digest.hexdigest()
+        return self._fingerprints[xml_file]
+
+    def _manifest_header(self):
+        """Return the manifest fields that must match for cached results to apply."""
+        stat = self.original_file.stat()
+        return {
+            "format": 2,
+            "validator": type(self).__name__,
+            "checks": list(self.PART_CHECKS),
+            "original": [
+                str(self.original_file.resolve()),
+                stat.st_mtime_ns,
+                stat.st_size,
+            ],
+        }
+
+    def _load_manifest(self):
+        """Seed per-part results from the manifest for parts whose content is unchanged.
+
+        A missing, unreadable or outdated manifest is ignored.
+        """
+        try:
+            manifest = json.loads(
+                self.manifest_path.read_text(encoding="utf-8"),
+                object_hook=_decode_manifest_value,
+            )
+        except (OSError, ValueError):
+            return
+        header = self._manifest_header()
+        if not isinstance(manifest, dict) or any(
+            manifest.get(key) != value for key, value in header.items()
+        ):
+            return
+
+        parts = manifest.get("parts", {})
+        for xml_file in self.xml_files:
+            entry = parts.get(xml_file.relative_to(self.unpacked_dir).as_posix())
+            if not entry or entry["fingerprint"] != self._part_fingerprint(xml_file):
+                continue
+            for check in self.PART_CHECKS:
+                self._part_results.setdefault(
+                    (check, xml_file), entry["results"][check]
+                )
+
+    def _save_manifest(self):
+        """Write the fingerprint and per-part results of every part to the manifest.
+
+        Format: {"validator", "checks", "original", "parts": {part name:
+        {"fingerprint": hex digest, "results": {check_name: result}}}}
+        """
+        manifest = self._manifest_header()
+        manifest["parts"] = {
+            xml_file.relative_to(self.unpacked_dir).as_posix(): {
+                "fingerprint": self._part_fingerprint(xml_file),
+                "results": {
+                    check: self._part_results[(check, xml_file)]
+                    for check in self.PART_CHECKS
+                },
+            }
+            for xml_file in self.xml_files
+        }
+
+        # Write atomically so an interrupted save never leaves a torn manifest
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps(manifest, default=_encode_manifest_value), encoding="utf-8"
+        )
+        os.replace(tmp_path, self.manifest_path)
+
+    def _worker_init_args(self):
+        """Return (validator_class, args, kwargs) for building pool worker validators."""
+        return (
+            type(self),
+            (self.unpacked_dir, self.original_file),
+            {"streaming": self.streaming, "xsd_cache": self.xsd_cache},
+        )
+
+    def _has_part_results(self, xml_file):
+        """Check whether all per-part checks already have results for a file."""
+        return all(
+            (check, xml_file) in self._part_results for check in self.PART_CHECKS
+        )
+
+    def _part_result(self, check, xml_file):
+        """Return the result of a per-part check, computing it if needed."""
+        key = (check, xml_file)
+        if key not in self._part_results:
+            self._part_results[key] = getattr(self, check)(xml_file)
+        return self._part_results[key]
+
+    @property
+    def package(self):
+        """The PackageGraph of the unpacked package, built on first use."""
+        if self._package is None:
+            self._package = PackageGraph(
+                self.part_names,
+                lambda part_name: self._parse_xml(self.unpacked_dir / part_name),
+            )
+        return self._package
+
+    def _part_name(self, xml_file):
+        """Return the part name ("word/document.xml") of a path under unpacked_dir."""
+        return Path(xml_file).relative_to(self.unpacked_dir).as_posix()
+
+    def _parse_xml(self, xml_file):
+        """Parse an XML file once and share the tree across all checks.
+
+        The cached tree is re-parsed when the file's modification time or size
+        changes. Callers must treat the returned tree as read-only.
+        In streaming mode nothing is cached and every call parses the file.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        xml_file = Path(xml_file)
+        part_name = self._part_name(xml_file)
+        if self.streaming:
+            self._bytes_parsed += self.source.size(part_name)
+            return self.source.parse(part_name)
+
+        signature = self.source.signature(part_name)
+
+        cached = self._parsed_trees.get(xml_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        tree = self.source.parse(part_name)
+        self._bytes_parsed += self.source.size(part_name)
+        self._parsed_trees[xml_file] = (signature, tree)
+        return tree
+
+    def _iter_part_events(self, xml_file):
+        """Yield (event, element) start and end events for every element of a part.
+
+        Normally this walks the shared parsed tree. In streaming mode the file is
+        read with iterparse and each element is cleared once its end event has
+        been handled, so memory stays bounded by the subtree currently open.
+        Consumers must read attributes at the start event and text at the end
+        event, and must not keep references to elements.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        if not self.streaming:
+            root = self._parse_xml(xml_file).getroot()
+            yield from lxml.etree.iterwalk(root, events=("start", "end"))
+            return
+
+        part_name = self._part_name(xml_file)
+        self._bytes_parsed += self.source.size(part_name)
+        with self.source.open(part_name) as f:
+            for event, elem in lxml.etree.iterparse(f, events=("start", "end")):
+                yield event, elem
+                if event == "end":
+                    elem.clear(keep_tail=True)
+                    # Drop already processed siblings still referenced by the parent
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+
+    def _part_root(self, xml_file):
+        """Return a part's root element with its attributes and namespace map.
+
+        In streaming mode only the root start tag is read, so the root has no
+        children and errors later in the file are not detected.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the root start tag is not well-formed
+        """
+        if not self.streaming:
+            return self._parse_xml(xml_file).getroot()
+
+        with self.source.open(self._part_name(xml_file)) as f:
+            for _, elem in lxml.etree.iterparse(f, events=("start",)):
+                return elem
+
+    @timed_check
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+            errors.extend(self._part_result("_check_part_xml", xml_file))
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             return False
         else:
             if self.verbose:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    def _check_part_xml(self, xml_file):
+        """Return well-formedness errors for a single XML file."""
+        try:
+            # Try to parse the XML file
+            if self.streaming:
+                for _ in self._iter_part_events(xml_file):
+                    pass
+            else:
+                self._parse_xml(xml_file)
+        except lxml.etree.XMLSyntaxError as e:
+            return [
+                Issue(
+                    code="xml_syntax",
+                    message=e.msg,
+                    part=str(xml_file.relative_to(self.unpacked_dir)),
+                    line=e.lineno,
+                )
+            ]
+        except Exception as e:
+            return [
+                Issue(
+                    code="error",
+                    message=f"Unexpected error: {str(e)}",
+                    part=str(xml_file.relative_to(self.unpacked_dir)),
+                )
+            ]
+        return []
+
+    @timed_check
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+            errors.extend(self._part_result("_check_part_namespaces", xml_file))
 
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             return False
         if self.verbose:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    def _check_part_namespaces(self, xml_file):
+        """Return undeclared Ignorable namespace prefixes for a single XML file."""
+        errors = []
+        try:
+            root = self._part_root(xml_file)
+        except lxml.etree.XMLSyntaxError:
+            return errors
+        declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+
+        for attr_val in [v for k, v in root.attrib.items() if k.endswith("Ignorable")]:
+            undeclared = set(attr_val.split()) - declared
+            errors.extend(
+                Issue(
+                    code="undeclared_ignorable_namespace",
+                    message=f"Namespace '{ns}' in Ignorable but not declared",
+                    part=str(xml_file.relative_to(self.unpacked_dir)),
+                )
+                for ns in undeclared
+            )
+        return errors
+
+    @timed_check
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+            structure = self._part_result("_check_part_structure", xml_file)
+            for entry in structure[UniqueIdRule.NAME]:
+                if entry[0] == "error":
+                    errors.append(entry[1])
+                    continue
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                # Check global uniqueness
+                _, id_value, line, tag = entry
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        Issue(
+                            code="duplicate_global_id",
+                            message=f"Global ID '{id_value}' in <{tag}> "
+                            f"already used in {prev_file} at line {prev_line} in <{prev_tag}>",
+                            part=str(xml_file.relative_to(self.unpacked_dir)),
+                            line=line,
+                        )
+                    )
+                else:
+                    global_ids[id_value] = (
+                        xml_file.relative_to(self.unpacked_dir),
+                        line,
+                        tag,
                     )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             return False
         else:
             if self.verbose:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _check_part_structure(self, xml_file):
+        """Run every applicable structure rule over a part in a single traversal.
+
+        Returns:
+            dict: Rule NAME -> rule result, for the rules that apply to the part
+        """
+        rules = [
+            rule_class(self, xml_file)
+            for rule_class in self.STRUCTURE_RULES
+            if rule_class.applies_to(xml_file)
+        ]
+
+        try:
+            self._walk_structure(self._iter_part_events(xml_file), rules)
+        except Exception as e:
+            for rule in rules:
+                rule.fail(e)
+
+        return {rule.NAME: rule.result() for rule in rules}
+
+    def _walk_structure(self, events, rules):
+        """Dispatch (event, element) start/end events to the rules."""
+        # Format: event -> (handlers for every element, {tag: [handlers]})
+        dispatch = {"start": ([], {}), "end": ([], {})}
+        for rule in rules:
+            for event in dispatch:
+                # Only register handlers the rule actually overrides
+                if getattr(type(rule), event) is getattr(StructureRule, event):
+                    continue
+                handler = getattr(rule, event)
+                every, by_tag = dispatch[event]
+                if rule.TAGS is None:
+                    every.append(handler)
+                else:
+                    for tag in rule.TAGS:
+                        by_tag.setdefault(tag, []).append(handler)
+
+        # Handlers per (event, tag), combined once so each event is a single lookup
+        combined = {}
+        for event, elem in events:
+            try:
+                handlers = combined[event, elem.tag]
+            except KeyError:
+                every, by_tag = dispatch[event]
+                handlers = combined[event, elem.tag] = every + by_tag.get(elem.tag, [])
+            for handler in handlers:
+                handler(elem)
+
+    @timed_check
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
         """
         errors = []
+        package = self.package
 
-        # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
-
-        if not rels_files:
+        if not package.rels_parts:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
-
-        # Track all files that are referenced by any .rels file
-        all_referenced_files = set()
+        # Get all files in the package (excluding reference files)
+        all_files = [
+            part
+            for part in package.parts
+            if posixpath.basename(part) != "[Content_Types].xml"
+            and not part.endswith(".rels")
+        ]
 
         if self.verbose:
             print(
-                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
+                f"Found {len(package.rels_parts)} .rels files and {len(all_files)} target files"
             )
 
         # Check each .rels file
-        for rels_file in rels_files:
-            try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
+        for rels_part in package.rels_parts:
+            if rels_part in package.rels_errors:
+                e = package.rels_errors[rels_part]
+                errors.append(
+                    Issue(
+                        code="parse_error",
+                        message=f"Error parsing {rels_part}: {e}",
+                        part=rels_part,
+                        text=f"  Error parsing {rels_part}: {e}",
+                    )
+                )
+                continue
 
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
+            # Report targets that do not resolve to a file (external URLs are skipped)
+            for rel in package.relationships[rels_part]:
+                if rel.target_part is not None and rel.target_part not in package:
+                    errors.append(
+                        Issue(
+                            code="broken_reference",
+                            message=f"Broken reference to {rel.target}",
+                            part=rels_part,
+                            line=rel.line,
                         )
-
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+                    )
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
-        unreferenced_files = set(all_files) - all_referenced_files
+        unreferenced_files = [
+            part for part in all_files if part not in package.references
+        ]
 
         if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+            for unref_rel_path in sorted(unreferenced_files, key=_part_sort_key):
+                errors.append(
+                    Issue(
+                        code="unreferenced_file",
+                        message=f"Unreferenced file: {unref_rel_path}",
+                        part=unref_rel_path,
+                        text=f"  Unreferenced file: {unref_rel_path}",
+                    )
+                )
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             print(
                 "CRITICAL: These errors will cause the document to appear corrupt. "
                 + "Broken references MUST be fixed, "
@@ -385,103 +937,115 @@ class BaseSchemaValidator:
                 )
             return True
 
+    @timed_check
     def validate_all_relationship_ids(self):
         """
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
-        # Process each XML file that might contain r:id references
         for xml_file in self.xml_files:
-            # Skip .rels files themselves
-            if xml_file.suffix == ".rels":
-                continue
+            errors.extend(self._part_result("_check_part_relationship_ids", xml_file))
 
-            # Determine the corresponding .rels file
-            # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
+        if errors:
+            print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
+            record_issues(self, errors)
+            print("\nThese ID mismatches will cause the document to appear corrupt!")
+            return False
+        else:
+            if self.verbose:
+                print("PASSED - All relationship ID references are valid")
+            return True
 
-            # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
-                continue
+    def _check_part_relationship_ids(self, xml_file):
+        """Return r:id reference errors for a single XML file and its .rels file."""
+        errors = []
 
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
+        # Skip .rels files themselves
+        if xml_file.suffix == ".rels":
+            return errors
 
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+        part_name = xml_file.relative_to(self.unpacked_dir).as_posix()
+        package = self.package
+
+        # Skip if there's no corresponding .rels file (that's okay)
+        if package.rels_part_for(part_name) not in package:
+            return errors
+
+        try:
+            # Valid relationship IDs and their types, from the part's .rels file
+            relationships = package.relationships_from(part_name)
+            rid_to_type = {}
+
+            for rel in relationships:
+                rid = rel.id
+                rel_type = rel.type
+                if rid:
+                    # Check for duplicate rIds
+                    if rid in rid_to_type:
+                        errors.append(
+                            Issue(
+                                code="duplicate_relationship_id",
+                                message=f"Duplicate relationship ID '{rid}' (IDs must be unique)",
+                                part=rel.rels_part,
+                                line=rel.line,
                             )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
                         )
+                    # Extract just the type name from the full URL
+                    type_name = rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                    rid_to_type[rid] = type_name
 
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
+            # Find all elements with r:id attributes
+            for event, elem in self._iter_part_events(xml_file):
+                if event != "start":
+                    continue
+                # Check for r:id attribute (relationship ID)
+                rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
+                if rid_attr:
+                    xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+                    elem_name = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+
+                    # Check if the ID exists
+                    if rid_attr not in rid_to_type:
+                        errors.append(
+                            Issue(
+                                code="missing_relationship",
+                                message=f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})",
+                                part=str(xml_rel_path),
+                                line=elem.sourceline,
                             )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
+                        )
+                    # Check if we have type expectations for this element
+                    elif self.ELEMENT_RELATIONSHIP_TYPES:
+                        expected_type = self._get_expected_relationship_type(elem_name)
+                        if expected_type:
+                            actual_type = rid_to_type[rid_attr]
+                            # Check if the actual type matches or contains the expected type
+                            if expected_type not in actual_type.lower():
+                                errors.append(
+                                    Issue(
+                                        code="relationship_type_mismatch",
+                                        message=f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                        f"but should point to a '{expected_type}' relationship",
+                                        part=str(xml_rel_path),
+                                        line=elem.sourceline,
                                     )
+                                )
 
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+        except Exception as e:
+            xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+            errors.append(
+                Issue(
+                    code="error",
+                    message=f"Error processing {xml_rel_path}: {e}",
+                    part=str(xml_rel_path),
+                    text=f"  Error processing {xml_rel_path}: {e}",
+                )
+            )
 
-        if errors:
-            print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
-            for error in errors:
-                print(error)
-            print("\nThese ID mismatches will cause the document to appear corrupt!")
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All relationship ID references are valid")
-            return True
+        return errors
 
     def _get_expected_relationship_type(self, element_name):
         """
@@ -519,37 +1083,23 @@ class BaseSchemaValidator:
 
         return None
 
+    @timed_check
     def validate_content_types(self):
         """Validate that all content files are properly declared in [Content_Types].xml."""
         errors = []
+        package = self.package
 
         # Find [Content_Types].xml file
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        if "[Content_Types].xml" not in package:
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
-            # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
-
-            # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            # Get all declared parts and extensions
+            if package.content_types_error is not None:
+                raise package.content_types_error
+            declared_parts = package.overrides
+            declared_extensions = package.defaults
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -575,10 +1125,6 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
-
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
                 path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
@@ -592,44 +1138,53 @@ class BaseSchemaValidator:
                 ):
                     continue
 
-                try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
+                root_name = self._part_result("_get_part_root_name", xml_file)
+                if root_name is None:
+                    continue  # Skip unparseable files
 
-                    if root_name in declarable_roots and path_str not in declared_parts:
-                        errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                if root_name in declarable_roots and path_str not in declared_parts:
+                    errors.append(
+                        Issue(
+                            code="undeclared_content_type",
+                            message=f"File with <{root_name}> root not declared in [Content_Types].xml",
+                            part=path_str,
                         )
-
-                except Exception:
-                    continue  # Skip unparseable files
+                    )
 
             # Check all non-XML files for Default extension declarations
-            for file_path in all_files:
+            for relative_path in package.parts:
                 # Skip XML files and metadata files (already checked above)
-                if file_path.suffix.lower() in {".xml", ".rels"}:
+                extension = posixpath.splitext(relative_path)[1].lstrip(".").lower()
+                if extension in {"xml", "rels"}:
                     continue
-                if file_path.name == "[Content_Types].xml":
-                    continue
-                if "_rels" in file_path.parts or "docProps" in file_path.parts:
+                segments = relative_path.split("/")
+                if "_rels" in segments or "docProps" in segments:
                     continue
 
-                extension = file_path.suffix.lstrip(".").lower()
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                            Issue(
+                                code="undeclared_extension",
+                                message=f'File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>',
+                                part=relative_path,
+                            )
                         )
 
         except Exception as e:
-            errors.append(f"  Error parsing [Content_Types].xml: {e}")
+            errors.append(
+                Issue(
+                    code="parse_error",
+                    message=f"Error parsing [Content_Types].xml: {e}",
+                    part="[Content_Types].xml",
+                    text=f"  Error parsing [Content_Types].xml: {e}",
+                )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} content type declaration errors:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             return False
         else:
             if self.verbose:
@@ -638,6 +1193,14 @@ class BaseSchemaValidator:
                 )
             return True
 
+    def _get_part_root_name(self, xml_file):
+        """Return the local name of a file's root element, or None if unparseable."""
+        try:
+            root_tag = self._part_root(xml_file).tag
+        except Exception:
+            return None
+        return root_tag.split("}")[-1] if "}" in root_tag else root_tag
+
     def validate_file_against_xsd(self, xml_file, verbose=False):
         """Validate a single XML file against XSD schema, comparing with original.
 
@@ -685,18 +1248,18 @@ class BaseSchemaValidator:
                 )
             return True, set()
 
+    @timed_check
     def validate_against_xsd(self):
         """Validate XML files against XSD schemas, showing only new errors compared to original."""
         new_errors = []
+        issues = []  # Every new error, including those not shown
         original_error_count = 0
         valid_count = 0
         skipped_count = 0
 
         for xml_file in self.xml_files:
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
+            is_valid, new_file_errors = self._part_result("_check_part_xsd", xml_file)
 
             if is_valid is None:
                 skipped_count += 1
@@ -711,8 +1274,12 @@ class BaseSchemaValidator:
                 continue
 
             # Has new errors
+            issues.extend(
+                Issue(code="xsd", message=error, part=relative_path)
+                for error in new_file_errors
+            )
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in new_file_errors[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -732,12 +1299,23 @@ class BaseSchemaValidator:
             print("\nFAILED - Found NEW validation errors:")
             for error in new_errors:
                 print(error)
+            record_issues(self, issues, echo=False)
             return False
         else:
             if self.verbose:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _check_part_xsd(self, xml_file):
+        """Validate a single XML file against its XSD schema for validate_against_xsd.
+
+        Returns:
+            tuple: (is_valid, new_errors) with new_errors sorted so the reported
+                errors do not depend on set ordering in worker processes
+        """
+        is_valid, new_errors = self.validate_file_against_xsd(xml_file, verbose=False)
+        return is_valid, sorted(new_errors)
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -763,13 +1341,11 @@ class BaseSchemaValidator:
         return None
 
     def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        """Remove attributes and elements not in allowed namespaces, in place."""
+        root = xml_doc.getroot()
 
         # Remove attributes not in allowed namespaces
-        for elem in xml_copy.iter():
+        for elem in root.iter():
             attrs_to_remove = []
 
             for attr in elem.attrib:
@@ -784,9 +1360,9 @@ class BaseSchemaValidator:
                 del elem.attrib[attr]
 
         # Remove elements not in allowed namespaces
-        self._remove_ignorable_elements(xml_copy)
+        self._remove_ignorable_elements(root)
 
-        return lxml.etree.ElementTree(xml_copy)
+        return xml_doc
 
     def _remove_ignorable_elements(self, root):
         """Recursively remove all elements not in allowed namespaces."""
@@ -825,28 +1401,79 @@ class BaseSchemaValidator:
 
     def _validate_single_file_xsd(self, xml_file, base_path):
         """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
-        schema_path = self._get_schema_path(xml_file)
-        if not schema_path:
+        relative_path = Path(xml_file).relative_to(base_path)
+        if not self._get_schema_path(relative_path):
             return None, None  # Skip file
 
+        # Parts identical to one validated before (in any document) hit the cache
+        cache_key = None
+        if self.xsd_cache is not None:
+            content = self.source.read(relative_path.as_posix())
+            cache_key = self._xsd_cache_key(content, relative_path)
+            cached = self.xsd_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            xml_doc = self._parse_xml(xml_file)
+        except Exception as e:
+            return False, {str(e)}
+
+        # In streaming mode the tree is private to this call, so preprocess it in place
+        is_valid, errors = self._validate_doc_xsd(
+            xml_doc, relative_path, in_place=self.streaming
+        )
+        if cache_key is not None:
+            self.xsd_cache.put(cache_key, is_valid, errors)
+        return is_valid, errors
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+    def _xsd_cache_key(self, content, relative_path):
+        """Return the XSD cache key of a part's raw content.
 
+        Preprocessing is a pure function of the content, whether the part is in
+        a main content folder and the allowed namespaces, so hashing those
+        inputs identifies the preprocessed document without building it.
+        """
+        schema_path = self._get_schema_path(relative_path)
+        schema_id = "{}@{}".format(
+            schema_path.relative_to(self.schemas_dir).as_posix(),
+            schemas_fingerprint(self.schemas_dir),
+        )
+        clean_namespaces = bool(
+            relative_path.parts and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+        )
+        preprocessing = json.dumps(
+            [clean_namespaces, self.MC_NAMESPACE, sorted(self.OOXML_NAMESPACES)]
+        )
+        return xsd_cache_key(content, schema_id, preprocessing)
+
+    def _validate_doc_xsd(self, xml_doc, relative_path, in_place=False):
+        """Validate a parsed XML document against the schema for its part path.
+
+        Args:
+            xml_doc: Parsed lxml ElementTree
+            relative_path: Path of the part inside the package, used to pick the schema
+            in_place: If True, preprocess xml_doc itself instead of a copy; the
+                caller must not use the tree afterwards
+
+        Returns:
+            tuple: (is_valid, errors_set) where is_valid is True/False/None (skipped)
+        """
+        schema_path = self._get_schema_path(relative_path)
+        if not schema_path:
+            return None, None  # Skip file
+
+        try:
+            # Load schema (compiled once per process)
+            schema = _load_schema(schema_path)
+
+            # Preprocess XML, copying the root element once if the tree is shared
+            if not in_place:
+                xml_doc = lxml.etree.ElementTree(copy.deepcopy(xml_doc.getroot()))
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
             # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
             if (
                 relative_path.parts
                 and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
@@ -866,45 +1493,87 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    def _read_original_part(self, part_name):
+        """Read a single part from the original package without extracting it.
+
+        The original archive is opened once per validator and kept open.
+
+        Args:
+            part_name: Part path relative to the package root (e.g. "word/document.xml")
+
+        Returns:
+            bytes: Part contents, or None if the part is not in the original package
+        """
+        if self._original_zip is None:
+            self._original_zip = zipfile.ZipFile(self.original_file, "r")
+            # Normalize member names the same way extraction would
+            self._original_members = {
+                info.filename.replace("\\", "/").lstrip("/"): info
+                for info in self._original_zip.infolist()
+                if not info.is_dir()
+            }
+
+        info = self._original_members.get(str(part_name).replace("\\", "/"))
+        if info is None:
+            return None
+        return self._original_zip.read(info)
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        The part is streamed straight from the original archive and its error set
+        is memoized for the whole process, so each part of an unchanged original
+        is validated at most once, however many validators compare against it.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        relative_path = xml_file.relative_to(self.unpacked_dir.resolve())
+        part_name = relative_path.as_posix()
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        if self._original_errors is None:
+            self._original_errors = _original_errors_for(
+                type(self).__name__, self.original_file
+            )
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        if part_name not in self._original_errors:
+            content = self._read_original_part(part_name)
 
-            if not original_xml_file.exists():
+            if content is None:
                 # File didn't exist in original, so no original errors
-                return set()
+                errors = set()
+            else:
+                cache_key = cached = None
+                if self.xsd_cache is not None and self._get_schema_path(relative_path):
+                    cache_key = self._xsd_cache_key(content, relative_path)
+                    cached = self.xsd_cache.get(cache_key)
+
+                if cached is not None:
+                    _, errors = cached
+                else:
+                    # Validate the specific file in original
+                    try:
+                        self._bytes_parsed += len(content)
+                        xml_doc = lxml.etree.ElementTree(lxml.etree.fromstring(content))
+                        is_valid, errors = self._validate_doc_xsd(
+                            xml_doc, relative_path, in_place=True
+                        )
+                        if cache_key is not None:
+                            self.xsd_cache.put(cache_key, is_valid, errors)
+                    except Exception as e:
+                        errors = {str(e)}
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+            self._original_errors[part_name] = errors if errors else set()
+
+        return self._original_errors[part_name]
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
-        """Remove template tags from XML text nodes and collect warnings.
+        """Remove template tags from XML text nodes in place and collect warnings.
 
         Template tags follow the pattern {{ ... }} and are used as placeholders
         for content replacement. They should be removed from text content before
@@ -916,10 +1585,6 @@ class BaseSchemaValidator:
         warnings = []
         template_pattern = re.compile(r"\{\{[^}]*\}\}")
 
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
         def process_text_content(text, content_type):
             if not text:
                 return text
@@ -933,7 +1598,7 @@ class BaseSchemaValidator:
             return text
 
         # Process all text nodes in the document
-        for elem in xml_copy.iter():
+        for elem in xml_doc.getroot().iter():
             # Skip processing if this is a w:t element
             if not hasattr(elem, "tag") or callable(elem.tag):
                 continue
@@ -944,7 +1609,7 @@ class BaseSchemaValidator:
             elem.text = process_text_content(elem.text, "text content")
             elem.tail = process_text_content(elem.tail, "tail content")
 
-        return lxml.etree.ElementTree(xml_copy), warnings
+        return xml_doc, warnings
 
 
 if __name__ == "__main__":
@@ -0,0 +1,143 @@
+"""
+Persistent, content-addressed cache of XSD validation results.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Bump when XSD preprocessing or the entry layout changes, so stale entries miss
+CACHE_FORMAT = 1
+
+# Content hashes of schema directories, computed once per process
+# Format: resolved schemas dir -> hex digest
+_SCHEMAS_FINGERPRINTS = {}
+
+# Bytes written to each cache directory by this process since its size was
+# last checked, shared by all XsdResultCache instances
+# Format: cache dir -> bytes
+_WRITTEN_BYTES = {}
+
+
+def default_cache_dir():
+    """Return the cache directory used when none is given (under XDG_CACHE_HOME)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ooxml-validation" / "xsd"
+
+
+def schemas_fingerprint(schemas_dir):
+    """Hash every schema file, so edited schemas never hit results of old ones.
+
+    Copies of the same schemas (such as the docx and pptx trees) share a hash.
+    """
+    schemas_dir = Path(schemas_dir).resolve()
+    if schemas_dir not in _SCHEMAS_FINGERPRINTS:
+        digest = hashlib.sha256()
+        for path in sorted(schemas_dir.rglob("*.xsd")):
+            digest.update(path.relative_to(schemas_dir).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+        _SCHEMAS_FINGERPRINTS[schemas_dir] = digest.hexdigest()
+    return _SCHEMAS_FINGERPRINTS[schemas_dir]
+
+
+def xsd_cache_key(content, schema_id, preprocessing):
+    """Return the cache key of validating a part against a schema.
+
+    Args:
+        content: Raw bytes of the part
+        schema_id: Identity of the schema, including a fingerprint of its files
+        preprocessing: Everything besides content that changes the preprocessed
+            document (flags, allowed namespaces)
+    """
+    digest = hashlib.sha256()
+    for field in (str(CACHE_FORMAT), schema_id, preprocessing):
+        digest.update(field.encode())
+        digest.update(b"\0")
+    digest.update(content)
+    return digest.hexdigest()
+
+
+class XsdResultCache:
+    """XSD results stored as small JSON files, one per key, shared across processes.
+
+    Entries live in cache_dir/<first two hex digits>/<key>.json and are written
+    atomically, so concurrent validators (pool workers, batch runs) can share a
+    directory without locking. Reading an entry refreshes its modification
+    time. Once the directory grows past max_bytes, the least recently used
+    entries are evicted.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """Return the cached (is_valid, errors_set) for key, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            result = bool(entry["valid"]), set(entry["errors"])
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return result
+
+    def put(self, key, is_valid, errors):
+        """Store the result of validating the content behind key.
+
+        Failures to write are ignored; the cache is only an optimization.
+        """
+        path = self._entry_path(key)
+        data = json.dumps({"valid": is_valid, "errors": sorted(errors or ())})
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        written = _WRITTEN_BYTES.get(self.cache_dir, 0) + len(data)
+        if written >= self.max_bytes // 16:
+            written = 0
+            self.evict()
+        _WRITTEN_BYTES[self.cache_dir] = written
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in 90% of max_bytes."""
+        entries = []
+        total = 0
+        try:
+            buckets = list(os.scandir(self.cache_dir))
+        except OSError:
+            return
+        for bucket in buckets:
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * 9 // 10
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
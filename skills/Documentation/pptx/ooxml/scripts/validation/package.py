@@ -0,0 +1,158 @@
+"""
+Index of the parts, content types and relationships of a package.
+"""
+
+import posixpath
+from dataclasses import dataclass
+
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+
+@dataclass
+class Relationship:
+    """A Relationship element of a .rels part.
+
+    target_part is the part name the target resolves to, whether or not that
+    part exists. It is None for external (http, mailto:) and empty targets.
+    """
+
+    rels_part: str
+    id: str | None
+    type: str
+    target: str
+    target_part: str | None
+    line: int | None
+
+
+class PackageGraph:
+    """Parts, content types and relationships of a package.
+
+    Built once from the file listing, [Content_Types].xml and every .rels part,
+    so that cross-part checks query it instead of globbing and parsing .rels
+    files on their own. Part names are relative POSIX paths such as
+    "word/document.xml". Parts are listed in directory-walk order, which is the
+    order the checks report errors in.
+    """
+
+    def __init__(self, parts, parse_part):
+        """
+        Args:
+            parts: Names of all parts of the package, in walk order
+            parse_part: Callable returning the lxml tree of a part name
+        """
+        # All files of the package, in walk order
+        self.parts = list(parts)
+        self._part_set = set(self.parts)
+
+        # .rels parts in walk order and their relationships in document order
+        # Format: rels part name -> [Relationship, ...]
+        self.rels_parts = [part for part in self.parts if part.endswith(".rels")]
+        self.relationships = {}
+
+        # Exceptions raised while parsing .rels parts
+        # Format: rels part name -> exception
+        self.rels_errors = {}
+
+        # Reverse references: relationships pointing at each existing part
+        # Format: part name -> [Relationship, ...]
+        self.references = {}
+
+        for rels_part in self.rels_parts:
+            try:
+                self.relationships[rels_part] = self._read_relationships(
+                    rels_part, parse_part
+                )
+            except Exception as e:
+                self.rels_errors[rels_part] = e
+                continue
+            for rel in self.relationships[rels_part]:
+                if rel.target_part in self._part_set:
+                    self.references.setdefault(rel.target_part, []).append(rel)
+
+        # Content type declarations of [Content_Types].xml
+        # Format: part name (without leading "/") -> content type
+        self.overrides = {}
+        # Format: lowercase extension -> content type
+        self.defaults = {}
+        self.content_types_error = None
+        if CONTENT_TYPES_PART in self._part_set:
+            try:
+                self._read_content_types(parse_part)
+            except Exception as e:
+                self.content_types_error = e
+
+    def __contains__(self, part_name):
+        return part_name in self._part_set
+
+    @staticmethod
+    def rels_part_for(part_name):
+        """Return the name of the .rels part holding a part's relationships.
+
+        For dir/file.xml it's dir/_rels/file.xml.rels.
+        """
+        directory, name = posixpath.split(part_name)
+        return posixpath.join(directory, "_rels", f"{name}.rels")
+
+    def relationships_from(self, part_name):
+        """Return the relationships of a part, or None if it has no .rels part.
+
+        Raises:
+            Exception: The error raised while parsing the part's .rels part
+        """
+        rels_part = self.rels_part_for(part_name)
+        if rels_part in self.rels_errors:
+            raise self.rels_errors[rels_part]
+        return self.relationships.get(rels_part)
+
+    def _read_relationships(self, rels_part, parse_part):
+        """Parse a .rels part into Relationship records with resolved targets."""
+        root = parse_part(rels_part).getroot()
+
+        # Targets of the root .rels are relative to the package root; others are
+        # relative to the parent of their _rels folder
+        # e.g., word/_rels/document.xml.rels -> targets relative to word/
+        if posixpath.basename(rels_part) == ".rels":
+            base_dir = ""
+        else:
+            base_dir = posixpath.dirname(posixpath.dirname(rels_part))
+
+        relationships = []
+        for rel in root.findall(
+            f".//{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+        ):
+            target = rel.get("Target") or ""
+            target_part = None
+            if target and not target.startswith(("http", "mailto:")):
+                target_part = posixpath.normpath(posixpath.join(base_dir, target))
+            relationships.append(
+                Relationship(
+                    rels_part=rels_part,
+                    id=rel.get("Id"),
+                    type=rel.get("Type", ""),
+                    target=target,
+                    target_part=target_part,
+                    line=rel.sourceline,
+                )
+            )
+        return relationships
+
+    def _read_content_types(self, parse_part):
+        """Collect the Override and Default declarations of [Content_Types].xml."""
+        root = parse_part(CONTENT_TYPES_PART).getroot()
+
+        # Override declarations (specific files)
+        for override in root.findall(f".//{{{CONTENT_TYPES_NAMESPACE}}}Override"):
+            part_name = override.get("PartName")
+            if part_name is not None:
+                self.overrides[part_name.lstrip("/")] = override.get("ContentType")
+
+        # Default declarations (by extension)
+        for default in root.findall(f".//{{{CONTENT_TYPES_NAMESPACE}}}Default"):
+            extension = default.get("Extension")
+            if extension is not None:
+                self.defaults[extension.lower()] = default.get("ContentType")
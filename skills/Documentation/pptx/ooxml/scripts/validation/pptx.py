@@ -2,9 +2,47 @@
 Validator for PowerPoint presentation XML files against XSD schemas.
 """
 
+import posixpath
 import re
 
-from .base import BaseSchemaValidator
+from .base import BaseSchemaValidator, StructureRule
+from .report import Issue, record_issues, timed_check
+
+# Whether each qualified attribute name is an ID attribute (local name ending
+# in "id"), shared by every traversal in this process
+# Format: qualified attribute name -> bool
+_ID_ATTRIBUTES = {}
+
+
+class UuidIdRule(StructureRule):
+    """ID attributes that look like UUIDs must contain only hex values."""
+
+    NAME = "uuid_ids"
+
+    def start(self, elem):
+        validator = self.validator
+        for attr, value in elem.items():
+            # Check if this is an ID attribute
+            try:
+                is_id = _ID_ATTRIBUTES[attr]
+            except KeyError:
+                is_id = _ID_ATTRIBUTES[attr] = (
+                    attr.split("}")[-1].lower().endswith("id")
+                )
+            # Values shorter than 32 characters can't hold the 32 hex digits
+            if is_id and len(value) >= 32:
+                # Check if value looks like a UUID (has the right length and pattern structure)
+                if validator._looks_like_uuid(value):
+                    # Validate that it contains only hex characters in the right positions
+                    if not validator.UUID_PATTERN.match(value):
+                        self.errors.append(
+                            Issue(
+                                code="invalid_uuid",
+                                message=f"ID '{value}' appears to be a UUID but contains invalid hex characters",
+                                part=str(self.relative_path),
+                                line=elem.sourceline,
+                            )
+                        )
 
 
 class PPTXSchemaValidator(BaseSchemaValidator):
@@ -25,8 +63,18 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         "tablestyleid": "tablestyles",
     }
 
+    # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
+    UUID_PATTERN = re.compile(
+        r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+    )
+
+    # PowerPoint-specific rules, run in the same traversal as the base rules
+    STRUCTURE_RULES = BaseSchemaValidator.STRUCTURE_RULES + (UuidIdRule,)
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
+        self.run_part_checks()
+
         # Test 0: XML well-formedness
         if not self.validate_xml():
             return False
@@ -74,44 +122,18 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         return all_valid
 
+    @timed_check
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
-        import lxml.etree
-
         errors = []
-        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
-        uuid_pattern = re.compile(
-            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
-        )
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Check all elements for ID attributes
-                for elem in root.iter():
-                    for attr, value in elem.attrib.items():
-                        # Check if this is an ID attribute
-                        attr_name = attr.split("}")[-1].lower()
-                        if attr_name == "id" or attr_name.endswith("id"):
-                            # Check if value looks like a UUID (has the right length and pattern structure)
-                            if self._looks_like_uuid(value):
-                                # Validate that it contains only hex characters in the right positions
-                                if not uuid_pattern.match(value):
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
-                                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            structure = self._part_result("_check_part_structure", xml_file)
+            errors.extend(structure[UuidIdRule.NAME])
 
         if errors:
             print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             return False
         else:
             if self.verbose:
@@ -125,14 +147,18 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         # Check if it's 32 hex-like characters (could include invalid hex chars)
         return len(clean_value) == 32 and all(c.isalnum() for c in clean_value)
 
+    @timed_check
     def validate_slide_layout_ids(self):
         """Validate that sldLayoutId elements in slide masters reference valid slide layouts."""
-        import lxml.etree
-
         errors = []
+        package = self.package
 
         # Find all slide master files
-        slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
+        slide_masters = [
+            part
+            for part in package.parts
+            if posixpath.dirname(part) == "ppt/slideMasters" and part.endswith(".xml")
+        ]
 
         if not slide_masters:
             if self.verbose:
@@ -142,29 +168,27 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = self._parse_xml(self.unpacked_dir / slide_master).getroot()
 
                 # Find the corresponding _rels file for this slide master
-                rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
+                rels_part = package.rels_part_for(slide_master)
 
-                if not rels_file.exists():
+                if rels_part not in package:
                     errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                        Issue(
+                            code="missing_relationships_file",
+                            message=f"Missing relationships file: {rels_part}",
+                            part=slide_master,
+                        )
                     )
                     continue
 
-                # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
                 # Build a set of valid relationship IDs that point to slide layouts
-                valid_layout_rids = set()
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "slideLayout" in rel_type:
-                        valid_layout_rids.add(rel.get("Id"))
+                valid_layout_rids = {
+                    rel.id
+                    for rel in package.relationships_from(slide_master)
+                    if "slideLayout" in rel.type
+                }
 
                 # Find all sldLayoutId elements in the slide master
                 for sld_layout_id in root.findall(
@@ -177,20 +201,27 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                     if r_id and r_id not in valid_layout_rids:
                         errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                            f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
-                            f"references r:id='{r_id}' which is not found in slide layout relationships"
+                            Issue(
+                                code="invalid_slide_layout_id",
+                                message=f"sldLayoutId with id='{layout_id}' "
+                                f"references r:id='{r_id}' which is not found in slide layout relationships",
+                                part=slide_master,
+                                line=sld_layout_id.sourceline,
+                            )
                         )
 
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
+            except Exception as e:
                 errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
+                    Issue(
+                        code="error",
+                        message=f"Error: {e}",
+                        part=slide_master,
+                    )
                 )
 
         if errors:
             print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             print(
                 "Remove invalid references or add missing slide layouts to the relationships file."
             )
@@ -200,55 +231,70 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slide layout IDs reference valid slide layouts")
             return True
 
+    def _slide_rels_parts(self):
+        """Return the names of the slides' .rels parts (ppt/slides/_rels/*.xml.rels)."""
+        return [
+            part
+            for part in self.package.rels_parts
+            if posixpath.dirname(part) == "ppt/slides/_rels"
+            and part.endswith(".xml.rels")
+        ]
+
+    @timed_check
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        package = self.package
 
-        for rels_file in slide_rels_files:
+        for rels_file in self._slide_rels_parts():
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                if rels_file in package.rels_errors:
+                    raise package.rels_errors[rels_file]
 
                 # Find all slideLayout relationships
                 layout_rels = [
                     rel
-                    for rel in root.findall(
-                        f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                    )
-                    if "slideLayout" in rel.get("Type", "")
+                    for rel in package.relationships[rels_file]
+                    if "slideLayout" in rel.type
                 ]
 
                 if len(layout_rels) > 1:
                     errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                        Issue(
+                            code="duplicate_slide_layout",
+                            message=f"has {len(layout_rels)} slideLayout references",
+                            part=rels_file,
+                        )
                     )
 
             except Exception as e:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    Issue(
+                        code="error",
+                        message=f"Error: {e}",
+                        part=rels_file,
+                    )
                 )
 
         if errors:
             print("FAILED - Found slides with duplicate slideLayout references:")
-            for error in errors:
-                print(error)
+            record_issues(self, errors)
             return False
         else:
             if self.verbose:
                 print("PASSED - All slides have exactly one slideLayout reference")
             return True
 
+    @timed_check
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
-        import lxml.etree
-
         errors = []
+        issues = []  # One per error, without the per-slide detail lines
         notes_slide_references = {}  # Track which slides reference each notesSlide
+        package = self.package
 
         # Find all slide relationship files
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = self._slide_rels_parts()
 
         if not slide_rels_files:
             if self.verbose:
@@ -257,23 +303,20 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         for rels_file in slide_rels_files:
             try:
-                # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                if rels_file in package.rels_errors:
+                    raise package.rels_errors[rels_file]
 
                 # Find all notesSlide relationships
-                for rel in root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "notesSlide" in rel_type:
-                        target = rel.get("Target", "")
+                for rel in package.relationships[rels_file]:
+                    if "notesSlide" in rel.type:
+                        target = rel.target
                         if target:
                             # Normalize the target path to handle relative paths
                             normalized_target = target.replace("../", "")
 
                             # Track which slide references this notesSlide
-                            slide_name = rels_file.stem.replace(
-                                ".xml", ""
+                            slide_name = posixpath.basename(rels_file).replace(
+                                ".xml.rels", ""
                             )  # e.g., "slide1"
 
                             if normalized_target not in notes_slide_references:
@@ -282,20 +325,27 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                                 (slide_name, rels_file)
                             )
 
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            except Exception as e:
+                issue = Issue(
+                    code="error",
+                    message=f"Error: {e}",
+                    part=rels_file,
                 )
+                errors.append(str(issue))
+                issues.append(issue)
 
         # Check for duplicate references
         for target, references in notes_slide_references.items():
             if len(references) > 1:
                 slide_names = [ref[0] for ref in references]
-                errors.append(
-                    f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
+                issue = Issue(
+                    code="duplicate_notes_slide_reference",
+                    message=f"Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}",
                 )
+                errors.append(str(issue))
+                issues.append(issue)
                 for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
+                    errors.append(f"    - {rels_file}")
 
         if errors:
             print(
@@ -303,6 +353,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             )
             for error in errors:
                 print(error)
+            record_issues(self, issues, echo=False)
             print("Each slide may optionally have its own slide file.")
             return False
         else:
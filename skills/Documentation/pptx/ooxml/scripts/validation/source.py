@@ -0,0 +1,112 @@
+"""
+Part sources: read package parts from an unpacked directory or straight from the archive.
+"""
+
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+
+class DirectorySource:
+    """Parts of a package unpacked to a directory."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def names(self):
+        """Return the part names (relative POSIX paths) in directory-walk order."""
+        return [
+            path.relative_to(self.root).as_posix()
+            for path in self.root.rglob("*")
+            if path.is_file()
+        ]
+
+    def __contains__(self, name):
+        return (self.root / name).is_file()
+
+    def signature(self, name):
+        """Return a value that changes whenever the part's content changes."""
+        stat = (self.root / name).stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def size(self, name):
+        return (self.root / name).stat().st_size
+
+    def open(self, name):
+        """Open a part for reading in binary mode."""
+        return open(self.root / name, "rb")
+
+    def read(self, name):
+        return (self.root / name).read_bytes()
+
+    def parse(self, name):
+        """Parse a part into an lxml ElementTree.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the part is not well-formed
+        """
+        return lxml.etree.parse(str(self.root / name))
+
+
+class ZipSource:
+    """Parts of a package read straight from its zip archive, without extracting it.
+
+    Members are decompressed on demand, so streaming consumers never hold a
+    whole part in memory.
+    """
+
+    def __init__(self, archive):
+        self.archive = Path(archive)
+        self._zip = zipfile.ZipFile(self.archive, "r")
+        # Normalize member names the same way extraction would
+        # Format: part name -> ZipInfo
+        self._members = {
+            info.filename.replace("\\", "/").lstrip("/"): info
+            for info in self._zip.infolist()
+            if not info.is_dir()
+        }
+
+    def names(self):
+        """Return the part names in archive order."""
+        return list(self._members)
+
+    def __contains__(self, name):
+        return name in self._members
+
+    def signature(self, name):
+        """Return a value that changes whenever the part's content changes."""
+        info = self._members[name]
+        return info.CRC, info.file_size
+
+    def size(self, name):
+        return self._members[name].file_size
+
+    def open(self, name):
+        """Open a part for reading; the member is decompressed as it is read."""
+        return self._zip.open(self._members[name])
+
+    def read(self, name):
+        return self._zip.read(self._members[name])
+
+    def parse(self, name):
+        """Parse a part into an lxml ElementTree.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the part is not well-formed
+        """
+        with self.open(name) as f:
+            return lxml.etree.parse(f)
+
+
+def open_part_source(path):
+    """Return the part source for a package: a ZipSource for an archive file
+    (.docx, .pptx, .xlsx), a DirectorySource for an unpacked directory.
+
+    Raises:
+        zipfile.BadZipFile: If path is a file but not a zip archive
+    """
+    path = Path(path)
+    if path.is_file():
+        return ZipSource(path)
+    return DirectorySource(path)
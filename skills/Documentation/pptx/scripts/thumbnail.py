@@ -50,6 +50,10 @@ from inventory import extract_text_inventory
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
 
+# The warm LibreOffice workers live with the skill's ooxml scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ooxml.scripts.soffice import OfficeError, convert_document
+
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
 CONVERSION_DPI = 100  # DPI for PDF to image conversion
@@ -212,24 +216,11 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
-
     # Convert to PDF
     print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
+    try:
+        pdf_path = convert_document(pptx_path, temp_dir, "pdf:impress_pdf_Export")
+    except OfficeError:
         raise RuntimeError("PDF conversion failed")
 
     # Convert PDF to images
@@ -11,6 +11,7 @@ import os
 import platform
 from pathlib import Path
 from openpyxl import load_workbook
+from soffice import OfficeError, OfficeTimeout, get_office_pool
 
 
 def setup_libreoffice_macro():
@@ -50,22 +51,20 @@ def setup_libreoffice_macro():
         return False
 
 
-def recalc(filename, timeout=30):
-    """
-    Recalculate formulas in Excel file and report any errors
-    
-    Args:
-        filename: Path to Excel file
-        timeout: Maximum time to wait for recalculation (seconds)
-    
-    Returns:
-        dict with error locations and counts
-    """
-    if not Path(filename).exists():
-        return {'error': f'File {filename} does not exist'}
-    
-    abs_path = str(Path(filename).absolute())
-    
+def recalc_with_worker(pool, abs_path, timeout):
+    """Recalculate and save the file on a warm LibreOffice worker (no macro needed)"""
+    try:
+        pool.recalculate(abs_path, timeout)
+    except OfficeTimeout:
+        # The worker was killed mid-recalculation, so nothing was saved
+        return {'error': f'Recalculation did not finish within {timeout} seconds'}
+    except OfficeError as e:
+        return {'error': str(e) or 'Unknown error during recalculation'}
+    return None
+
+
+def recalc_with_subprocess(abs_path, timeout):
+    """Recalculate and save the file with a one-shot soffice running the macro"""
     if not setup_libreoffice_macro():
         return {'error': 'Failed to setup LibreOffice macro'}
     
@@ -98,6 +97,33 @@ def recalc(filename, timeout=30):
         else:
             return {'error': error_msg}
     
+    return None
+
+
+def recalc(filename, timeout=30):
+    """
+    Recalculate formulas in Excel file and report any errors
+    
+    Args:
+        filename: Path to Excel file
+        timeout: Maximum time to wait for recalculation (seconds)
+    
+    Returns:
+        dict with error locations and counts
+    """
+    if not Path(filename).exists():
+        return {'error': f'File {filename} does not exist'}
+    
+    abs_path = str(Path(filename).absolute())
+    
+    pool = get_office_pool()
+    if pool is not None:
+        error = recalc_with_worker(pool, abs_path, timeout)
+    else:
+        error = recalc_with_subprocess(abs_path, timeout)
+    if error:
+        return error
+    
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
         wb = load_workbook(filename, data_only=True)
@@ -0,0 +1,509 @@
+"""
+Warm LibreOffice workers shared by the scripts that convert or recalculate documents.
+
+Starting LibreOffice dominates a one-shot `soffice --headless --convert-to`
+run. When LibreOffice's Python-UNO bridge is importable, requests go to a
+small pool of headless soffice processes listening on local UNO sockets.
+Workers are started on first use and left running, so later runs of any
+script connect to an instance that is already warm. Each worker has its own
+profile, port and lock file under the state directory:
+
+- A request takes the first idle worker. When all are busy it queues on a
+  worker's lock (an flock, so queueing works across processes).
+- Before each request the worker is health-checked (process alive, UNO
+  connection answers) and restarted if needed.
+- A request that outlives its timeout gets its worker killed; a worker that
+  crashes mid-request is restarted and the request retried once.
+- A worker left unused for the idle timeout exits: a small reaper process,
+  started along with it, stops it once no request has used it for that long.
+- `python soffice.py --stop-workers` (or OfficePool.shutdown()) stops every
+  worker right away, after the requests they are running.
+
+Without the bridge, or with SOFFICE_POOL_SIZE=0, every request runs a
+one-shot soffice subprocess instead.
+
+Environment:
+    SOFFICE_POOL_SIZE: Number of workers (default: 2)
+    SOFFICE_POOL_DIR: State directory (default: $XDG_STATE_HOME/soffice-pool)
+    SOFFICE_POOL_IDLE_TIMEOUT: Seconds an unused worker is kept running;
+        0 keeps workers until they are stopped (default: 600)
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:  # Only LibreOffice's Python (or python3-uno) has the bridge
+    uno = None
+
+DEFAULT_POOL_SIZE = 2
+
+# Seconds an unused worker is kept running before its reaper stops it
+DEFAULT_IDLE_TIMEOUT = 600
+
+# Seconds a cold soffice may take to accept UNO connections
+START_TIMEOUT = 60
+
+# Seconds a running worker has to answer the health check
+HEALTH_CHECK_TIMEOUT = 2
+
+# The shared pool, created on first use
+_POOL = None
+
+
+class OfficeError(Exception):
+    """A LibreOffice request failed."""
+
+
+class OfficeTimeout(OfficeError):
+    """A LibreOffice request did not finish in time."""
+
+
+def default_state_dir():
+    """Return the directory holding the workers' profiles, ports and locks."""
+    if os.environ.get("SOFFICE_POOL_DIR"):
+        return Path(os.environ["SOFFICE_POOL_DIR"])
+    state_home = os.environ.get("XDG_STATE_HOME") or Path.home() / ".local" / "state"
+    return Path(state_home) / "soffice-pool"
+
+
+def _int_from_environment(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def get_office_pool():
+    """Return the shared pool, or None when it can't be used.
+
+    The pool needs the UNO bridge and soffice on the PATH, and is disabled by
+    SOFFICE_POOL_SIZE=0.
+    """
+    global _POOL
+    if _POOL is None:
+        size = _int_from_environment("SOFFICE_POOL_SIZE", DEFAULT_POOL_SIZE)
+        if uno is None or size <= 0 or shutil.which("soffice") is None:
+            return None
+        idle_timeout = _int_from_environment(
+            "SOFFICE_POOL_IDLE_TIMEOUT", DEFAULT_IDLE_TIMEOUT
+        )
+        _POOL = OfficePool(size, idle_timeout=idle_timeout)
+    return _POOL
+
+
+def convert_document(input_path, output_dir, convert_to, timeout=None):
+    """Convert a document like `soffice --convert-to <convert_to> --outdir <output_dir>`.
+
+    Uses a warm worker when the pool is available, a one-shot soffice
+    otherwise.
+
+    Args:
+        input_path: Path to the document to convert
+        output_dir: Directory to write the converted file to
+        convert_to: "<extension>:<filter name>", e.g. "html:HTML" or
+            "pdf:impress_pdf_Export"
+        timeout: Seconds to wait for the conversion, or None to wait forever
+
+    Returns:
+        Path: The converted file, output_dir/<input stem>.<extension>
+
+    Raises:
+        FileNotFoundError: If soffice is not installed
+        OfficeTimeout: If the conversion did not finish in time
+        OfficeError: If no output was produced; the message is soffice's
+            error output, if any
+    """
+    pool = get_office_pool()
+    if pool is not None:
+        return pool.convert(input_path, output_dir, convert_to, timeout)
+
+    extension = convert_to.partition(":")[0]
+    output_path = Path(output_dir) / f"{Path(input_path).stem}.{extension}"
+    try:
+        result = subprocess.run(
+            [
+                "soffice",
+                "--headless",
+                "--convert-to",
+                convert_to,
+                "--outdir",
+                str(output_dir),
+                str(input_path),
+            ],
+            capture_output=True,
+            timeout=timeout,
+            text=True,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise OfficeTimeout(f"Conversion did not finish within {timeout}s") from e
+    if not output_path.exists():
+        raise OfficeError(result.stderr.strip())
+    return output_path
+
+
+def _properties(**values):
+    """Return a tuple of UNO PropertyValues."""
+    properties = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
+
+def _free_port():
+    """Return a local TCP port that is free right now."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _process_alive(pid):
+    # A worker started by this process lingers as a zombie until reaped
+    try:
+        if os.waitpid(pid, os.WNOHANG)[0] == pid:
+            return False
+    except ChildProcessError:
+        pass  # Not a child of this process
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _Worker:
+    """One headless soffice listening on a local UNO socket."""
+
+    def __init__(self, directory, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.directory = Path(directory)
+        self.idle_timeout = idle_timeout
+        self.profile_dir = self.directory / "profile"
+        # Format: {"pid": process id, "port": UNO socket port,
+        # "reaper": process id of the idle reaper, or null}
+        self.info_file = self.directory / "worker.json"
+        # Touched after every request; its mtime is when the worker was last used
+        self.used_file = self.directory / "last-used"
+
+    def _read_info(self):
+        try:
+            return json.loads(self.info_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def alive(self):
+        info = self._read_info()
+        return bool(info) and _process_alive(info["pid"])
+
+    def touch(self):
+        """Record that the worker was just used."""
+        self.used_file.touch()
+
+    def idle_seconds(self):
+        """Return the seconds since the worker was last used (or started)."""
+        try:
+            last_used = self.used_file.stat().st_mtime
+        except OSError:
+            return float("inf")
+        return time.time() - last_used
+
+    def start(self):
+        """Start a fresh soffice for this worker, replacing any previous one."""
+        self.stop()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        port = _free_port()
+        # A session of its own, so the worker outlives the script starting it
+        process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                f"--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext",
+                f"-env:UserInstallation={self.profile_dir.resolve().as_uri()}",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self.touch()
+        reaper = None
+        if self.idle_timeout > 0:
+            reaper = subprocess.Popen(
+                [sys.executable, str(Path(__file__).resolve()), "--expire-worker"]
+                + [str(self.directory), str(process.pid), str(self.idle_timeout)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        self.info_file.write_text(
+            json.dumps(
+                {
+                    "pid": process.pid,
+                    "port": port,
+                    "reaper": reaper.pid if reaper else None,
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    def stop(self):
+        """Kill this worker's soffice and its reaper, if they are running."""
+        info = self._read_info()
+        if info and _process_alive(info["pid"]):
+            try:
+                os.killpg(info["pid"], signal.SIGKILL)
+            except OSError:
+                pass
+        reaper = info and info.get("reaper")
+        if reaper and reaper != os.getpid() and _process_alive(reaper):
+            try:
+                os.kill(reaper, signal.SIGTERM)
+            except OSError:
+                pass
+        self.info_file.unlink(missing_ok=True)
+
+    def connect(self, timeout):
+        """Connect to the worker's soffice and return its Desktop.
+
+        Raises:
+            OfficeError: If the worker isn't running or doesn't answer in time
+        """
+        info = self._read_info()
+        if not info:
+            raise OfficeError("Worker is not running")
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        url = f"uno:socket,host=127.0.0.1,port={info['port']};urp;StarOffice.ComponentContext"
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                context = resolver.resolve(url)
+                return context.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.frame.Desktop", context
+                )
+            except Exception as e:
+                if time.monotonic() >= deadline or not _process_alive(info["pid"]):
+                    raise OfficeError(f"Worker did not answer: {e}") from e
+                time.sleep(0.25)
+
+    def desktop(self):
+        """Return the Desktop of a healthy soffice, (re)starting it if needed."""
+        if self.alive():
+            try:
+                return self.connect(HEALTH_CHECK_TIMEOUT)
+            except OfficeError:
+                pass
+        self.start()
+        return self.connect(START_TIMEOUT)
+
+
+def expire_idle_worker(directory, pid, idle_timeout):
+    """Stop the worker in directory once it has been unused for idle_timeout seconds.
+
+    Runs as the worker's reaper, a detached process started along with
+    soffice pid. Returns as soon as that soffice is gone or replaced; a
+    worker busy with a request (its lock held) is never stopped.
+    """
+    worker = _Worker(directory, idle_timeout)
+    while True:
+        # Sleep first: the reaper starts before the worker's info is written
+        time.sleep(max(min(idle_timeout - worker.idle_seconds(), 60), 0) + 1)
+        info = worker._read_info()
+        if not info or info["pid"] != pid or not _process_alive(pid):
+            return
+        if worker.idle_seconds() < idle_timeout:
+            continue
+        with open(worker.directory / "lock", "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                time.sleep(min(idle_timeout, 60))  # Busy with a request
+                continue
+            # A request may have finished (or restarted the worker) meanwhile
+            info = worker._read_info()
+            if info and info["pid"] == pid and worker.idle_seconds() >= idle_timeout:
+                worker.stop()
+                return
+
+
+class OfficePool:
+    """A fixed set of warm soffice workers shared by every process of the user."""
+
+    def __init__(
+        self, size=DEFAULT_POOL_SIZE, state_dir=None, idle_timeout=DEFAULT_IDLE_TIMEOUT
+    ):
+        self.size = size
+        self.state_dir = Path(state_dir) if state_dir else default_state_dir()
+        self.idle_timeout = idle_timeout
+
+    @contextmanager
+    def worker(self):
+        """Lock and yield an idle worker, waiting in line if all are busy."""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        # Try every worker without waiting, then queue on one of them
+        candidates = [(index, fcntl.LOCK_NB) for index in range(self.size)]
+        candidates.append((os.getpid() % self.size, 0))
+        for index, flags in candidates:
+            directory = self.state_dir / f"worker-{index}"
+            directory.mkdir(exist_ok=True)
+            lock_file = open(directory / "lock", "a")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | flags)
+            except BlockingIOError:
+                lock_file.close()
+                continue
+            try:
+                yield _Worker(directory, self.idle_timeout)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                lock_file.close()
+            return
+
+    def shutdown(self):
+        """Stop every worker in the state directory.
+
+        Covers workers started by any process, whatever their pool size. Each
+        worker's lock is taken first, so running requests finish.
+        """
+        for directory in sorted(self.state_dir.glob("worker-*")):
+            with open(directory / "lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                _Worker(directory).stop()
+
+    def _run(self, request, timeout):
+        """Run request(desktop) on a worker and return its result.
+
+        A worker found dead after a failure is restarted and the request
+        retried once; a failure with the worker still alive is the document's.
+        """
+        with self.worker() as worker:
+            for attempt in range(2):
+                desktop = worker.desktop()
+                timed_out = threading.Event()
+
+                def expire():
+                    timed_out.set()
+                    worker.stop()
+
+                watchdog = threading.Timer(timeout, expire) if timeout else None
+                if watchdog:
+                    watchdog.start()
+                try:
+                    return request(desktop)
+                except Exception as e:
+                    if timed_out.is_set():
+                        raise OfficeTimeout(
+                            f"LibreOffice did not finish within {timeout}s"
+                        ) from e
+                    if attempt or worker.alive():
+                        raise OfficeError(str(e)) from e
+                finally:
+                    if watchdog:
+                        watchdog.cancel()
+                    worker.touch()
+
+    def _load(self, desktop, path):
+        document = desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(str(Path(path).resolve())),
+            "_blank",
+            0,
+            _properties(Hidden=True),
+        )
+        if document is None:
+            raise OfficeError(f"LibreOffice could not load {path}")
+        return document
+
+    def convert(self, input_path, output_dir, convert_to, timeout=None):
+        """Convert a document on a worker; see convert_document.
+
+        Workers need the filter name, e.g. "pdf:impress_pdf_Export" rather
+        than "pdf".
+        """
+        extension, _, filter_name = convert_to.partition(":")
+        if not filter_name:
+            raise ValueError(f"{convert_to} has no filter name")
+        output_path = Path(output_dir) / f"{Path(input_path).stem}.{extension}"
+
+        def request(desktop):
+            document = self._load(desktop, input_path)
+            try:
+                document.storeToURL(
+                    uno.systemPathToFileUrl(str(output_path.resolve())),
+                    _properties(FilterName=filter_name, Overwrite=True),
+                )
+            finally:
+                document.close(True)
+
+        self._run(request, timeout)
+        if not output_path.exists():
+            raise OfficeError("")
+        return output_path
+
+    def recalculate(self, path, timeout=None):
+        """Recalculate every formula of a spreadsheet and save it in place."""
+
+        def request(desktop):
+            document = self._load(desktop, path)
+            try:
+                document.calculateAll()
+                document.store()
+            finally:
+                document.close(True)
+
+        self._run(request, timeout)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Manage the warm LibreOffice workers shared by the scripts"
+    )
+    parser.add_argument(
+        "--stop-workers",
+        action="store_true",
+        help="Stop every worker now, after the requests they are running",
+    )
+    # Internal: the idle reaper each worker is started with
+    parser.add_argument(
+        "--expire-worker",
+        nargs=3,
+        metavar=("DIRECTORY", "PID", "SECONDS"),
+        help=argparse.SUPPRESS,
+    )
+    args = parser.parse_args()
+
+    if args.expire_worker:
+        directory, pid, idle_timeout = args.expire_worker
+        expire_idle_worker(directory, int(pid), int(idle_timeout))
+    elif args.stop_workers:
+        OfficePool().shutdown()
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()